@@ -2,41 +2,140 @@ import os
 import maya.standalone
 import maya.cmds as cmds
 from maya_tools import alembic_exporter
+from maya_tools.alembic_exporter.batch_farm import find_maya_files
+from maya_tools.alembic_exporter.core.xgen_guides import export_scene_guides
+from maya_tools.alembic_exporter.core.scene_context import get_scene_context
+from maya_tools.alembic_exporter.core import abc_verify, profiling
+from maya_tools.alembic_exporter.core.frame_range import sampled_frame_range
+from maya_tools.alembic_exporter.core.settings import get_export_profile
 
 
-def process_maya_files(root_dir):
-    # 初始化 Maya 独立环境
+def initialize_standalone():
+    """初始化 Maya 独立环境，批量导出农场的每个工作进程启动时调用一次"""
     maya.standalone.initialize()
 
+
+def verify_exported_files(exported_files, guide_files=(), export_profile=None):
+    """校验导出的缓存，并把报告写入场景的缓存目录，采样时间按场景的帧率换算为帧
+
+    Args:
+        exported_files: 角色和道具的缓存路径列表，按场景的导出帧范围校验
+        guide_files: XGen Guides缓存路径列表，只检查文件完整性
+        export_profile: 可选，导出时统一使用的导出配置；配置设置了step时按实际采样的帧范围校验
+
+    Raises:
+        RuntimeError: 有缓存校验失败
+    """
+    scene_info = get_scene_context().scene_info()
+    step = get_export_profile(export_profile).settings.get("step") if export_profile else None
+    frame_range = sampled_frame_range(scene_info["start_export_frame"], scene_info["end_export_frame"], step)
+    fps = abc_verify.time_unit_fps(cmds.currentUnit(q=True, time=True))
+    results = (abc_verify.verify_abc_files(exported_files, frame_range, fps)
+               + abc_verify.verify_abc_files(list(guide_files), fps=fps))
+    abc_verify.print_failures(results)
+    report = abc_verify.write_report(results, os.path.join(scene_info["cache_dir"], abc_verify.REPORT_NAME))
+    if report["failed"]:
+        raise RuntimeError(f"{report['failed']} 个缓存校验失败: {', '.join(report['failed_files'])}")
+
+
+def export_scene_file(task, force=False, guides=False, verify=False, dedup_static=False, profile=False,
+                      cprofile=False, export_profile=None):
+    """打开单个Maya文件并导出Alembic缓存
+
+    Args:
+        task: Maya文件路径，或批量导出农场的任务字典
+            {"scene": 路径, "force": 是否强制导出, "guides": 是否导出guides, "verify": 是否校验缓存,
+             "dedup_static": 是否使用静态道具共享缓存, "profile": 是否记录耗时, "cprofile": 是否启用cProfile,
+             "export_profile": 统一使用的导出配置}
+        force: 是否忽略导出清单，强制重新导出
+        guides: 是否同时导出XGen Guides到镜头的guides缓存目录
+        verify: 是否在导出后校验缓存，校验失败时抛出RuntimeError
+        dedup_static: 没有动画的道具是否只导出一次，其他镜头链接集数共享的缓存库
+        profile: 是否记录各阶段耗时，报告写入场景 abc_cache 目录下的 export_timing.json/.csv
+        cprofile: 是否同时用cProfile记录调用栈（隐含profile）
+        export_profile: 可选，所有资产统一使用的导出配置，如Layout预览用的 "layout_proxy"
+
+    Returns:
+        list: 导出的文件路径列表
+    """
+    if isinstance(task, dict):
+        maya_file = task["scene"]
+        force = task.get("force", force)
+        guides = task.get("guides", guides)
+        verify = task.get("verify", verify)
+        dedup_static = task.get("dedup_static", dedup_static)
+        profile = task.get("profile", profile)
+        cprofile = task.get("cprofile", cprofile)
+        export_profile = task.get("export_profile", export_profile)
+    else:
+        maya_file = task
+
+    if profile or cprofile:
+        with profiling.profile_scene(maya_file, profiling.scene_report_path(maya_file), use_cprofile=cprofile):
+            return _export_scene(maya_file, force, guides, verify, dedup_static, export_profile)
+    return _export_scene(maya_file, force, guides, verify, dedup_static, export_profile)
+
+
+def _export_scene(maya_file, force, guides, verify, dedup_static, export_profile=None):
+    """打开Maya文件并执行导出，参数见export_scene_file"""
+    # 打开 Maya 文件
+    with profiling.phase("open_scene"):
+        cmds.file(maya_file, open=True, force=True)
+    # 导出 Alembic
+    exported_files = alembic_exporter.export_alembic(force=force, dedup_static=dedup_static, profile=export_profile)
+    guide_files = export_scene_guides() if guides else []
+    if verify:
+        with profiling.phase("verify"):
+            verify_exported_files(exported_files, guide_files, export_profile)
+    return exported_files + guide_files
+
+
+def aggregate_scene_timings(maya_files, root_dir):
+    """合并多个场景的耗时报告，写入序列目录下的 export_timing_summary.json/.csv
+
+    Args:
+        maya_files: Maya文件路径列表，没有耗时报告的场景会被跳过
+        root_dir: 序列根目录
+
+    Returns:
+        dict: 合并后的报告
+    """
+    report_paths = [profiling.scene_report_path(maya_file) for maya_file in maya_files]
+    reports = profiling.load_timing_reports([path for path in report_paths if os.path.exists(path)])
+    return profiling.aggregate_timing_reports(reports, os.path.join(root_dir, profiling.SUMMARY_REPORT_NAME))
+
+
+def process_maya_files(root_dir, force=False, guides=False, verify=False, profile=False):
+    # 初始化 Maya 独立环境
+    initialize_standalone()
+
     # 遍历目录下的所有 Maya 文件
     total_files = 0
     success_count = 0
     fail_count = 0
-    
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        for filename in filenames:
-            if filename.endswith(('.ma', '.mb')):
-                total_files += 1
-                maya_file = os.path.join(dirpath, filename)
-                print(f"正在处理: {maya_file}")
-                try:
-                    # 打开 Maya 文件
-                    cmds.file(maya_file, open=True, force=True)
-                    # 导出 Alembic
-                    exported_files = alembic_exporter.export_alembic()
-                    print(f"处理完成: {maya_file}")
-                    print(f"导出文件: {exported_files}")
-                    success_count += 1
-                except Exception as e:
-                    print(f"处理失败: {maya_file}")
-                    print(f"错误信息: {str(e)}")
-                    fail_count += 1
-    
+    processed_files = []
+
+    for maya_file in find_maya_files(root_dir):
+        total_files += 1
+        print(f"正在处理: {maya_file}")
+        try:
+            exported_files = export_scene_file(maya_file, force, guides, verify, profile=profile)
+            processed_files.append(maya_file)
+            print(f"处理完成: {maya_file}")
+            print(f"导出文件: {exported_files}")
+            success_count += 1
+        except Exception as e:
+            print(f"处理失败: {maya_file}")
+            print(f"错误信息: {str(e)}")
+            fail_count += 1
+
     # 打印处理总结
     print(f"\n处理统计:")
     print(f"总文件数: {total_files}")
     print(f"成功文件数: {success_count}")
     print(f"失败文件数: {fail_count}")
+    if profile:
+        aggregate_scene_timings(processed_files, root_dir)
 
     # 关闭 Maya 独立环境
     maya.standalone.uninitialize()
@@ -0,0 +1,445 @@
+"""
+Alembic批量导出农场
+
+把序列目录下发现的Maya文件分发到N个独立的工作解释器并行导出，每个工作进程持有自己的
+maya.standalone 会话。调度器提供有界任务队列、单文件超时与重试、崩溃隔离的工作进程重启，
+并输出合并后的JSON统计。
+
+工作进程的导出入口是可插拔的（"模块:函数"），因此调度逻辑可以用桩函数在没有Maya的环境下测试。
+此模块只依赖标准库，调度进程本身不需要Maya。
+
+用法（在mayapy或普通Python中运行）::
+
+    python batch_farm.py X:/projects/CSprojectFiles/Shot/Animation/PV/Sq04 --workers 4 --mayapy "C:/Program Files/Autodesk/Maya2022/bin/mayapy.exe"
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+import subprocess
+
+# 默认的导出入口和工作进程初始化函数
+DEFAULT_WORKER_ENTRY = "maya_tools.alembic_exporter.batch_export:export_scene_file"
+DEFAULT_WORKER_INIT = "maya_tools.alembic_exporter.batch_export:initialize_standalone"
+
+# 结果行前缀，调度器只解析带此前缀的行；farm_worker 从这里导入
+RESULT_PREFIX = "@@FARM_RESULT@@ "
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "farm_worker.py")
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 工作进程启动（包括maya.standalone初始化）的最长等待时间
+WORKER_START_TIMEOUT = 600
+
+
+def find_maya_files(root_dir):
+    """遍历目录查找所有Maya文件
+
+    Args:
+        root_dir: 要遍历的根目录
+
+    Returns:
+        list: 排序后的 .ma/.mb 文件路径列表
+    """
+    maya_files = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        for filename in filenames:
+            if filename.lower().endswith(('.ma', '.mb')):
+                maya_files.append(os.path.join(dirpath, filename))
+    return sorted(maya_files)
+
+
+class WorkerCrashed(RuntimeError):
+    """工作进程意外退出或超时"""
+
+
+class _WorkerProcess:
+    """一个工作解释器进程及其输出读取线程"""
+
+    def __init__(self, name, command, env):
+        self.name = name
+        self.command = command
+        self.env = env
+        self.process = None
+        self.messages = None
+
+    def start(self, timeout):
+        """启动进程并等待其完成初始化
+
+        Args:
+            timeout: 等待初始化的最长秒数
+
+        Raises:
+            WorkerCrashed: 进程无法启动（如解释器不存在或没有权限）或初始化失败
+        """
+        self.messages = queue.Queue()
+        try:
+            self.process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=self.env,
+                universal_newlines=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1
+            )
+        except OSError as e:
+            self.process = None
+            raise WorkerCrashed(f"{self.name} 无法启动: {str(e)}")
+        reader = threading.Thread(target=self._read_output, args=(self.process, self.messages), daemon=True)
+        reader.start()
+
+        message = self._wait_message(timeout)
+        if message.get("status") != "ready":
+            self.kill()
+            raise WorkerCrashed(f"工作进程初始化失败: {message.get('error', message)}")
+
+    def _read_output(self, process, messages):
+        """读取进程输出，结果行放入消息队列，其他行作为日志打印"""
+        for line in process.stdout:
+            if line.startswith(RESULT_PREFIX):
+                try:
+                    messages.put(json.loads(line[len(RESULT_PREFIX):]))
+                except ValueError:
+                    print(f"[{self.name}] 无法解析结果: {line.rstrip()}")
+                continue
+            print(f"[{self.name}] {line.rstrip()}")
+        # 输出结束表示进程已退出
+        messages.put(None)
+
+    def _wait_message(self, timeout):
+        """等待下一条结果消息
+
+        Args:
+            timeout: 最长等待秒数，None表示不限时
+
+        Returns:
+            dict: 结果消息
+        """
+        try:
+            message = self.messages.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            raise WorkerCrashed(f"{self.name} 超时 ({timeout} 秒)")
+        if message is None:
+            code = self.process.wait()
+            self.process = None
+            raise WorkerCrashed(f"{self.name} 意外退出，返回码: {code}")
+        return message
+
+    @property
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def run_task(self, task, timeout):
+        """在工作进程中执行一个任务
+
+        Args:
+            task: 可JSON序列化的任务数据
+            timeout: 单个任务的超时秒数
+
+        Returns:
+            dict: 工作进程返回的结果消息
+        """
+        try:
+            self.process.stdin.write(json.dumps({"task": task}, ensure_ascii=False) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            self.kill()
+            raise WorkerCrashed(f"{self.name} 无法接收任务: {str(e)}")
+        return self._wait_message(timeout)
+
+    def kill(self):
+        """强制结束进程"""
+        if self.process is None:
+            return
+        try:
+            self.process.kill()
+            self.process.wait()
+        except OSError:
+            pass
+        self.process = None
+
+    def stop(self):
+        """正常关闭进程"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+        self.process = None
+
+
+class ExportFarm:
+    """并行批量导出调度器"""
+
+    def __init__(self, worker_count=4, timeout=3600, retries=1, queue_size=None,
+                 worker_entry=DEFAULT_WORKER_ENTRY, worker_init=DEFAULT_WORKER_INIT,
+                 python_exe=None, extra_paths=None):
+        """初始化调度器
+
+        Args:
+            worker_count: 工作进程数量
+            timeout: 单个任务的超时秒数，超时后杀掉工作进程并重启
+            retries: 失败（包括超时和崩溃）后的重试次数
+            queue_size: 任务队列的容量，默认为工作进程数量的两倍
+            worker_entry: 导出入口，格式为 "模块:函数"，函数接收一个任务并返回导出的文件列表
+            worker_init: 工作进程启动时调用一次的初始化函数，格式为 "模块:函数"，为空则跳过
+            python_exe: 工作进程的解释器路径（通常是mayapy），默认为当前解释器
+            extra_paths: 追加到工作进程PYTHONPATH中的目录列表
+        """
+        self.worker_count = max(1, int(worker_count))
+        self.timeout = timeout
+        self.retries = max(0, int(retries))
+        self.queue_size = queue_size or self.worker_count * 2
+        self.worker_entry = worker_entry
+        self.worker_init = worker_init
+        self.python_exe = python_exe or sys.executable
+        self.extra_paths = list(extra_paths or [])
+
+        self._results = []
+        self._results_lock = threading.Lock()
+
+    def _build_command(self):
+        """构建工作进程的启动命令"""
+        command = [self.python_exe, WORKER_SCRIPT, "--entry", self.worker_entry]
+        if self.worker_init:
+            command.extend(["--init", self.worker_init])
+        return command
+
+    def _build_env(self):
+        """构建工作进程的环境变量"""
+        env = dict(os.environ)
+        paths = self.extra_paths + [_REPO_ROOT]
+        if env.get("PYTHONPATH"):
+            paths.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(paths)
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["PYTHONUNBUFFERED"] = "1"
+        return env
+
+    def _run_with_retry(self, worker, task):
+        """执行任务，失败时按配置重试，工作进程崩溃或超时后自动重启
+
+        Args:
+            worker: _WorkerProcess实例
+            task: 任务数据
+
+        Returns:
+            dict: 单个任务的统计记录
+        """
+        record = {"task": task, "status": "failed", "attempts": 0, "exported": [], "error": None}
+        start = time.time()
+
+        for attempt in range(1, self.retries + 2):
+            record["attempts"] = attempt
+            try:
+                if not worker.is_alive:
+                    print(f"[{worker.name}] 启动工作进程...")
+                    worker.start(WORKER_START_TIMEOUT)
+                message = worker.run_task(task, self.timeout)
+            except WorkerCrashed as e:
+                record["error"] = str(e)
+                print(f"[{worker.name}] 处理失败 (第{attempt}次): {task} - {str(e)}")
+                continue
+
+            if message.get("status") == "ok":
+                record["status"] = "success"
+                record["exported"] = message.get("result") or []
+                record["error"] = None
+                break
+
+            record["error"] = message.get("error")
+            print(f"[{worker.name}] 处理失败 (第{attempt}次): {task} - {record['error']}")
+
+        record["seconds"] = round(time.time() - start, 3)
+        return record
+
+    def _worker_loop(self, name, tasks):
+        """工作线程：从队列取任务并交给对应的工作进程"""
+        worker = _WorkerProcess(name, self._build_command(), self._build_env())
+        try:
+            while True:
+                task = tasks.get()
+                if task is None:
+                    break
+                print(f"[{name}] 正在处理: {task}")
+                try:
+                    record = self._run_with_retry(worker, task)
+                except Exception as e:
+                    # 意外错误只记为当前任务失败，工作线程继续从队列取任务，避免生产者阻塞
+                    print(f"[{name}] 处理出错: {task} - {str(e)}")
+                    worker.kill()
+                    record = {"task": task, "status": "failed", "attempts": 1, "exported": [],
+                              "error": f"调度出错: {str(e)}", "seconds": 0.0}
+                with self._results_lock:
+                    self._results.append(record)
+        finally:
+            worker.stop()
+
+    def run(self, task_list, summary_path=None):
+        """并行执行所有任务
+
+        Args:
+            task_list: 任务列表，每项为可JSON序列化的数据（如Maya文件路径）
+            summary_path: 可选，JSON统计的输出路径
+
+        Returns:
+            dict: 合并后的统计信息
+        """
+        self._results = []
+        start = time.time()
+        tasks = queue.Queue(maxsize=self.queue_size)
+
+        threads = []
+        for index in range(min(self.worker_count, max(1, len(task_list)))):
+            thread = threading.Thread(target=self._worker_loop, args=(f"worker-{index + 1}", tasks), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        # 有界队列：队列满时阻塞生产者，避免一次性把所有任务压入内存
+        for task in task_list:
+            tasks.put(task)
+        for _ in threads:
+            tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+        summary = self._build_summary(task_list, time.time() - start)
+        if summary_path:
+            write_summary(summary, summary_path)
+        return summary
+
+    def _build_summary(self, task_list, elapsed):
+        """合并所有任务记录为统计信息"""
+        order = {json.dumps(task, sort_keys=True): index for index, task in enumerate(task_list)}
+        records = sorted(self._results, key=lambda r: order.get(json.dumps(r["task"], sort_keys=True), 0))
+        success_count = sum(1 for r in records if r["status"] == "success")
+        return {
+            "total": len(task_list),
+            "success": success_count,
+            "fail": len(records) - success_count,
+            "workers": self.worker_count,
+            "seconds": round(elapsed, 3),
+            "files": records
+        }
+
+
+def write_summary(summary, summary_path):
+    """把统计信息写入JSON文件
+
+    Args:
+        summary: 统计信息字典
+        summary_path: 输出文件路径
+    """
+    summary_dir = os.path.dirname(summary_path)
+    if summary_dir and not os.path.exists(summary_dir):
+        os.makedirs(summary_dir)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    print(f"统计信息已保存到: {summary_path}")
+
+
+def process_maya_files_parallel(root_dir, worker_count=4, timeout=3600, retries=1, summary_path=None, force=False,
+                                guides=False, verify=False, dedup_static=False, profile=False, cprofile=False,
+                                export_profile=None, **farm_kwargs):
+    """并行处理目录下的所有Maya文件
+
+    Args:
+        root_dir: 序列根目录
+        worker_count: 工作进程数量
+        timeout: 单个文件的超时秒数
+        retries: 失败后的重试次数
+        summary_path: JSON统计的输出路径，默认保存在根目录下
+        force: 是否忽略导出清单，强制重新导出
+        guides: 是否同时导出XGen Guides
+        verify: 是否在导出后校验缓存，校验失败的文件计为失败
+        dedup_static: 没有动画的道具是否只导出一次，其他镜头链接集数共享的缓存库
+        profile: 是否记录每个场景的各阶段耗时，并在根目录下合并为 export_timing_summary.json/.csv
+        cprofile: 是否同时用cProfile记录调用栈（隐含profile）
+        export_profile: 可选，所有资产统一使用的导出配置，如Layout预览用的 "layout_proxy"
+        **farm_kwargs: 传给ExportFarm的其他参数
+
+    Returns:
+        dict: 合并后的统计信息
+    """
+    maya_files = [{"scene": maya_file, "force": force, "guides": guides, "verify": verify,
+                   "dedup_static": dedup_static, "profile": profile, "cprofile": cprofile,
+                   "export_profile": export_profile}
+                  for maya_file in find_maya_files(root_dir)]
+    if summary_path is None:
+        summary_path = os.path.join(root_dir, "batch_export_summary.json")
+
+    farm = ExportFarm(worker_count=worker_count, timeout=timeout, retries=retries, **farm_kwargs)
+    summary = farm.run(maya_files, summary_path=summary_path)
+
+    # 打印处理总结
+    print(f"\n处理统计:")
+    print(f"总文件数: {summary['total']}")
+    print(f"成功文件数: {summary['success']}")
+    print(f"失败文件数: {summary['fail']}")
+    if profile or cprofile:
+        _aggregate_timings(summary, root_dir)
+    return summary
+
+
+def _aggregate_timings(summary, root_dir):
+    """合并成功场景的耗时报告，需要能导入导出工具包（用mayapy运行调度器时）"""
+    try:
+        from maya_tools.alembic_exporter.batch_export import aggregate_scene_timings
+    except ImportError as e:
+        print(f"无法合并耗时报告，各场景的报告保存在各自的 abc_cache 目录: {str(e)}")
+        return None
+    scenes = [record["task"]["scene"] for record in summary["files"] if record["status"] == "success"]
+    return aggregate_scene_timings(scenes, root_dir)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="并行批量导出Alembic缓存")
+    parser.add_argument("root_dir", help="要处理的序列根目录")
+    parser.add_argument("--workers", type=int, default=4, help="工作进程数量")
+    parser.add_argument("--timeout", type=float, default=3600, help="单个文件的超时秒数")
+    parser.add_argument("--retries", type=int, default=1, help="失败后的重试次数")
+    parser.add_argument("--mayapy", default=None, help="工作进程使用的mayapy路径，默认为当前解释器")
+    parser.add_argument("--entry", default=DEFAULT_WORKER_ENTRY, help="导出入口，格式为 模块:函数")
+    parser.add_argument("--summary", default=None, help="JSON统计的输出路径")
+    parser.add_argument("--force", action="store_true", help="忽略导出清单，强制重新导出所有资产")
+    parser.add_argument("--guides", action="store_true", help="同时导出XGen Guides")
+    parser.add_argument("--verify", action="store_true", help="导出后校验缓存并在缓存目录写入校验报告")
+    parser.add_argument("--dedup-static", action="store_true", help="没有动画的道具只导出一次，其他镜头链接共享缓存")
+    parser.add_argument("--profile", action="store_true", help="记录每个场景的各阶段耗时并合并为序列报告")
+    parser.add_argument("--cprofile", action="store_true", help="同时用cProfile记录调用栈")
+    parser.add_argument("--export-profile", default=None,
+                        help="所有资产统一使用的导出配置，如 layout_proxy，输出文件名加上配置名称后缀")
+    args = parser.parse_args(argv)
+
+    summary = process_maya_files_parallel(
+        args.root_dir,
+        worker_count=args.workers,
+        timeout=args.timeout,
+        retries=args.retries,
+        summary_path=args.summary,
+        force=args.force,
+        guides=args.guides,
+        verify=args.verify,
+        dedup_static=args.dedup_static,
+        profile=args.profile,
+        cprofile=args.cprofile,
+        export_profile=args.export_profile,
+        worker_entry=args.entry,
+        python_exe=args.mayapy
+    )
+    return 0 if summary["fail"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+分段并行导出
+
+把导出帧范围切分为若干段，每段由批量导出农场的一个独立mayapy工作进程导出到临时目录，
+最后用Alembic自带的 abcstitcher 命令行工具按时间顺序拼接为一个完整的 .abc 文件。
+镜头较短（只能切出一段）、找不到 abcstitcher 或场景有未保存的修改时，退回单次多job导出。
+
+注意：每段从自己的起始帧开始求值，依赖前序帧结果的动力学/解算不适合分段导出。
+
+用法（在Maya中）::
+
+    from maya_tools.alembic_exporter import export_alembic
+    export_alembic(chunk_size=500, chunk_workers=4)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import time
+import maya.cmds as cmds
+from maya_tools.alembic_exporter.batch_farm import ExportFarm, DEFAULT_WORKER_INIT
+from maya_tools.alembic_exporter.core.export_plan import ExportPlan, split_frame_range, build_chunk_plans
+from maya_tools.alembic_exporter.core.export_executor import ExportExecutor
+from maya_tools.alembic_exporter.core.export_manifest import SceneFingerprint
+from maya_tools.alembic_exporter.core import profiling
+
+# 工作进程中导出单个分段的入口
+CHUNK_WORKER_ENTRY = "maya_tools.alembic_exporter.chunked_export:export_chunk"
+
+
+def find_stitcher():
+    """查找 abcstitcher 可执行文件，可以用环境变量 ABC_STITCHER 指定
+
+    Returns:
+        str: 可执行文件路径，找不到时返回None
+    """
+    stitcher = os.environ.get("ABC_STITCHER")
+    if stitcher and os.path.exists(stitcher):
+        return stitcher
+    return shutil.which("abcstitcher") or shutil.which("AbcStitcher")
+
+
+def find_mayapy():
+    """查找工作进程使用的mayapy，可以用环境变量 MAYAPY 指定
+
+    在Maya界面中 sys.executable 是 maya.exe，mayapy 位于同一个bin目录下。
+
+    Returns:
+        str: mayapy路径
+    """
+    mayapy = os.environ.get("MAYAPY")
+    if mayapy:
+        return mayapy
+    executable = sys.executable
+    if os.path.splitext(os.path.basename(executable))[0].lower() == "mayapy":
+        return executable
+    extension = ".exe" if sys.platform == "win32" else ""
+    candidate = os.path.join(os.path.dirname(executable), "mayapy" + extension)
+    return candidate if os.path.exists(candidate) else executable
+
+
+def stitch_archives(stitcher, chunk_paths, output_path):
+    """按时间顺序拼接分段缓存，先写临时文件再替换目标文件
+
+    Args:
+        stitcher: abcstitcher路径
+        chunk_paths: 按帧顺序排列的分段 .abc 文件列表
+        output_path: 输出文件路径
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = output_path + ".stitch.abc"
+    result = subprocess.run(
+        [stitcher, temp_path] + list(chunk_paths),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True
+    )
+    if result.returncode != 0 or not os.path.exists(temp_path):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise RuntimeError(f"拼接 {output_path} 失败: {result.stdout.strip()}")
+    os.replace(temp_path, output_path)
+
+
+def export_chunk(task):
+    """工作进程入口：打开场景并导出一个分段
+
+    Args:
+        task: {"scene": 场景路径, "chunk": 分段序号, "plan": ExportPlan字典}
+
+    Returns:
+        list: 导出的分段文件路径列表
+    """
+    scene = task["scene"]
+    # 同一个工作进程连续处理同一场景的多个分段时不重复打开
+    current_file = cmds.file(q=True, sn=True) or ""
+    if os.path.normcase(os.path.normpath(current_file)) != os.path.normcase(os.path.normpath(scene)):
+        cmds.file(scene, open=True, force=True)
+
+    plan = ExportPlan.from_dict(task["plan"])
+    return ExportExecutor(force=True, use_manifest=False).run(plan, single_pass=True)
+
+
+def _print_timings(summary, stitch_seconds):
+    """打印每个分段和拼接的耗时"""
+    print("\n======== 分段导出耗时 ========")
+    for record in summary["files"]:
+        task = record["task"]
+        start_frame, end_frame = task["frame_range"]
+        status = "成功" if record["status"] == "success" else f"失败: {record['error']}"
+        print(f"分段 {task['chunk']:03d} [{start_frame} - {end_frame}]: {record.get('seconds', 0):.1f} 秒 "
+              f"(尝试 {record['attempts']} 次) {status}")
+    print(f"并行导出总耗时: {summary['seconds']:.1f} 秒")
+    print(f"拼接耗时: {stitch_seconds:.1f} 秒")
+
+
+def export_plan_chunked(plan, chunk_size, worker_count=4, force=False, timeout=3600, retries=1,
+                        python_exe=None, chunk_dir=None, callback=None, cancel_flag=None):
+    """分段并行执行导出计划
+
+    Args:
+        plan: ExportPlan
+        chunk_size: 每段的帧数
+        worker_count: 工作进程数量
+        force: 是否忽略导出清单，强制重新导出
+        timeout: 单个分段的超时秒数
+        retries: 分段失败后的重试次数
+        python_exe: 工作进程的mayapy路径，默认自动查找
+        chunk_dir: 分段临时目录的父目录，默认为系统临时目录
+        callback: 可选，接收ExportEvent的回调函数；分段导出只发送跳过事件，退回单次导出时发送完整进度
+        cancel_flag: 可选，CancelFlag实例，只在退回单次导出时生效
+
+    Returns:
+        list: 导出的文件路径列表（包含因未变化而跳过的文件）
+    """
+    executor = ExportExecutor(force, callback=callback, cancel_flag=cancel_flag)
+    if not plan:
+        return []
+
+    start_frame, end_frame = plan.jobs[0].frame_range
+    chunks = split_frame_range(start_frame, end_frame, chunk_size)
+    stitcher = find_stitcher()
+
+    fallback_reason = None
+    if len(chunks) < 2:
+        fallback_reason = f"帧范围 {start_frame} - {end_frame} 不超过分段大小 {chunk_size}"
+    elif not stitcher:
+        fallback_reason = "未找到 abcstitcher，可通过环境变量 ABC_STITCHER 指定"
+    elif cmds.file(q=True, modified=True):
+        fallback_reason = "场景有未保存的修改，工作进程只能读取已保存的文件"
+    elif any(tuple(job.frame_range) != (start_frame, end_frame) for job in plan):
+        fallback_reason = "计划中的任务帧范围不一致"
+    if fallback_reason:
+        print(f"{fallback_reason}，使用单次导出")
+        return executor.run(plan, single_pass=True)
+
+    scene = SceneFingerprint(plan.scene_file)
+    jobs, skipped_files = executor.split_up_to_date(plan, scene)
+    if not jobs:
+        print(f"所有 {len(skipped_files)} 个资产的输入均未变化，无需导出")
+        return skipped_files
+    pending_plan = ExportPlan(jobs, plan.scene_file, plan.settings)
+
+    work_dir = tempfile.mkdtemp(prefix="abc_chunks_", dir=chunk_dir)
+    chunk_plans = build_chunk_plans(pending_plan, chunks, work_dir)
+    tasks = [
+        {"scene": plan.scene_file, "chunk": index, "frame_range": list(frame_range), "plan": chunk_plan.as_dict()}
+        for index, (frame_range, chunk_plan) in enumerate(zip(chunks, chunk_plans), 1)
+    ]
+    print(f"分段导出 {len(jobs)} 个资产: {len(chunks)} 段，每段 {chunk_size} 帧，{worker_count} 个工作进程")
+
+    farm = ExportFarm(
+        worker_count=worker_count,
+        timeout=timeout,
+        retries=retries,
+        worker_entry=CHUNK_WORKER_ENTRY,
+        worker_init=DEFAULT_WORKER_INIT,
+        python_exe=python_exe or find_mayapy()
+    )
+    with profiling.phase("chunk_export"):
+        summary = farm.run(tasks)
+
+    if summary["fail"]:
+        _print_timings(summary, 0)
+        raise RuntimeError(f"{summary['fail']} 个分段导出失败，分段文件保留在: {work_dir}")
+
+    stitch_start = time.time()
+    stitched_jobs = []
+    for job_index, job in enumerate(jobs):
+        chunk_paths = [chunk_plan.jobs[job_index].output_path for chunk_plan in chunk_plans]
+        try:
+            with profiling.phase("stitch"):
+                stitch_archives(stitcher, chunk_paths, job.output_path)
+            stitched_jobs.append(job)
+        except RuntimeError as e:
+            print(str(e))
+    stitch_seconds = time.time() - stitch_start
+
+    _print_timings(summary, stitch_seconds)
+    exported_files = executor.record_outputs(pending_plan, stitched_jobs, scene)
+    if len(stitched_jobs) == len(jobs):
+        shutil.rmtree(work_dir, ignore_errors=True)
+    else:
+        print(f"部分资产拼接失败，分段文件保留在: {work_dir}")
+
+    print(f"分段导出完成: {len(exported_files)}/{len(jobs)} 个文件，跳过 {len(skipped_files)} 个未变化的文件")
+    return skipped_files + exported_files
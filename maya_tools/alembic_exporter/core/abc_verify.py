@@ -0,0 +1,437 @@
+"""
+Alembic缓存校验
+
+导出后逐个打开 .abc 文件，统计采样数、帧范围、物体数量、包围盒和文件大小，发现空文件、未写完（导出进程崩溃）
+或帧数不足的缓存。优先使用Alembic的Python绑定（PyAlembic），没有安装时读取Ogawa文件结构作为后备，
+后备方式不统计包围盒。整个过程不需要Maya，可以在导出工作进程中调用，也可以在命令行中检查整个镜头：
+
+    python abc_verify.py X:/projects/.../abc_cache --frame-range 50 104 --report X:/temp/verify.json
+
+缓存中的采样时间以秒为单位，按场景的帧率换算为帧；在Maya中校验时帧率取自 currentUnit，
+命令行默认使用项目的 pal（25fps），可用 --fps 指定。
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from alembic import Abc, AbcGeom
+except ImportError:
+    # 没有PyAlembic时使用Ogawa结构读取
+    Abc = None
+    AbcGeom = None
+
+OGAWA_MAGIC = b"Ogawa"
+HDF5_MAGIC = b"\x89HDF\r\n\x1a\n"
+# Ogawa文件头：魔数(5) + 写完标记(1) + 版本(2) + 根组位置(8)
+OGAWA_HEADER = struct.Struct("<5sBHQ")
+# 子节点位置的最高位表示数据块，否则为组
+OGAWA_DATA_BIT = 1 << 63
+# 非循环时间采样的 timePerCycle
+ACYCLIC_TIME_PER_CYCLE = sys.float_info.max / 32.0
+# 帧范围比较的容差
+FRAME_TOLERANCE = 1e-3
+MAX_OBJECT_DEPTH = 256
+
+REPORT_NAME = "abc_verify_report.json"
+
+# Maya时间单位对应的帧率，项目配置的 frame_rate 为 pal
+TIME_UNIT_FPS = {"game": 15.0, "film": 24.0, "pal": 25.0, "ntsc": 30.0, "show": 48.0, "palf": 50.0, "ntscf": 60.0}
+DEFAULT_FPS = TIME_UNIT_FPS["pal"]
+
+
+def time_unit_fps(unit):
+    """把Maya时间单位换算为帧率
+
+    Args:
+        unit: Maya时间单位，如 "pal"、"film"、"23.976fps"，或帧率数值
+
+    Returns:
+        float: 每秒帧数
+
+    Raises:
+        ValueError: 无法识别的时间单位
+    """
+    if isinstance(unit, (int, float)):
+        return float(unit)
+    name = unit.strip().lower()
+    if name in TIME_UNIT_FPS:
+        return TIME_UNIT_FPS[name]
+    try:
+        return float(name[:-3] if name.endswith("fps") else name)
+    except ValueError:
+        raise ValueError(f"无法识别的时间单位: {unit}")
+
+
+class OgawaReader:
+    """读取Ogawa文件的组和数据块，只做校验需要的最少解析"""
+
+    def __init__(self, file_obj, size):
+        self.file = file_obj
+        self.size = size
+
+    def _read(self, position, length):
+        if position + length > self.size:
+            raise ValueError(f"位置 {position} 超出文件大小 {self.size}")
+        self.file.seek(position)
+        data = self.file.read(length)
+        if len(data) != length:
+            raise ValueError(f"位置 {position} 读取不完整")
+        return data
+
+    def read_group(self, position):
+        """读取组的子节点位置列表"""
+        if position == 0:
+            return []
+        count = struct.unpack("<Q", self._read(position, 8))[0]
+        if count * 8 > self.size:
+            raise ValueError(f"组 {position} 的子节点数量无效: {count}")
+        return list(struct.unpack(f"<{count}Q", self._read(position + 8, count * 8)))
+
+    def read_data(self, child):
+        """读取数据块的内容"""
+        position = child & ~OGAWA_DATA_BIT
+        if position == 0:
+            return b""
+        length = struct.unpack("<Q", self._read(position, 8))[0]
+        return self._read(position + 8, length)
+
+    @staticmethod
+    def is_data(child):
+        return bool(child & OGAWA_DATA_BIT)
+
+
+def parse_time_samplings(data):
+    """解析Alembic归档的时间采样数据块
+
+    Args:
+        data: 数据块内容，依次为每个时间采样的最大采样数、timePerCycle和采样时间
+
+    Returns:
+        list: [(最大采样数, timePerCycle, [采样时间]), ...]，下标即时间采样序号
+    """
+    samplings = []
+    position = 0
+    while position + 16 <= len(data):
+        max_samples, time_per_cycle, count = struct.unpack_from("<IdI", data, position)
+        position += 16
+        times = list(struct.unpack_from(f"<{count}d", data, position))
+        position += count * 8
+        samplings.append((max_samples, time_per_cycle, times))
+    return samplings
+
+
+def _sample_time(time_per_cycle, times, index):
+    """计算时间采样中第index个采样的时间"""
+    if time_per_cycle >= ACYCLIC_TIME_PER_CYCLE or not times:
+        return times[min(index, len(times) - 1)] if times else 0.0
+    cycle, offset = divmod(index, len(times))
+    return times[offset] + cycle * time_per_cycle
+
+
+def _merge_time_range(samplings):
+    """合并所有动画时间采样的采样数和时间范围
+
+    第0个时间采样是默认的静态采样，存在其他时间采样时忽略。
+
+    Returns:
+        tuple: (最大采样数, (起始时间, 结束时间) 或 None)
+    """
+    animated = [sampling for sampling in samplings[1:] if sampling[0] > 0] or samplings[:1]
+    samples = 0
+    start_time = end_time = None
+    for max_samples, time_per_cycle, times in animated:
+        if max_samples <= 0:
+            continue
+        samples = max(samples, max_samples)
+        first = _sample_time(time_per_cycle, times, 0)
+        last = _sample_time(time_per_cycle, times, max_samples - 1)
+        start_time = first if start_time is None else min(start_time, first)
+        end_time = last if end_time is None else max(end_time, last)
+    return samples, (start_time, end_time) if start_time is not None else None
+
+
+def _count_ogawa_objects(reader, position, depth=0):
+    """递归统计物体组数量
+
+    物体组的第一个子节点是属性组，最后一个子节点是子物体的头信息数据块，中间为子物体组。
+    """
+    if depth > MAX_OBJECT_DEPTH:
+        raise ValueError("物体层级过深")
+    children = reader.read_group(position)
+    if len(children) < 2 or not reader.is_data(children[-1]):
+        return 0
+    count = 0
+    for child in children[1:-1]:
+        if child and not reader.is_data(child):
+            count += 1 + _count_ogawa_objects(reader, child, depth + 1)
+    return count
+
+
+def read_ogawa_stats(file_path):
+    """读取Ogawa格式缓存的文件头、时间采样和物体数量
+
+    Args:
+        file_path: .abc 文件路径
+
+    Returns:
+        dict: frozen、version、samples、time_range、objects
+
+    Raises:
+        ValueError: 不是Ogawa文件或结构损坏
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.read(OGAWA_HEADER.size)
+        if header.startswith(HDF5_MAGIC):
+            raise ValueError("HDF5格式的缓存需要PyAlembic才能校验")
+        if len(header) < OGAWA_HEADER.size or not header.startswith(OGAWA_MAGIC):
+            raise ValueError("不是Ogawa格式的Alembic文件")
+        _, frozen, version, root = OGAWA_HEADER.unpack(header)
+        stats = {"frozen": frozen == 0xFF, "version": version}
+        if not stats["frozen"]:
+            # 未写完的文件根组位置无效，不再继续解析
+            return stats
+
+        reader = OgawaReader(f, size)
+        # 根组子节点：版本、库版本、顶层物体、归档元数据、时间采样、索引元数据
+        children = reader.read_group(root)
+        if len(children) < 5:
+            raise ValueError(f"根组子节点数量不足: {len(children)}")
+        samples, time_range = _merge_time_range(parse_time_samplings(reader.read_data(children[4])))
+        stats["samples"] = samples
+        stats["time_range"] = time_range
+        stats["objects"] = {"total": _count_ogawa_objects(reader, children[2])}
+    return stats
+
+
+def _union_bounds(bounds, box):
+    minimum = [box.min()[axis] for axis in range(3)]
+    maximum = [box.max()[axis] for axis in range(3)]
+    if minimum[0] > maximum[0]:
+        # 空包围盒
+        return bounds
+    if bounds is None:
+        return [minimum, maximum]
+    return [[min(a, b) for a, b in zip(bounds[0], minimum)], [max(a, b) for a, b in zip(bounds[1], maximum)]]
+
+
+def read_alembic_stats(file_path):
+    """用PyAlembic读取缓存的时间采样、各类物体数量和包围盒
+
+    包围盒只取每个几何体第一帧和最后一帧的自身包围盒合并。
+
+    Args:
+        file_path: .abc 文件路径
+
+    Returns:
+        dict: frozen、samples、time_range、objects、bounds
+    """
+    archive = Abc.IArchive(file_path)
+    samplings = []
+    for index in range(archive.getNumTimeSamplings()):
+        time_sampling = archive.getTimeSampling(index)
+        max_samples = archive.getMaxNumSamplesForTimeSamplingIndex(index)
+        # 只取首尾采样时间，按非循环采样合并
+        times = [time_sampling.getSampleTime(0), time_sampling.getSampleTime(max(max_samples - 1, 0))]
+        samplings.append((max_samples, ACYCLIC_TIME_PER_CYCLE, times))
+    samples, time_range = _merge_time_range(samplings)
+
+    geometry_types = [
+        ("mesh", getattr(AbcGeom, "IPolyMesh", None)),
+        ("mesh", getattr(AbcGeom, "ISubD", None)),
+        ("curves", getattr(AbcGeom, "ICurves", None)),
+        ("points", getattr(AbcGeom, "IPoints", None)),
+        ("nurbs", getattr(AbcGeom, "INuPatch", None)),
+    ]
+    objects = {"total": 0}
+    bounds = None
+    stack = [archive.getTop()]
+    while stack:
+        parent = stack.pop()
+        for index in range(parent.getNumChildren()):
+            child = parent.getChild(index)
+            stack.append(child)
+            objects["total"] += 1
+            metadata = child.getMetaData()
+            kind = "other"
+            if AbcGeom.IXform.matches(metadata):
+                kind = "xform"
+            else:
+                for name, geometry_type in geometry_types:
+                    if geometry_type is not None and geometry_type.matches(metadata):
+                        kind = name
+                        schema = geometry_type(child, Abc.WrapExistingFlag.kWrapExisting).getSchema()
+                        bounds_property = schema.getSelfBoundsProperty()
+                        sample_count = bounds_property.getNumSamples()
+                        for sample in {0, max(sample_count - 1, 0)}:
+                            bounds = _union_bounds(bounds, bounds_property.getValue(Abc.ISampleSelector(sample)))
+                        break
+            objects[kind] = objects.get(kind, 0) + 1
+
+    return {
+        "frozen": True,
+        "samples": samples,
+        "time_range": time_range,
+        "objects": objects,
+        "bounds": bounds,
+    }
+
+
+def verify_abc_file(file_path, expected_frame_range=None, fps=DEFAULT_FPS):
+    """校验单个Alembic缓存
+
+    Args:
+        file_path: .abc 文件路径
+        expected_frame_range: 可选，(起始帧, 结束帧)，缓存的帧范围不一致时视为失败
+        fps: 把采样时间换算为帧的帧率，应与导出时场景的帧率一致
+
+    Returns:
+        dict: 校验结果，ok为False时errors列出原因
+    """
+    result = {"path": file_path.replace('\\', '/'), "ok": False, "errors": []}
+    errors = result["errors"]
+    if not os.path.exists(file_path):
+        errors.append("文件不存在")
+        return result
+    result["size"] = os.path.getsize(file_path)
+    if result["size"] == 0:
+        errors.append("空文件")
+        return result
+
+    try:
+        if Abc is not None:
+            result["reader"] = "alembic"
+            stats = read_alembic_stats(file_path)
+        else:
+            result["reader"] = "ogawa"
+            stats = read_ogawa_stats(file_path)
+    except Exception as e:
+        errors.append(f"读取失败: {str(e)}")
+        return result
+    result.update(stats)
+
+    if not stats.get("frozen"):
+        errors.append("文件未写完，导出可能中途崩溃")
+        return result
+    if not stats.get("samples"):
+        errors.append("没有采样")
+    if not stats.get("objects", {}).get("total"):
+        errors.append("没有物体")
+
+    time_range = stats.get("time_range")
+    if time_range:
+        frame_range = [round(time_range[0] * fps, 3), round(time_range[1] * fps, 3)]
+        result["frame_range"] = frame_range
+        # 没有动画的缓存（如静态道具）只有一个采样，不检查帧范围
+        mismatch = any(abs(actual - expected) > FRAME_TOLERANCE
+                       for actual, expected in zip(frame_range, expected_frame_range or frame_range))
+        if mismatch and stats["samples"] > 1:
+            errors.append(f"帧范围 {frame_range[0]:g}-{frame_range[1]:g} 与预期 "
+                          f"{expected_frame_range[0]:g}-{expected_frame_range[1]:g} 不一致")
+    elif expected_frame_range:
+        errors.append("无法读取帧范围")
+
+    result["ok"] = not errors
+    return result
+
+
+def find_abc_files(directories):
+    """递归查找目录下的 .abc 文件
+
+    Args:
+        directories: 目录或文件路径列表
+
+    Returns:
+        list: 排序后的 .abc 文件路径列表
+    """
+    abc_files = []
+    for directory in directories:
+        if os.path.isfile(directory):
+            abc_files.append(directory)
+            continue
+        for root, _, files in os.walk(directory):
+            abc_files.extend(os.path.join(root, name) for name in files if name.lower().endswith(".abc"))
+    return sorted(abc_files)
+
+
+def verify_abc_files(file_paths, expected_frame_range=None, fps=DEFAULT_FPS, workers=8):
+    """用线程池并行校验多个缓存
+
+    Args:
+        file_paths: .abc 文件路径列表
+        expected_frame_range: 可选，(起始帧, 结束帧)
+        fps: 帧率
+        workers: 线程数量
+
+    Returns:
+        list: 与file_paths顺序一致的校验结果
+    """
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(file_paths)))) as pool:
+        return list(pool.map(lambda path: verify_abc_file(path, expected_frame_range, fps), file_paths))
+
+
+def write_report(results, report_path):
+    """写入紧凑的JSON校验报告
+
+    Args:
+        results: verify_abc_files的结果
+        report_path: 报告路径
+
+    Returns:
+        dict: 报告内容
+    """
+    failed = [result["path"] for result in results if not result["ok"]]
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total": len(results),
+        "failed": len(failed),
+        "total_size": sum(result.get("size", 0) for result in results),
+        "failed_files": failed,
+        "files": results,
+    }
+    report_dir = os.path.dirname(report_path)
+    if report_dir and not os.path.exists(report_dir):
+        os.makedirs(report_dir)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"校验报告已保存到: {report_path}（{len(results)} 个文件，{len(failed)} 个失败）")
+    return report
+
+
+def print_failures(results):
+    """打印校验失败的文件和原因"""
+    for result in results:
+        if not result["ok"]:
+            print(f"缓存校验失败: {result['path']}: {'；'.join(result['errors'])}")
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="校验Alembic缓存")
+    parser.add_argument("paths", nargs="+", help="缓存目录或 .abc 文件")
+    parser.add_argument("--report", default=None, help="JSON报告的输出路径，默认保存在第一个目录下")
+    parser.add_argument("--frame-range", type=float, nargs=2, default=None, help="预期的起始帧和结束帧")
+    parser.add_argument("--fps", type=time_unit_fps, default=DEFAULT_FPS, help="帧率或Maya时间单位，如 25、pal、film")
+    parser.add_argument("--workers", type=int, default=8, help="线程数量")
+    args = parser.parse_args(argv)
+
+    results = verify_abc_files(find_abc_files(args.paths), args.frame_range, args.fps, args.workers)
+    print_failures(results)
+    report_path = args.report
+    if report_path is None:
+        first = args.paths[0]
+        report_path = os.path.join(first if os.path.isdir(first) else os.path.dirname(first), REPORT_NAME)
+    report = write_report(results, report_path)
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
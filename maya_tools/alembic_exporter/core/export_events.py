@@ -0,0 +1,58 @@
+"""
+导出进度事件
+
+ExportExecutor 在执行导出计划时通过回调函数发送这些事件，界面或批处理脚本可以据此显示进度，
+并通过 CancelFlag 在任务之间或逐帧回调时中止导出。
+"""
+
+# 事件类型
+QUEUED = "queued"          # 任务进入待导出队列
+SKIPPED = "skipped"        # 输入未变化，跳过导出
+STARTED = "started"        # 开始导出
+FRAME = "frame"            # AbcExport 完成一帧
+FINISHED = "finished"      # 导出成功
+FAILED = "failed"          # 导出失败
+CANCELLED = "cancelled"    # 导出被取消
+
+
+class ExportCancelled(RuntimeError):
+    """导出被用户取消"""
+
+
+class CancelFlag:
+    """取消标记，由界面设置，由执行器在每条AbcExport命令前后检查"""
+
+    def __init__(self):
+        self.is_cancelled = False
+
+    def cancel(self):
+        """请求取消导出"""
+        self.is_cancelled = True
+
+    def reset(self):
+        """清除取消标记，以便复用"""
+        self.is_cancelled = False
+
+
+class ExportEvent:
+    """一条导出进度事件"""
+
+    def __init__(self, kind, job=None, frame=None, progress=None, message=None):
+        """初始化事件
+
+        Args:
+            kind: 事件类型，见模块中的常量
+            job: 相关的ExportJob，单次导出的逐帧事件为None（对所有任务生效）
+            frame: FRAME事件的当前帧
+            progress: 当前任务（单次导出时为整个命令）的完成比例，0到1
+            message: 附加信息，如错误信息
+        """
+        self.kind = kind
+        self.job = job
+        self.frame = frame
+        self.progress = progress
+        self.message = message
+
+    def __repr__(self):
+        export_id = self.job.export_id if self.job else None
+        return f"ExportEvent({self.kind!r}, {export_id!r}, frame={self.frame!r}, progress={self.progress!r})"
@@ -0,0 +1,430 @@
+"""
+Alembic导出执行器
+
+执行 export_plan.ExportPlan 中的任务：根据导出清单跳过输入未变化的任务，创建输出目录，
+临时显示毛发生长面的隐藏几何体，为使用代理模式的任务创建代理模型（见 proxy_geometry），
+然后逐个或用一条多job的AbcExport命令执行导出。
+没有动画的道具可以从静态道具缓存库直接链接（见 static_props）。
+
+执行过程通过回调函数发送 export_events.ExportEvent，逐帧进度来自AbcExport的 -pythonPerFrameCallback。
+AbcExport不处理逐帧回调中的异常，无法在导出中途中止，取消标记在每条AbcExport命令前后检查：
+逐个导出时在任务之间生效，单次导出时在整条命令结束后生效，已写出的文件都会删除。
+"""
+
+import os
+import maya.cmds as cmds
+import maya.mel as mel
+from contextlib import nullcontext
+from maya_tools.alembic_exporter.core.export_manifest import ExportManifest, SceneFingerprint
+from maya_tools.alembic_exporter.core.visibility import VisibilityOverride
+from maya_tools.alembic_exporter.core.proxy_geometry import ProxyGeometry
+from maya_tools.alembic_exporter.core import export_events, profiling
+from maya_tools.alembic_exporter.core.export_events import ExportEvent, ExportCancelled
+from maya_tools.alembic_exporter.core.output_finalizer import OutputFinalizer
+from maya_tools.alembic_exporter.core.static_props import find_static_prop_key, static_frame_range
+
+# AbcExport按空格拆分job参数，逐帧回调的Python命令中不能有空格
+FRAME_CALLBACK_COMMAND = (
+    "__import__('maya_tools.alembic_exporter.core.export_executor',fromlist=['_']).on_export_frame(#FRAME#)"
+)
+
+# 正在执行导出的执行器，逐帧回调通过它发送事件
+_active_executor = None
+
+
+def on_export_frame(frame):
+    """AbcExport逐帧回调入口"""
+    if _active_executor is not None:
+        _active_executor._on_frame(frame)
+
+
+def build_export_command(jobs, frame_callback=None, output_paths=None, roots=None, frame_ranges=None):
+    """把多个导出任务拼接为一条AbcExport命令
+
+    Args:
+        jobs: ExportJob列表
+        frame_callback: 可选，逐帧执行的Python命令，只加在帧范围最长的一个job上，避免每帧重复调用
+        output_paths: 可选，与jobs对应的实际写入路径，如本地临时目录中的路径
+        roots: 可选，与jobs对应的实际导出根节点，如代理模型的根节点
+        frame_ranges: 可选，与jobs对应的实际导出帧范围，如静态道具只导出起始帧
+
+    Returns:
+        str: 可以直接mel.eval执行的AbcExport命令
+    """
+    output_paths = output_paths or [None] * len(jobs)
+    roots = roots or [None] * len(jobs)
+    frame_ranges = [frame_range or job.frame_range
+                    for job, frame_range in zip(jobs, frame_ranges or [None] * len(jobs))]
+    job_strings = [job.job_string(output_path, root, frame_range)
+                   for job, output_path, root, frame_range in zip(jobs, output_paths, roots, frame_ranges)]
+    if frame_callback and job_strings:
+        # 静态道具只有一帧，逐帧回调加在帧范围最长的job上才能报告整个导出的进度
+        longest = max(range(len(jobs)), key=lambda index: float(frame_ranges[index][1]) - float(frame_ranges[index][0]))
+        job_strings[longest] += f"-pythonPerFrameCallback {frame_callback} "
+    return "AbcExport " + " ".join(f'-j "{job_string}"' for job_string in job_strings)
+
+
+class ExportExecutor:
+    """执行导出计划"""
+
+    def __init__(self, force=False, use_manifest=True, callback=None, cancel_flag=None, scratch_dir=None,
+                 finalize_workers=4, static_store=None):
+        """初始化执行器
+
+        Args:
+            force: 是否忽略导出清单，强制重新导出所有任务
+            use_manifest: 是否读写导出清单，导出到临时目录的分段任务不需要清单
+            callback: 可选，接收ExportEvent的回调函数
+            cancel_flag: 可选，CancelFlag实例，设置后在当前AbcExport命令结束后中止导出
+            scratch_dir: 可选，本地临时目录；设置后AbcExport先写到这里，再由后台线程复制到最终位置
+            finalize_workers: 后台复制文件的线程数量
+            static_store: 可选，StaticPropStore；设置后静态道具只导出一次，其他镜头直接链接缓存库中的文件
+        """
+        self.force = force
+        self.use_manifest = use_manifest
+        self.callback = callback
+        self.cancel_flag = cancel_flag
+        self.scratch_dir = scratch_dir
+        self.finalize_workers = finalize_workers
+        self._finalizer = None
+        self.static_store = static_store
+        # 需要在导出后加入缓存库的静态道具：导出ID到缓存库的键
+        self._static_keys = {}
+        self._manifests = {}
+        # 当前正在导出的任务（单次导出时为None）及其帧范围
+        self._current_job = None
+        self._current_range = None
+        self._started_jobs = []
+        self._proxies = None
+
+    def _emit(self, kind, job=None, **kwargs):
+        """发送进度事件"""
+        if kind == export_events.STARTED:
+            self._started_jobs.append(job)
+        if self.callback:
+            self.callback(ExportEvent(kind, job, **kwargs))
+
+    def _check_cancelled(self):
+        """检查取消标记，已取消时抛出ExportCancelled"""
+        if self.cancel_flag is not None and self.cancel_flag.is_cancelled:
+            raise ExportCancelled("导出已取消")
+
+    def _on_frame(self, frame):
+        """逐帧回调：只发送帧进度事件，这里抛出的异常会被AbcExport忽略"""
+        progress = None
+        if self._current_range:
+            start_frame, end_frame = self._current_range
+            span = max(float(end_frame) - float(start_frame), 1.0)
+            progress = min(max((float(frame) - float(start_frame)) / span, 0.0), 1.0)
+        self._emit(export_events.FRAME, self._current_job, frame=frame, progress=progress)
+
+    def _output_path(self, job):
+        """AbcExport实际写入的路径：使用本地临时目录时为临时路径，否则为最终路径"""
+        if self._finalizer is not None:
+            return self._finalizer.scratch_path(job.output_path)
+        return job.output_path
+
+    def _finalize(self, jobs):
+        """把导出到本地临时目录的文件交给后台线程落盘"""
+        if self._finalizer is None:
+            return
+        for job in jobs:
+            if os.path.exists(self._output_path(job)):
+                self._finalizer.submit(job.output_path)
+
+    def _wait_finalized(self, finished):
+        """等待后台落盘完成，返回成功落盘的任务"""
+        if self._finalizer is None:
+            return finished
+        errors = self._finalizer.wait()
+        self._finalizer.shutdown()
+        self._finalizer = None
+        finalized = []
+        for job in finished:
+            if job.output_path not in errors:
+                # 导出后未找到临时文件，已发送过失败事件
+                continue
+            if errors[job.output_path] is None:
+                finalized.append(job)
+            else:
+                self._emit(export_events.FAILED, job, message=f"落盘失败: {errors[job.output_path]}")
+        return finalized
+
+    def _link_static_props(self, jobs):
+        """检查道具任务是否静态，缓存库中已有的直接链接到输出路径
+
+        Args:
+            jobs: 需要导出的ExportJob列表
+
+        Returns:
+            list: 已从缓存库链接、不需要导出的任务
+        """
+        self._static_keys = {}
+        if self.static_store is None:
+            return []
+        linked = []
+        for job in jobs:
+            if job.asset_type != "prop" or job.proxy:
+                continue
+            try:
+                key = find_static_prop_key(job)
+            except Exception as e:
+                print(f"检查道具 {job.export_id} 是否静态失败，按普通道具导出: {str(e)}")
+                continue
+            if key is None:
+                continue
+            if self.static_store.has(key):
+                self.static_store.link(key, job.output_path)
+                print(f"道具 {job.export_id} 没有动画，使用共享缓存: {self.static_store.path_for(key)}")
+                self._emit(export_events.SKIPPED, job, message="静态道具，使用共享缓存")
+                linked.append(job)
+            else:
+                self._static_keys[job.export_id] = key
+        return linked
+
+    def _store_static_props(self, finished):
+        """把首次导出的静态道具加入缓存库"""
+        for job in finished:
+            key = self._static_keys.get(job.export_id)
+            if key is None or not os.path.exists(job.output_path):
+                continue
+            try:
+                store_path = self.static_store.add(key, job.output_path)
+                print(f"静态道具 {job.export_id} 已加入共享缓存: {store_path}")
+            except OSError as e:
+                print(f"静态道具 {job.export_id} 加入共享缓存失败: {str(e)}")
+
+    @staticmethod
+    def _unlink_shared_outputs(jobs):
+        """删除指向缓存库的硬链接，避免AbcExport覆盖写入时改动缓存库和其他镜头的文件"""
+        for job in jobs:
+            if os.path.exists(job.output_path) and os.stat(job.output_path).st_nlink > 1:
+                os.remove(job.output_path)
+
+    def _get_manifest(self, job):
+        """获取任务输出目录所属缓存目录的导出清单，同一目录只加载一次
+
+        角色和道具的输出位于 cache_dir/<资产ID>/ 下，清单保存在 cache_dir；毛发生长面直接输出到毛发缓存目录。
+        """
+        output_dir = os.path.dirname(job.output_path)
+        cache_dir = output_dir if job.asset_type == "fur" else os.path.dirname(output_dir)
+        if cache_dir not in self._manifests:
+            self._manifests[cache_dir] = ExportManifest(cache_dir)
+        return self._manifests[cache_dir]
+
+    @staticmethod
+    def _job_settings(job):
+        """导出清单中记录的任务设置，导出配置、参数或代理模式变化时需要重新导出"""
+        return {"profile": job.profile, "flags": job.flags, "proxy": job.proxy}
+
+    def split_up_to_date(self, plan, scene):
+        """按导出清单把任务分为需要导出和可以跳过两组
+
+        Args:
+            plan: ExportPlan
+            scene: SceneFingerprint实例
+
+        Returns:
+            tuple: (需要导出的ExportJob列表, 跳过的文件路径列表)
+        """
+        if self.force or not self.use_manifest:
+            return list(plan), []
+        if scene.modified:
+            # 清单中的指纹对应已保存的场景文件，不能说明内存中的场景未变化
+            print("场景有未保存的修改，导出所有任务")
+            return list(plan), []
+        pending = []
+        skipped_files = []
+        for job in plan:
+            if self._get_manifest(job).is_up_to_date(job.output_path, scene, job.frame_range, self._job_settings(job),
+                                                   job.root):
+                print(f"{job.asset_type_name} {job.export_id} 的输入未变化，跳过导出: {job.output_path}")
+                self._emit(export_events.SKIPPED, job)
+                skipped_files.append(job.output_path)
+                continue
+            pending.append(job)
+        return pending, skipped_files
+
+    def record_outputs(self, plan, jobs, scene):
+        """检查任务的输出文件并记录到导出清单
+
+        Args:
+            plan: ExportPlan
+            jobs: 已执行的ExportJob列表
+            scene: SceneFingerprint实例
+
+        Returns:
+            list: 存在的输出文件路径列表
+        """
+        exported_files = []
+        try:
+            for job in jobs:
+                if not os.path.exists(job.output_path):
+                    print(f"导出{job.asset_type_name} {job.export_id} 后未找到输出文件: {job.output_path}")
+                    continue
+                if self.use_manifest:
+                    self._get_manifest(job).record(job.output_path, scene, job.frame_range, self._job_settings(job),
+                                                   job.root)
+                exported_files.append(job.output_path)
+        finally:
+            for manifest in self._manifests.values():
+                manifest.save()
+        return exported_files
+
+    def run(self, plan, single_pass=False):
+        """执行导出计划
+
+        Args:
+            plan: ExportPlan
+            single_pass: 是否用一条多job的AbcExport命令导出所有任务，时间线只求值一次
+
+        Returns:
+            list: 导出的文件路径列表（包含因未变化而跳过的文件）
+        """
+        scene = SceneFingerprint(plan.scene_file, modified=cmds.file(q=True, modified=True))
+        with profiling.phase("manifest_check"):
+            jobs, skipped_files = self.split_up_to_date(plan, scene)
+        with profiling.phase("static_props"):
+            linked = self._link_static_props(jobs)
+        profiling.count("jobs_skipped", len(skipped_files) + len(linked))
+        jobs = [job for job in jobs if job not in linked]
+        if not jobs:
+            linked_files = self.record_outputs(plan, linked, scene) if linked else []
+            print(f"所有 {len(skipped_files) + len(linked_files)} 个资产的输入均未变化或使用共享缓存，无需导出")
+            return skipped_files + linked_files
+        self._unlink_shared_outputs(jobs)
+
+        if self.scratch_dir:
+            # 最终目录由后台线程创建，避免在网络共享上阻塞
+            self._finalizer = OutputFinalizer(self.scratch_dir, self.finalize_workers)
+            print(f"导出到本地临时目录: {self.scratch_dir}，完成后在后台复制到缓存目录")
+        for output_dir in sorted({os.path.dirname(self._output_path(job)) for job in jobs}):
+            os.makedirs(output_dir, exist_ok=True)
+
+        # 毛发生长面需要临时显示隐藏的几何体，整个导出过程只切换和恢复一次
+        fur_roots = [job.root for job in jobs if job.asset_type == "fur"]
+        visibility = VisibilityOverride(fur_roots) if fur_roots else nullcontext()
+        self._proxies = ProxyGeometry(jobs)
+
+        for job in jobs:
+            self._emit(export_events.QUEUED, job)
+
+        global _active_executor
+        _active_executor = self if self.callback else None
+        finished = []
+        try:
+            self._check_cancelled()
+            with visibility, self._proxies:
+                if single_pass:
+                    self._run_single_pass(jobs)
+                    finished = jobs
+                    self._finalize(jobs)
+                else:
+                    for job in jobs:
+                        self._check_cancelled()
+                        if self._run_job(job):
+                            finished.append(job)
+                            # 复制与下一个任务的导出并行进行
+                            self._finalize([job])
+        except ExportCancelled:
+            self._discard_interrupted(finished)
+            self._emit(export_events.CANCELLED, self._current_job)
+            raise
+        finally:
+            _active_executor = None
+            self._proxies = None
+            self._current_job = None
+            self._current_range = None
+            with profiling.phase("finalize_wait"):
+                finished = self._wait_finalized(finished)
+            with profiling.phase("static_props"):
+                self._store_static_props(finished)
+            with profiling.phase("manifest_record"):
+                exported_files = self.record_outputs(plan, linked + finished, scene)
+            profiling.count("jobs_exported", len(finished))
+
+        print(f"导出完成: {len(exported_files) - len(linked)}/{len(jobs)} 个文件，跳过 {len(skipped_files)} 个未变化的文件，"
+              f"{len(linked)} 个静态道具使用共享缓存")
+        return skipped_files + exported_files
+
+    def _discard_interrupted(self, finished):
+        """删除已开始但被取消的任务写出的不完整文件"""
+        for job in self._started_jobs:
+            output_path = self._output_path(job)
+            if job in finished or not os.path.exists(output_path):
+                continue
+            try:
+                os.remove(output_path)
+                print(f"已删除未完成的缓存文件: {output_path}")
+            except OSError as e:
+                print(f"删除未完成的缓存文件失败: {output_path} - {str(e)}")
+
+    def _roots(self, jobs):
+        """任务实际导出的根节点，使用代理模式的任务为代理模型的根节点"""
+        if self._proxies is None:
+            return None
+        return [self._proxies.root_for(job) for job in jobs]
+
+    def _frame_ranges(self, jobs):
+        """任务实际导出的帧范围，首次导出的静态道具只导出起始帧，缓存库中的文件与镜头帧范围无关"""
+        return [static_frame_range(job.frame_range) if job.export_id in self._static_keys else None for job in jobs]
+
+    def _frame_callback(self):
+        """需要进度事件时才添加逐帧回调"""
+        return FRAME_CALLBACK_COMMAND if self.callback else None
+
+    def _run_single_pass(self, jobs):
+        """用一条AbcExport命令导出所有任务"""
+        command = build_export_command(jobs, self._frame_callback(), [self._output_path(job) for job in jobs],
+                                       self._roots(jobs), self._frame_ranges(jobs))
+        self._current_job = None
+        self._current_range = jobs[0].frame_range
+        for job in jobs:
+            self._emit(export_events.STARTED, job)
+        try:
+            print(f"正在单次导出 {len(jobs)} 个资产的 Alembic 缓存...")
+            print(f"导出命令: {command}")
+            with profiling.phase("abc_export"):
+                mel.eval(command)
+        except Exception as e:
+            self._check_cancelled()
+            for job in jobs:
+                self._emit(export_events.FAILED, job, message=str(e))
+            raise RuntimeError(f"单次导出 Alembic 缓存时发生错误: {str(e)}")
+        # 导出期间请求的取消在命令结束后生效，写出的文件由 _discard_interrupted 删除
+        self._check_cancelled()
+        for job in jobs:
+            self._emit_result(job)
+
+    def _run_job(self, job):
+        """导出单个任务，失败时打印错误并继续
+
+        Returns:
+            bool: 导出命令是否执行成功
+        """
+        command = build_export_command([job], self._frame_callback(), [self._output_path(job)], self._roots([job]),
+                                       self._frame_ranges([job]))
+        self._current_job = job
+        self._current_range = job.frame_range
+        self._emit(export_events.STARTED, job)
+        try:
+            print(f"正在导出{job.asset_type_name} {job.export_id} 的 Alembic 缓存...")
+            print(f"导出命令: {command}")
+            with profiling.phase("abc_export"):
+                mel.eval(command)
+        except Exception as e:
+            self._check_cancelled()
+            print(f"导出{job.asset_type_name} {job.export_id} 的 Alembic 缓存时发生错误: {str(e)}")
+            self._emit(export_events.FAILED, job, message=str(e))
+            return False
+        self._check_cancelled()
+        self._emit_result(job)
+        return True
+
+    def _emit_result(self, job):
+        """根据输出文件是否存在发送完成或失败事件"""
+        output_path = self._output_path(job)
+        if os.path.exists(output_path):
+            self._emit(export_events.FINISHED, job, progress=1.0)
+        else:
+            self._emit(export_events.FAILED, job, message=f"未找到输出文件: {output_path}")
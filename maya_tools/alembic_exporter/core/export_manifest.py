@@ -0,0 +1,203 @@
+"""
+Alembic导出清单
+
+每个缓存目录（abc_cache、毛发生长面缓存目录）下保存一份 export_manifest.json，记录每个
+导出的 .abc 文件对应的源场景（路径、修改时间、大小、哈希）、帧范围、导出设置和根节点。
+再次导出时，如果这些输入都没有变化且输出文件完好，则跳过该任务。
+
+此模块只依赖标准库。
+"""
+
+import os
+import json
+import hashlib
+
+MANIFEST_NAME = "export_manifest.json"
+MANIFEST_VERSION = 1
+
+# 计算文件哈希时每次读取的字节数
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def _normalize_path(path):
+    """统一路径格式，路径比较忽略大小写"""
+    return os.path.normpath(path).replace('\\', '/').lower()
+
+
+def compute_file_hash(file_path):
+    """计算文件的SHA1哈希
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        str: 十六进制哈希字符串
+    """
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+class SceneFingerprint:
+    """源场景文件的指纹，哈希只在修改时间或大小变化时才计算
+
+    指纹只反映已保存的场景文件。打开的场景有未保存的修改时（modified=True），
+    它与任何记录都不一致，导出的结果也不记录到清单中。
+    """
+
+    def __init__(self, scene_path, modified=False):
+        """初始化场景指纹
+
+        Args:
+            scene_path: Maya场景文件路径
+            modified: 打开的场景是否有未保存的修改
+        """
+        self.path = scene_path
+        self.modified = modified
+        stat = os.stat(scene_path)
+        self.mtime = stat.st_mtime
+        self.size = stat.st_size
+        self._hash = None
+
+    @property
+    def hash(self):
+        """场景文件的SHA1哈希，首次访问时计算"""
+        if self._hash is None:
+            self._hash = compute_file_hash(self.path)
+        return self._hash
+
+    def matches(self, recorded):
+        """判断场景是否与清单中记录的一致
+
+        修改时间和大小都相同时直接认为一致；否则比较内容哈希，
+        这样仅被touch过但内容未变的场景也不会触发重新导出。
+
+        Args:
+            recorded: 清单中记录的场景信息字典
+
+        Returns:
+            bool: 是否一致
+        """
+        if self.modified:
+            return False
+        if not recorded or _normalize_path(recorded.get("path", "")) != _normalize_path(self.path):
+            return False
+        if recorded.get("mtime") == self.mtime and recorded.get("size") == self.size:
+            # 沿用记录中的哈希，避免重复读取大文件
+            if self._hash is None:
+                self._hash = recorded.get("hash")
+            return True
+        if recorded.get("size") != self.size:
+            return False
+        return recorded.get("hash") == self.hash
+
+    def as_dict(self):
+        """返回指纹字典"""
+        return {
+            "path": self.path.replace('\\', '/'),
+            "mtime": self.mtime,
+            "size": self.size,
+            "hash": self.hash
+        }
+
+
+class ExportManifest:
+    """缓存目录的导出清单"""
+
+    def __init__(self, cache_dir):
+        """加载缓存目录下的导出清单
+
+        Args:
+            cache_dir: 缓存目录
+        """
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self.entries = self._load()
+        self._is_dirty = False
+
+    def _load(self):
+        """读取清单文件，文件不存在或损坏时返回空清单"""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return data.get("entries", {})
+        except Exception as e:
+            print(f"读取导出清单出错，将重新生成: {str(e)}")
+            return {}
+
+    def _key(self, export_path):
+        """清单条目的键：相对缓存目录的路径"""
+        try:
+            relative_path = os.path.relpath(export_path, self.cache_dir)
+        except ValueError:
+            relative_path = export_path
+        return _normalize_path(relative_path)
+
+    def is_up_to_date(self, export_path, scene, frame_range, settings, root):
+        """判断导出任务的输入是否与上次导出时一致
+
+        Args:
+            export_path: 输出的 .abc 文件路径
+            scene: SceneFingerprint实例
+            frame_range: (起始帧, 结束帧)
+            settings: 导出设置字典，如导出配置名称和参数
+            root: 导出的根节点
+
+        Returns:
+            bool: 是否可以跳过导出
+        """
+        entry = self.entries.get(self._key(export_path))
+        if not entry:
+            return False
+        if not os.path.exists(export_path) or os.path.getsize(export_path) != entry.get("output_size"):
+            return False
+        if entry.get("root") != root:
+            return False
+        if entry.get("frame_range") != [float(frame) for frame in frame_range]:
+            return False
+        if entry.get("settings") != settings:
+            return False
+        return scene.matches(entry.get("scene"))
+
+    def record(self, export_path, scene, frame_range, settings, root):
+        """记录一次成功的导出
+
+        场景有未保存的修改时，输出与已保存的场景文件不对应，只删除该文件原有的记录。
+
+        Args:
+            export_path: 输出的 .abc 文件路径
+            scene: SceneFingerprint实例
+            frame_range: (起始帧, 结束帧)
+            settings: 导出设置字典
+            root: 导出的根节点
+        """
+        if scene.modified:
+            if self.entries.pop(self._key(export_path), None) is not None:
+                self._is_dirty = True
+            return
+        self.entries[self._key(export_path)] = {
+            "scene": scene.as_dict(),
+            "frame_range": [float(frame) for frame in frame_range],
+            "settings": settings,
+            "root": root,
+            "output_size": os.path.getsize(export_path)
+        }
+        self._is_dirty = True
+
+    def save(self):
+        """写回清单文件，先写临时文件再替换，避免中断时留下损坏的清单"""
+        if not self._is_dirty:
+            return
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "entries": self.entries}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+        self._is_dirty = False
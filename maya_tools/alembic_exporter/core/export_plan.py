@@ -0,0 +1,337 @@
+"""
+Alembic导出计划
+
+把场景中找到的资产转换为一组导出任务（资产ID、根节点、输出路径、帧范围、导出参数），
+整个过程不访问磁盘也不调用Maya，可以用于预演（dry-run）、跨镜头对比计划、序列化为JSON，
+以及在没有Maya的环境下测试路径规则。任务的执行由 export_executor.ExportExecutor 负责。
+"""
+
+import os
+import json
+
+from .settings import get_export_profiles
+
+# 资产类型到日志显示名称的映射，也是单次导出模式收集任务的顺序
+ASSET_TYPE_NAMES = {
+    "char": "角色",
+    "prop": "道具",
+    "fur": "毛发生长面",
+}
+
+# 资产类型使用的导出配置，配置定义见 settings.DEFAULT_PROFILES
+ASSET_TYPE_PROFILES = {
+    "char": "anim",
+    "prop": "anim",
+    "fur": "fur",
+}
+
+
+class ExportJob:
+    """单个资产的Alembic导出任务"""
+
+    def __init__(self, export_id, asset_type, root, output_path, frame_range, flags="", profile=None, proxy=None):
+        """初始化导出任务
+
+        Args:
+            export_id: 带序号的资产ID，如 "c001_01"
+            asset_type: 资产类型，"char"、"prop"或"fur"
+            root: 导出的根节点
+            output_path: 输出的 .abc 文件路径
+            frame_range: (起始帧, 结束帧)
+            flags: 导出配置预先渲染的AbcExport参数字符串
+            profile: 导出配置名称
+            proxy: 可选，代理导出设置，如 {"mode": "bbox"}，导出时用代理模型替换根节点
+        """
+        self.export_id = export_id
+        self.asset_type = asset_type
+        self.root = root
+        self.output_path = output_path
+        self.frame_range = tuple(frame_range)
+        self.flags = flags
+        self.profile = profile
+        self.proxy = dict(proxy) if proxy else None
+
+    @property
+    def asset_id(self):
+        """不带序号的资产ID"""
+        return self.export_id.rsplit("_", 1)[0]
+
+    @property
+    def asset_type_name(self):
+        """资产类型名称，用于日志显示"""
+        return ASSET_TYPE_NAMES.get(self.asset_type, self.asset_type)
+
+    def job_string(self, output_path=None, root=None, frame_range=None):
+        """构建AbcExport的 -j 参数字符串（不含外层引号）
+
+        Args:
+            output_path: 可选，实际写入的文件路径，默认为任务的输出路径
+            root: 可选，实际导出的根节点，如代理模型的根节点，默认为任务的根节点
+            frame_range: 可选，实际导出的帧范围，如静态道具只导出起始帧，默认为任务的帧范围
+
+        Returns:
+            str: job参数字符串
+        """
+        start_frame, end_frame = frame_range or self.frame_range
+        parts = [
+            f"-frameRange {start_frame} {end_frame}",
+            f"-root {root or self.root}",
+            f"-file {output_path or self.output_path}",
+        ]
+        if self.flags:
+            parts.append(self.flags)
+        return " ".join(parts) + " "
+
+    def as_dict(self):
+        """返回任务字典"""
+        return {
+            "export_id": self.export_id,
+            "asset_type": self.asset_type,
+            "root": self.root,
+            "output_path": self.output_path,
+            "frame_range": list(self.frame_range),
+            "profile": self.profile,
+            "flags": self.flags,
+            "proxy": self.proxy
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """从任务字典创建任务"""
+        return cls(
+            data["export_id"],
+            data["asset_type"],
+            data["root"],
+            data["output_path"],
+            data["frame_range"],
+            data.get("flags", ""),
+            data.get("profile"),
+            data.get("proxy")
+        )
+
+    def __repr__(self):
+        return f"ExportJob({self.export_id!r}, {self.asset_type!r}, {self.output_path!r})"
+
+
+class ExportPlan:
+    """一个场景的导出计划"""
+
+    def __init__(self, jobs=None, scene_file=None, settings=None):
+        """初始化导出计划
+
+        Args:
+            jobs: ExportJob列表
+            scene_file: 源场景文件路径
+            settings: 生成计划时使用的导出配置，配置名称到设置字典的映射
+        """
+        self.jobs = list(jobs or [])
+        self.scene_file = scene_file
+        self.settings = dict(settings or {})
+
+    def __iter__(self):
+        return iter(self.jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def filter(self, asset_types):
+        """返回只包含指定资产类型的新计划
+
+        Args:
+            asset_types: 资产类型列表
+
+        Returns:
+            ExportPlan: 过滤后的计划
+        """
+        return ExportPlan([job for job in self.jobs if job.asset_type in asset_types], self.scene_file, self.settings)
+
+    def as_dict(self):
+        """返回计划字典"""
+        return {
+            "scene_file": self.scene_file,
+            "settings": self.settings,
+            "jobs": [job.as_dict() for job in self.jobs]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """从计划字典创建计划"""
+        return cls([ExportJob.from_dict(job) for job in data.get("jobs", [])], data.get("scene_file"),
+                   data.get("settings"))
+
+    def to_json(self, file_path=None):
+        """序列化为JSON
+
+        Args:
+            file_path: 可选，写入的文件路径
+
+        Returns:
+            str: JSON字符串
+        """
+        content = json.dumps(self.as_dict(), indent=2, ensure_ascii=False)
+        if file_path:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return content
+
+    @classmethod
+    def from_json(cls, content=None, file_path=None):
+        """从JSON字符串或文件读取计划
+
+        Args:
+            content: JSON字符串
+            file_path: JSON文件路径，提供时忽略content
+
+        Returns:
+            ExportPlan: 导出计划
+        """
+        if file_path:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        return cls.from_dict(json.loads(content))
+
+
+class ExportPlanner:
+    """根据场景信息和资产几何体生成导出计划"""
+
+    def __init__(self, scene_info, profiles=None, profile=None):
+        """初始化计划器
+
+        Args:
+            scene_info: 场景信息字典，包含帧范围、缓存目录和镜头信息
+            profiles: 配置名称到ExportProfile的映射，默认使用 settings.get_export_profiles()
+            profile: 可选，所有资产类型统一使用的导出配置名称，如 "layout_proxy"；
+                输出文件名会加上 "_配置名称" 后缀，不会覆盖正式缓存
+
+        Raises:
+            KeyError: 指定的导出配置不存在
+        """
+        self.scene_info = scene_info
+        self.profiles = profiles if profiles is not None else get_export_profiles()
+        if profile is not None and profile not in self.profiles:
+            raise KeyError(f"未定义的导出配置: {profile}，可用配置: {', '.join(sorted(self.profiles))}")
+        self.profile = profile
+
+    @property
+    def frame_range(self):
+        return (self.scene_info["start_export_frame"], self.scene_info["end_export_frame"])
+
+    def resolve_output_path(self, asset_type, export_id):
+        """解析导出文件路径，不创建目录
+
+        Args:
+            asset_type: 资产类型
+            export_id: 带序号的资产ID，如 "c001_01"
+
+        Returns:
+            str: 导出文件路径
+        """
+        scene_info = self.scene_info
+        if asset_type == "fur" and scene_info.get("fur_cache_dir"):
+            # 毛发生长面直接放在毛发缓存目录下，使用毛发专用的sequence和shot命名
+            # 例如: "c001_02" -> 基础ID="c001", 序号="02"；没有序号时默认为01
+            if "_" in export_id:
+                base_id, index = export_id.rsplit("_", 1)
+            else:
+                base_id, index = export_id, "01"
+            sequence = scene_info.get("fur_sequence", "Sq03")
+            shot = scene_info.get("fur_shot", "Sc0090")
+            asset_cache_dir = scene_info["fur_cache_dir"]
+            cache_name = f"{sequence}_{shot}_xgenMesh_{base_id}_{index}.abc"
+        else:
+            # 按基础资产ID（去除序号）创建子目录，而不是为每个序号创建目录
+            base_id = export_id.rsplit("_", 1)[0] if "_" in export_id else export_id
+            asset_cache_dir = os.path.join(scene_info["cache_dir"], base_id)
+            cache_name = f"{scene_info['episode']}_{scene_info['sequence']}_{scene_info['shot']}_{export_id}.abc"
+        if self.profile is not None:
+            cache_name = f"{os.path.splitext(cache_name)[0]}_{self.profile}.abc"
+
+        return os.path.join(asset_cache_dir, cache_name).replace('\\', '/')
+
+    def get_profile(self, asset_type):
+        """获取资产类型对应的导出配置
+
+        Args:
+            asset_type: 资产类型
+
+        Returns:
+            ExportProfile: 导出配置，指定了统一的导出配置时返回该配置，未单独配置的资产类型使用anim
+        """
+        if self.profile is not None:
+            return self.profiles[self.profile]
+        return self.profiles[ASSET_TYPE_PROFILES.get(asset_type, "anim")]
+
+    def plan(self, asset_geometries):
+        """生成导出计划
+
+        Args:
+            asset_geometries: 资产类型到 {资产ID: [几何体组]} 的映射，按字典顺序生成任务
+
+        Returns:
+            ExportPlan: 导出计划
+        """
+        jobs = []
+        used_profiles = {}
+        for asset_type, geometries in asset_geometries.items():
+            profile = self.get_profile(asset_type)
+            used_profiles[profile.name] = profile.as_dict()
+            for asset_id, geometry_groups in geometries.items():
+                # 始终添加序号后缀，即使只有一个几何体组
+                for index, geometry in enumerate(geometry_groups, 1):
+                    export_id = f"{asset_id}_{index:02d}"
+                    jobs.append(ExportJob(
+                        export_id,
+                        asset_type,
+                        geometry,
+                        self.resolve_output_path(asset_type, export_id),
+                        self.frame_range,
+                        profile.flag_string,
+                        profile.name,
+                        profile.proxy
+                    ))
+        return ExportPlan(jobs, self.scene_info.get("current_file"), used_profiles)
+
+
+def split_frame_range(start_frame, end_frame, chunk_size):
+    """把帧范围切分为互不重叠的连续分段
+
+    Args:
+        start_frame: 起始帧
+        end_frame: 结束帧（包含）
+        chunk_size: 每段的帧数
+
+    Returns:
+        list: [(起始帧, 结束帧), ...]，最后一段可能不足chunk_size
+    """
+    chunk_size = max(1, int(chunk_size))
+    chunks = []
+    chunk_start = start_frame
+    while chunk_start <= end_frame:
+        chunk_end = min(chunk_start + chunk_size - 1, end_frame)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + 1
+    return chunks
+
+
+def build_chunk_plans(plan, chunks, chunk_dir):
+    """为每个分段生成输出到临时目录的导出计划
+
+    Args:
+        plan: 完整帧范围的ExportPlan
+        chunks: split_frame_range返回的分段列表
+        chunk_dir: 临时目录
+
+    Returns:
+        list: 与chunks顺序对应的ExportPlan列表，任务顺序与plan一致
+    """
+    chunk_plans = []
+    for chunk_index, frame_range in enumerate(chunks, 1):
+        jobs = []
+        for job_index, job in enumerate(plan, 1):
+            # 加上任务序号，避免不同资产类型的文件名冲突
+            file_name = f"{job_index:03d}_{os.path.basename(job.output_path)}"
+            output_path = os.path.join(chunk_dir, f"chunk_{chunk_index:03d}", file_name).replace('\\', '/')
+            jobs.append(ExportJob(job.export_id, job.asset_type, job.root, output_path, frame_range, job.flags,
+                                  job.profile, job.proxy))
+        chunk_plans.append(ExportPlan(jobs, plan.scene_file, plan.settings))
+    return chunk_plans
@@ -0,0 +1,166 @@
+"""
+镜头帧范围
+
+导出帧范围按镜头解析，依次尝试：
+    1. shot_data.json 中镜头的 "frame_range": [起始帧, 结束帧]（可单独设置 "pre_roll"/"post_roll"）
+    2. 相机文件或相机节点的名称，如 cam_Sq04_Sc0110_1001_1104（maya_tools.common.camera_utils，与渲染设置工具共用）
+    3. 当前时间线范围
+再按项目配置 project_config.json 中的 "frame_range": {"pre_roll": 0, "post_roll": 4} 向前后延长。
+
+镜头帧范围的索引只在 shot_data 变化时重建一次，解析函数不依赖Maya，可以在Maya外测试。
+"""
+
+from maya_tools.common.camera_utils import DEFAULT_CAMERA_PREFIX, parse_camera_frame_range
+
+DEFAULT_PRE_ROLL = 0
+DEFAULT_POST_ROLL = 4
+# 帧范围来源的默认顺序
+FRAME_RANGE_SOURCES = ("shot_data", "camera", "playback")
+
+# (shot_data对象, 索引)，shot_data 被替换后重建
+_shot_index_cache = (None, {})
+
+
+class ShotFrameRange:
+    """镜头的帧范围和导出时前后延长的帧数"""
+
+    def __init__(self, start_frame, end_frame, pre_roll=DEFAULT_PRE_ROLL, post_roll=DEFAULT_POST_ROLL, source=None):
+        """初始化
+
+        Args:
+            start_frame: 镜头起始帧
+            end_frame: 镜头结束帧
+            pre_roll: 起始帧之前多导出的帧数
+            post_roll: 结束帧之后多导出的帧数
+            source: 帧范围来源，shot_data、camera 或 playback
+        """
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.pre_roll = pre_roll
+        self.post_roll = post_roll
+        self.source = source
+
+    @property
+    def export_range(self):
+        """导出使用的帧范围 (起始帧 - pre_roll, 结束帧 + post_roll)"""
+        return (self.start_frame - self.pre_roll, self.end_frame + self.post_roll)
+
+    def as_dict(self):
+        return {
+            "start_frame": self.start_frame,
+            "end_frame": self.end_frame,
+            "pre_roll": self.pre_roll,
+            "post_roll": self.post_roll,
+            "source": self.source,
+        }
+
+    def __repr__(self):
+        return (f"ShotFrameRange({self.start_frame}, {self.end_frame}, pre_roll={self.pre_roll}, "
+                f"post_roll={self.post_roll}, source={self.source!r})")
+
+
+def load_frame_range_settings(project_config):
+    """读取项目配置中的帧范围设置
+
+    Args:
+        project_config: 项目配置字典
+
+    Returns:
+        dict: {"pre_roll", "post_roll", "sources", "camera_prefix"}
+    """
+    config = project_config.get("frame_range", {})
+    return {
+        "pre_roll": config.get("pre_roll", DEFAULT_PRE_ROLL),
+        "post_roll": config.get("post_roll", DEFAULT_POST_ROLL),
+        "sources": tuple(config.get("sources", FRAME_RANGE_SOURCES)),
+        "camera_prefix": project_config.get("camera_settings", {}).get("file_prefix", DEFAULT_CAMERA_PREFIX),
+    }
+
+
+def build_shot_index(shot_data):
+    """建立 (sequence, shot) 到镜头帧范围设置的索引，键为小写
+
+    Args:
+        shot_data: shot_data.json 的内容
+
+    Returns:
+        dict: {(sequence, shot): {"frame_range": (起始帧, 结束帧), "pre_roll": ..., "post_roll": ...}}，
+            只包含设置了 frame_range 的镜头
+    """
+    index = {}
+    for episode_data in shot_data.get("Episode", {}).values():
+        for sequence, sequence_data in episode_data.get("Sequences", {}).items():
+            for shot, data in sequence_data.get("Shots", {}).items():
+                frame_range = data.get("frame_range")
+                if not frame_range or len(frame_range) != 2:
+                    continue
+                entry = {"frame_range": (frame_range[0], frame_range[1])}
+                for key in ("pre_roll", "post_roll"):
+                    if key in data:
+                        entry[key] = data[key]
+                index[(sequence.lower(), shot.lower())] = entry
+    return index
+
+
+def get_shot_index(shot_data):
+    """获取镜头帧范围索引，shot_data 对象未变化时复用"""
+    global _shot_index_cache
+    cached_data, index = _shot_index_cache
+    if cached_data is not shot_data:
+        index = build_shot_index(shot_data)
+        _shot_index_cache = (shot_data, index)
+    return index
+
+
+def resolve_frame_range(sequence, shot, shot_index, settings, camera_names=(), playback_range=None):
+    """按配置的来源顺序解析镜头帧范围
+
+    Args:
+        sequence: 场次名称，如 Sq04
+        shot: 镜头名称，如 Sc0110
+        shot_index: build_shot_index 返回的索引
+        settings: load_frame_range_settings 返回的设置
+        camera_names: 场景中的相机文件名和节点名
+        playback_range: 可选，(起始帧, 结束帧)，也可以是返回该元组的函数，只在前面的来源都找不到时调用
+
+    Returns:
+        ShotFrameRange | None: 所有来源都找不到时返回None
+    """
+    pre_roll = settings["pre_roll"]
+    post_roll = settings["post_roll"]
+    for source in settings["sources"]:
+        frame_range = None
+        if source == "shot_data":
+            entry = shot_index.get(((sequence or "").lower(), (shot or "").lower()))
+            if entry:
+                frame_range = entry["frame_range"]
+                pre_roll = entry.get("pre_roll", pre_roll)
+                post_roll = entry.get("post_roll", post_roll)
+        elif source == "camera":
+            for camera_name in camera_names:
+                frame_range = parse_camera_frame_range(camera_name, settings["camera_prefix"])
+                if frame_range:
+                    break
+        elif source == "playback" and playback_range is not None:
+            frame_range = playback_range() if callable(playback_range) else playback_range
+        if frame_range:
+            return ShotFrameRange(frame_range[0], frame_range[1], pre_roll, post_roll, source)
+    return None
+
+
+def sampled_frame_range(start_frame, end_frame, step=None):
+    """AbcExport使用 -step 采样时实际写入的帧范围
+
+    从起始帧开始每隔step帧采样一次，最后一个采样帧可能早于结束帧。
+
+    Args:
+        start_frame: 起始帧
+        end_frame: 结束帧
+        step: 采样间隔，为空或不大于1时逐帧采样
+
+    Returns:
+        tuple: (第一个采样帧, 最后一个采样帧)
+    """
+    if not step or step <= 1:
+        return (start_frame, end_frame)
+    return (start_frame, start_frame + int((end_frame - start_frame) // step) * step)
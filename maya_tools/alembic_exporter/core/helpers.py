@@ -1,6 +1,6 @@
-import maya.cmds as cmds
 import re
 from maya_tools.common.asset_manager import AssetManager
+from maya_tools.common.scene_index import get_scene_index
 
 def _get_geometry_by_pattern(pattern_prefix, id_group=1):
     """
@@ -13,34 +13,14 @@ def _get_geometry_by_pattern(pattern_prefix, id_group=1):
     Returns:
         dict: 资产ID到几何体组的映射
     """
-    asset_meshes = {}
+    # 父节点名称需以 前缀+三位数字+下划线 开头，资产ID统一为小写
+    pattern = re.compile(f'({pattern_prefix}\\d{{3}})_.*', re.IGNORECASE)
     
-    # 获取所有 transform 节点
-    all_transforms = cmds.ls(type="transform", long=True)
-    pattern = f"^{pattern_prefix}\\d{{3}}_.*"
+    def asset_id_from_parent(parent_name):
+        match = pattern.match(parent_name)
+        return match.group(id_group).lower() if match else None
     
-    for node in all_transforms:
-        node_name = node.split('|')[-1]
-        
-        if re.match(pattern, node_name, re.IGNORECASE):
-            asset_id_match = re.match(f'({pattern_prefix}\\d{{3}})_.*', node_name, re.IGNORECASE)
-            asset_id = asset_id_match.group(id_group).lower()
-            
-            # 检查是否存在 Geometry 组
-            geometry_path = f"{node}|*:Geometry"
-            geometry_groups = cmds.ls(geometry_path, long=True)
-            
-            if geometry_groups:
-                # 确保字典中有这个资产的条目
-                if asset_id not in asset_meshes:
-                    asset_meshes[asset_id] = []
-                
-                # 只添加几何体组本身，不需要单独添加内部的 mesh
-                for geo_group in geometry_groups:
-                    if geo_group not in asset_meshes[asset_id]:
-                        asset_meshes[asset_id].append(geo_group)
-    
-    return asset_meshes
+    return get_scene_index().group_geometry(asset_id_from_parent)
 
 def get_char_geometry_from_references():
     """获取场景中的角色几何体"""
@@ -70,84 +50,35 @@ def get_all_asset_geometry():
     
     return all_assets
 
-def get_fur_groups():
+def get_fur_groups(verbosity=1):
     """
     获取场景中所有毛发生长面Fur_Grp组
     
+    使用共享的场景索引：一次列出所有命名空间下的transform，再用一个忽略大小写的正则匹配
+    
+    Args:
+        verbosity: 日志详细程度，0不输出，1输出汇总，2输出每个节点的详细信息
+    
     Returns:
         dict: 角色ID到Fur_Grp节点的映射
     """
-    fur_groups = {}
-    
-    # 查找所有名称包含Fur_Grp的transform节点 - 使用多种大小写变体
-    search_patterns = [
-        "*:*Fur_Grp*", "*Fur_Grp*",           # 标准格式
-        "*:*FUR_GRP*", "*FUR_GRP*",           # 全大写格式
-        "*:*fur_grp*", "*fur_grp*",           # 全小写格式
-        "*:*Fur_grp*", "*Fur_grp*",           # 混合格式1
-        "*:*fur_Grp*", "*fur_Grp*",           # 混合格式2
-        "*:*fur*grp*", "*fur*grp*"            # 变种格式（中间可能有其他字符）
-    ]
-    
-    # 查找所有可能的毛发组
-    all_fur_groups = []
-    for pattern in search_patterns:
-        found_groups = cmds.ls(pattern, type="transform", long=True)
-        if found_groups:
-            all_fur_groups.extend(found_groups)
-    
-    # 去重
-    all_fur_groups = list(set(all_fur_groups))
+    fur_groups = get_scene_index().fur_groups()
     
-    print(f"找到 {len(all_fur_groups)} 个可能的Fur_Grp节点")
-    if len(all_fur_groups) > 0:
-        print(f"第一个找到的节点: {all_fur_groups[0]}")
-    
-    for fur_group in all_fur_groups:
-        # 提取节点名称（不包含路径）
-        node_name = fur_group.split('|')[-1]
-        print(f"处理节点: {node_name}")
-        
-        # 尝试匹配角色ID (c001, C001等格式) - 支持命名空间
-        # 先检查完整名称
-        asset_id_match = re.search(r'[cC](\d{3})', node_name)
-        
-        # 如果没找到，尝试分割命名空间后再匹配
-        if not asset_id_match and ':' in node_name:
-            namespace = node_name.split(':')[0]
-            print(f"从命名空间获取角色ID: {namespace}")
-            asset_id_match = re.search(r'[cC](\d{3})', namespace)
-        
-        if asset_id_match:
-            # 标准化资产ID格式 (c001)
-            asset_id = f"c{asset_id_match.group(1)}"
-            print(f"匹配到角色ID: {asset_id}")
-            
-            # 确保字典中有这个资产的条目
-            if asset_id not in fur_groups:
-                fur_groups[asset_id] = []
-            
-            # 添加到相应资产的列表中
-            fur_groups[asset_id].append(fur_group)
-        else:
-            print(f"未能从节点 {node_name} 中提取角色ID")
-            # 如果没有明确的角色ID，将其放在"unknown"类别中
-            if "unknown" not in fur_groups:
-                fur_groups["unknown"] = []
-            fur_groups["unknown"].append(fur_group)
-    
-    # 打印找到的组信息
-    if fur_groups:
-        print("\n找到的毛发生长面组:")
+    if verbosity >= 2:
         for asset_id, groups in fur_groups.items():
-            print(f"- 角色 {asset_id}: {len(groups)} 个组")
             for group in groups:
-                print(f"  - {group}")
-    else:
-        print("未找到任何毛发生长面Fur_Grp组")
+                print(f"匹配到毛发生长面组: {group} -> {asset_id}")
     
-    # 如果有未归类的Fur_Grp，打印警告
-    if "unknown" in fur_groups and fur_groups["unknown"]:
-        print(f"警告: 找到{len(fur_groups['unknown'])}个未能识别角色ID的Fur_Grp节点")
+    if verbosity >= 1:
+        if fur_groups:
+            print("\n找到的毛发生长面组:")
+            for asset_id, groups in fur_groups.items():
+                print(f"- 角色 {asset_id}: {len(groups)} 个组")
+        else:
+            print("未找到任何毛发生长面Fur_Grp组")
+        
+        # 如果有未归类的Fur_Grp，打印警告
+        if fur_groups.get("unknown"):
+            print(f"警告: 找到{len(fur_groups['unknown'])}个未能识别角色ID的Fur_Grp节点")
     
-    return fur_groups
\ No newline at end of file
+    return fur_groups
@@ -0,0 +1,124 @@
+"""
+导出文件后台落盘
+
+AbcExport先写到本地临时目录，导出完成后由后台线程池把文件复制到网络共享上的最终位置：
+先写入同目录下的 .part 临时文件，校验哈希一致后再原子重命名为最终文件名，最后删除本地文件。
+网络共享较慢时Maya不会在导出中途卡住，缓存目录中也不会出现写了一半的 .abc 文件。
+
+此模块只依赖标准库。
+"""
+
+import os
+import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from .export_manifest import compute_file_hash
+from . import profiling
+
+# 指定本地临时目录的环境变量
+SCRATCH_DIR_ENV = "ABC_SCRATCH_DIR"
+PART_SUFFIX = ".part"
+
+
+def scratch_path_for(scratch_dir, output_path):
+    """计算最终输出路径对应的本地临时路径
+
+    按输出目录的哈希分子目录，不同资产目录下的同名文件不会冲突。
+
+    Args:
+        scratch_dir: 本地临时目录
+        output_path: 最终输出路径
+
+    Returns:
+        str: 临时文件路径
+    """
+    output_dir = os.path.dirname(os.path.normpath(output_path)).replace('\\', '/').lower()
+    bucket = hashlib.sha1(output_dir.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(scratch_dir, bucket, os.path.basename(output_path)).replace('\\', '/')
+
+
+def finalize_file(source_path, output_path, retries=1):
+    """把本地文件复制到最终位置，校验哈希后原子重命名
+
+    Args:
+        source_path: 本地临时文件
+        output_path: 最终输出路径
+        retries: 哈希不一致时的重试次数
+
+    Returns:
+        str: 最终输出路径
+
+    Raises:
+        IOError: 重试后哈希仍不一致
+    """
+    with profiling.phase("finalize_copy"):
+        return _finalize_file(source_path, output_path, retries)
+
+
+def _finalize_file(source_path, output_path, retries):
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    part_path = output_path + PART_SUFFIX
+    source_hash = compute_file_hash(source_path)
+
+    for attempt in range(retries + 1):
+        shutil.copyfile(source_path, part_path)
+        if compute_file_hash(part_path) == source_hash:
+            os.replace(part_path, output_path)
+            profiling.count("bytes_finalized", os.path.getsize(output_path))
+            os.remove(source_path)
+            return output_path
+        print(f"复制后哈希不一致 (第{attempt + 1}次): {output_path}")
+
+    if os.path.exists(part_path):
+        os.remove(part_path)
+    raise IOError(f"复制到最终位置后哈希不一致: {output_path}")
+
+
+class OutputFinalizer:
+    """在后台线程池中把导出完成的文件移到最终位置"""
+
+    def __init__(self, scratch_dir, max_workers=4):
+        """初始化
+
+        Args:
+            scratch_dir: 本地临时目录
+            max_workers: 同时复制的文件数量
+        """
+        self.scratch_dir = scratch_dir
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+
+    def scratch_path(self, output_path):
+        """最终输出路径对应的本地临时路径"""
+        return scratch_path_for(self.scratch_dir, output_path)
+
+    def submit(self, output_path):
+        """提交一个已导出到本地临时目录的文件
+
+        Args:
+            output_path: 最终输出路径
+        """
+        self._futures[output_path] = self._pool.submit(finalize_file, self.scratch_path(output_path), output_path)
+
+    def wait(self):
+        """等待所有已提交的文件落盘
+
+        Returns:
+            dict: 最终输出路径到错误信息的映射，成功的文件为None
+        """
+        results = {}
+        for output_path, future in self._futures.items():
+            try:
+                future.result()
+                results[output_path] = None
+            except Exception as e:
+                print(f"缓存文件落盘失败: {output_path} - {str(e)}")
+                results[output_path] = str(e)
+        self._futures = {}
+        return results
+
+    def shutdown(self):
+        """等待后台任务结束并释放线程池"""
+        self._pool.shutdown(wait=True)
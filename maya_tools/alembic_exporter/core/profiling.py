@@ -0,0 +1,322 @@
+"""
+导出耗时统计
+
+为导出流程提供轻量的计时点：各阶段（资产查找、可见性切换、AbcExport、落盘等）的累计耗时和次数、
+自定义计数，以及导出期间Maya命令（maya.cmds、mel.eval）的调用次数，可选用cProfile记录完整调用栈。
+每个场景输出一份JSON和CSV耗时报告，批量导出时再合并为整个序列的报告。
+
+没有启用统计时，phase() 和 count() 不做任何事情，计时点可以一直保留在代码中。
+
+用法::
+
+    with profile_scene(scene_path, report_path):
+        export_alembic()
+"""
+
+import os
+import csv
+import json
+import time
+import pstats
+import cProfile
+import importlib
+import threading
+from contextlib import contextmanager
+
+TIMING_REPORT_NAME = "export_timing.json"
+SUMMARY_REPORT_NAME = "export_timing_summary.json"
+# 统计调用次数的Maya模块和mel函数
+MAYA_COMMAND_MODULES = ("maya.cmds",)
+MAYA_MEL_FUNCTIONS = ("eval",)
+# 报告中保留的cProfile函数数量
+PROFILE_TOP_COUNT = 30
+
+# 当前场景的统计器
+_active_profiler = None
+
+
+class ExportProfiler:
+    """累计各阶段耗时、计数和Maya命令调用次数，可在多个线程中使用"""
+
+    def __init__(self, scene=None):
+        """初始化
+
+        Args:
+            scene: 场景文件路径，写入报告
+        """
+        self.scene = scene
+        self.phases = {}
+        self.counters = {}
+        self.maya_commands = {}
+        self.top_functions = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.total_seconds = None
+
+    @contextmanager
+    def phase(self, name):
+        """累计代码块的耗时
+
+        Args:
+            name: 阶段名称
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """累计阶段耗时和次数"""
+        with self._lock:
+            phase = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+            phase["seconds"] += seconds
+            phase["calls"] += 1
+
+    def count(self, name, value=1):
+        """增加自定义计数"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_command(self, name):
+        """增加Maya命令的调用次数"""
+        with self._lock:
+            self.maya_commands[name] = self.maya_commands.get(name, 0) + 1
+
+    def stop(self):
+        """结束计时"""
+        self.total_seconds = time.perf_counter() - self._start
+
+    def as_dict(self):
+        """返回报告字典"""
+        total = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self._start
+        return {
+            "scene": self.scene,
+            "total_seconds": round(total, 3),
+            "phases": {name: {"seconds": round(phase["seconds"], 3), "calls": phase["calls"]}
+                       for name, phase in sorted(self.phases.items(), key=lambda item: -item[1]["seconds"])},
+            "counters": dict(sorted(self.counters.items())),
+            "maya_commands": dict(sorted(self.maya_commands.items(), key=lambda item: -item[1])),
+            "top_functions": self.top_functions,
+        }
+
+
+def get_profiler():
+    """获取当前启用的统计器，没有启用时返回None"""
+    return _active_profiler
+
+
+def phase(name):
+    """在当前统计器中累计代码块的耗时，没有启用统计时不做任何事情
+
+    用法::
+
+        with profiling.phase("abc_export"):
+            mel.eval(command)
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return _NULL_PHASE
+    return profiler.phase(name)
+
+
+def count(name, value=1):
+    """在当前统计器中增加计数，没有启用统计时不做任何事情"""
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.count(name, value)
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def _wrap_command(profiler, name, function):
+    def wrapper(*args, **kwargs):
+        profiler.count_command(name)
+        return function(*args, **kwargs)
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+@contextmanager
+def count_maya_commands(profiler):
+    """在代码块执行期间统计maya.cmds和mel.eval的调用次数
+
+    临时替换模块上的函数属性，所有通过 "cmds.xxx" 调用的代码都会被统计，退出时恢复。
+    没有Maya时不做任何事情。
+    """
+    patched = []
+    try:
+        targets = [(importlib.import_module(module_name), None) for module_name in MAYA_COMMAND_MODULES]
+        targets.append((importlib.import_module("maya.mel"), MAYA_MEL_FUNCTIONS))
+    except ImportError:
+        targets = []
+
+    for module, names in targets:
+        prefix = module.__name__.rsplit(".", 1)[-1]
+        for name in names or [name for name in dir(module) if not name.startswith("_")]:
+            function = getattr(module, name, None)
+            if not callable(function) or isinstance(function, type):
+                continue
+            setattr(module, name, _wrap_command(profiler, f"{prefix}.{name}", function))
+            patched.append((module, name, function))
+    try:
+        yield
+    finally:
+        for module, name, function in patched:
+            setattr(module, name, function)
+
+
+def _top_functions(profile, limit=PROFILE_TOP_COUNT):
+    """按累计耗时列出cProfile中耗时最多的函数"""
+    stats = pstats.Stats(profile)
+    rows = []
+    for (file_name, line, function), (_, calls, own, cumulative, _) in stats.stats.items():
+        rows.append({
+            "function": f"{os.path.basename(file_name)}:{line}({function})",
+            "calls": calls,
+            "own_seconds": round(own, 4),
+            "cumulative_seconds": round(cumulative, 4),
+        })
+    rows.sort(key=lambda row: -row["cumulative_seconds"])
+    return rows[:limit]
+
+
+@contextmanager
+def profile_scene(scene, report_path=None, use_cprofile=False, count_commands=True):
+    """在代码块执行期间启用统计，结束后写入报告
+
+    Args:
+        scene: 场景文件路径
+        report_path: 可选，JSON报告路径，同时写入同名的CSV；启用cProfile时还会保存同名的 .prof 文件
+        use_cprofile: 是否用cProfile记录调用栈
+        count_commands: 是否统计Maya命令的调用次数
+
+    Yields:
+        ExportProfiler: 当前统计器
+    """
+    global _active_profiler
+    profiler = ExportProfiler(scene)
+    previous = _active_profiler
+    _active_profiler = profiler
+    profile = cProfile.Profile() if use_cprofile else None
+    try:
+        with count_maya_commands(profiler) if count_commands else _NULL_PHASE:
+            if profile is not None:
+                profile.enable()
+            try:
+                yield profiler
+            finally:
+                if profile is not None:
+                    profile.disable()
+    finally:
+        _active_profiler = previous
+        profiler.stop()
+        if profile is not None:
+            profiler.top_functions = _top_functions(profile)
+        if report_path:
+            write_timing_report(profiler.as_dict(), report_path)
+            if profile is not None:
+                profile.dump_stats(os.path.splitext(report_path)[0] + ".prof")
+
+
+def _write_json(data, json_path):
+    report_dir = os.path.dirname(json_path)
+    if report_dir and not os.path.exists(report_dir):
+        os.makedirs(report_dir)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def write_timing_report(report, json_path):
+    """写入单个场景的JSON报告和同名的CSV（每个阶段一行）
+
+    Args:
+        report: ExportProfiler.as_dict() 的结果
+        json_path: JSON报告路径
+    """
+    _write_json(report, json_path)
+    with open(os.path.splitext(json_path)[0] + ".csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["phase", "seconds", "calls"])
+        for name, phase_data in report["phases"].items():
+            writer.writerow([name, phase_data["seconds"], phase_data["calls"]])
+        writer.writerow(["total", report["total_seconds"], 1])
+    print(f"导出耗时报告已保存到: {json_path}")
+
+
+def scene_report_path(scene_path):
+    """场景耗时报告的默认路径，位于场景的 abc_cache 目录"""
+    return os.path.join(os.path.dirname(scene_path), "abc_cache", TIMING_REPORT_NAME)
+
+
+def load_timing_reports(report_paths):
+    """读取多个场景的耗时报告，跳过不存在或损坏的文件"""
+    reports = []
+    for report_path in report_paths:
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                reports.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"读取耗时报告失败: {report_path} - {str(e)}")
+    return reports
+
+
+def aggregate_timing_reports(reports, output_path=None):
+    """合并多个场景的耗时报告
+
+    Args:
+        reports: 场景报告字典列表
+        output_path: 可选，合并报告的JSON路径；同名CSV中每个场景一行、每个阶段一列
+
+    Returns:
+        dict: 合并后的报告，包含各阶段总耗时、计数、Maya命令调用次数和每个场景的耗时
+    """
+    phases = {}
+    counters = {}
+    maya_commands = {}
+    scenes = []
+    for report in reports:
+        for name, phase_data in report.get("phases", {}).items():
+            total = phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+            total["seconds"] += phase_data["seconds"]
+            total["calls"] += phase_data["calls"]
+        for name, value in report.get("counters", {}).items():
+            counters[name] = counters.get(name, 0) + value
+        for name, value in report.get("maya_commands", {}).items():
+            maya_commands[name] = maya_commands.get(name, 0) + value
+        scenes.append({
+            "scene": report.get("scene"),
+            "total_seconds": report.get("total_seconds", 0.0),
+            "phases": {name: phase_data["seconds"] for name, phase_data in report.get("phases", {}).items()},
+        })
+
+    summary = {
+        "scenes": len(scenes),
+        "total_seconds": round(sum(scene["total_seconds"] for scene in scenes), 3),
+        "phases": {name: {"seconds": round(phase_data["seconds"], 3), "calls": phase_data["calls"]}
+                   for name, phase_data in sorted(phases.items(), key=lambda item: -item[1]["seconds"])},
+        "counters": dict(sorted(counters.items())),
+        "maya_commands": dict(sorted(maya_commands.items(), key=lambda item: -item[1])),
+        "per_scene": scenes,
+    }
+
+    if output_path:
+        _write_json(summary, output_path)
+        phase_names = list(summary["phases"])
+        with open(os.path.splitext(output_path)[0] + ".csv", 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["scene", "total_seconds"] + phase_names)
+            for scene in scenes:
+                writer.writerow([scene["scene"], scene["total_seconds"]] +
+                                [round(scene["phases"].get(name, 0.0), 3) for name in phase_names])
+        print(f"序列耗时报告已保存到: {output_path}")
+    return summary
@@ -0,0 +1,115 @@
+"""
+代理模型
+
+Layout和预演只需要看清角色和道具的位置和大致体积，导出配置设置了 "proxy" 时，
+导出前为任务根节点下的每个模型临时创建代理模型，导出后删除：
+
+    bbox      每个模型一个立方体，平移、旋转和缩放由模型的包围盒和世界矩阵逐帧驱动
+    decimate  模型的 worldMesh 经过 polyReduce 减面，按 "proxy_reduce" 减去的面数百分比
+
+代理模型都在世界空间下，由节点连接驱动，AbcExport逐帧求值时自动更新，不需要烘焙。
+"""
+
+import maya.cmds as cmds
+from maya_tools.alembic_exporter.core import profiling
+
+
+def _short_name(node):
+    return node.rsplit('|', 1)[-1].rsplit(':', 1)[-1]
+
+
+class ProxyGeometry:
+    """为带代理设置的导出任务临时创建代理模型，退出时删除
+
+    用法::
+
+        with ProxyGeometry(jobs) as proxies:
+            command = build_export_command(jobs, roots=[proxies.root_for(job) for job in jobs])
+            mel.eval(command)
+    """
+
+    def __init__(self, jobs):
+        """初始化
+
+        Args:
+            jobs: ExportJob列表，只处理设置了proxy的任务
+        """
+        self.jobs = [job for job in jobs if job.proxy]
+        self.roots = {}
+        self._nodes = []
+
+    def root_for(self, job):
+        """任务实际导出的根节点：有代理时为代理根节点，否则为任务的根节点"""
+        return self.roots.get(job.export_id, job.root)
+
+    def __enter__(self):
+        if not self.jobs:
+            return self
+        with profiling.phase("proxy_build"):
+            cmds.loadPlugin("matrixNodes", quiet=True)
+            for job in self.jobs:
+                try:
+                    self.roots[job.export_id] = self._build(job)
+                except RuntimeError as e:
+                    print(f"创建{job.asset_type_name} {job.export_id} 的代理模型失败，导出原始模型: {str(e)}")
+        print(f"为 {len(self.roots)} 个任务创建了代理模型")
+        return self
+
+    def _build(self, job):
+        """创建任务的代理根节点
+
+        Returns:
+            str: 代理根节点的长路径
+        """
+        mode = job.proxy["mode"]
+        group = cmds.createNode("transform", name=f"{job.export_id}_{mode}Proxy")
+        self._nodes.append(group)
+        meshes = cmds.listRelatives(job.root, allDescendents=True, type="mesh", fullPath=True,
+                                    noIntermediate=True) or []
+        for mesh in meshes:
+            name = f"{_short_name(cmds.listRelatives(mesh, parent=True)[0])}_proxy"
+            if mode == "bbox":
+                self._build_bbox(mesh, group, name)
+            else:
+                self._build_decimate(mesh, group, name, job.proxy.get("reduce"))
+        return cmds.ls(group, long=True)[0]
+
+    def _create(self, node_type, **kwargs):
+        node = cmds.createNode(node_type, skipSelect=True, **kwargs)
+        self._nodes.append(node)
+        return node
+
+    def _build_bbox(self, mesh, group, name):
+        """包围盒立方体：包围盒（模型空间）组合成矩阵，乘以模型的世界矩阵后分解到立方体的变换"""
+        cube = cmds.polyCube(width=1, height=1, depth=1, constructionHistory=False, name=name)[0]
+        cube = cmds.parent(cube, group)[0]
+        compose = self._create("composeMatrix")
+        cmds.connectAttr(f"{mesh}.boundingBoxCenter", f"{compose}.inputTranslate")
+        cmds.connectAttr(f"{mesh}.boundingBoxSize", f"{compose}.inputScale")
+        mult = self._create("multMatrix")
+        cmds.connectAttr(f"{compose}.outputMatrix", f"{mult}.matrixIn[0]")
+        cmds.connectAttr(f"{mesh}.worldMatrix[0]", f"{mult}.matrixIn[1]")
+        decompose = self._create("decomposeMatrix")
+        cmds.connectAttr(f"{mult}.matrixSum", f"{decompose}.inputMatrix")
+        for output, attr in (("outputTranslate", "translate"), ("outputRotate", "rotate"),
+                             ("outputScale", "scale"), ("outputShear", "shear")):
+            cmds.connectAttr(f"{decompose}.{output}", f"{cube}.{attr}")
+
+    def _build_decimate(self, mesh, group, name, reduce):
+        """减面模型：模型的世界空间网格经过polyReduce输出到新的mesh节点"""
+        transform = cmds.createNode("transform", name=name, parent=group, skipSelect=True)
+        shape = cmds.createNode("mesh", name=f"{name}Shape", parent=transform, skipSelect=True)
+        reduce_node = self._create("polyReduce")
+        cmds.setAttr(f"{reduce_node}.version", 1)
+        cmds.setAttr(f"{reduce_node}.termination", 0)
+        cmds.setAttr(f"{reduce_node}.percentage", reduce)
+        cmds.connectAttr(f"{mesh}.worldMesh[0]", f"{reduce_node}.inputPolymesh")
+        cmds.connectAttr(f"{reduce_node}.output", f"{shape}.inMesh")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        existing = [node for node in self._nodes if cmds.objExists(node)]
+        if existing:
+            cmds.delete(existing)
+        self._nodes = []
+        self.roots = {}
+        return False
@@ -0,0 +1,213 @@
+"""
+场景上下文
+
+按路径模板解析当前Maya文件所在的 episode/sequence/shot，并计算缓存目录。解析结果按场景路径缓存，
+同一场景的角色、道具、毛发生长面和XGen Guides导出共用一个 SceneContext，不再重复读取配置文件和解析路径。
+"""
+
+import os
+import re
+from functools import lru_cache
+import maya.cmds as cmds
+from maya_tools.common.config_manager import get_config_manager
+from .frame_range import load_frame_range_settings, get_shot_index, resolve_frame_range
+
+# 场景文件路径模板，{字段} 匹配一级目录，模板可以出现在路径中的任意位置（不限盘符和项目根目录）
+# 可在 project_config.json 的 path_templates.scene_path 中覆盖
+SCENE_PATH_TEMPLATE = "CSprojectFiles/{area}/{department}/{episode}/{sequence}/{shot}/{task}"
+DEFAULT_XGEN_MESH_CACHE = "X:/projects/CSprojectFiles/Shot/CFX/{episode}/{sequence}/{shot}"
+DEFAULT_XGEN_GUIDES_CACHE = "X:/projects/CSprojectFiles/Shot/CFX/{episode}/{sequence}/{shot}/publish/xgen_guides"
+# 静态道具共享缓存库，同一集的所有镜头共用
+DEFAULT_STATIC_PROP_STORE = "X:/projects/CSprojectFiles/Shot/Animation/{episode}/static_prop_cache"
+
+_FIELD_PATTERN = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=None)
+def compile_path_template(template):
+    """把路径模板编译为正则表达式
+
+    Args:
+        template: 路径模板，如 "CSprojectFiles/{area}/{department}/{episode}"
+
+    Returns:
+        re.Pattern: 每个字段对应一个命名分组的正则表达式
+    """
+    pattern = ""
+    position = 0
+    for match in _FIELD_PATTERN.finditer(template):
+        pattern += re.escape(template[position:match.start()])
+        pattern += f"(?P<{match.group(1)}>[^/]+)"
+        position = match.end()
+    pattern += re.escape(template[position:])
+    return re.compile(r"(?:^|/)" + pattern)
+
+
+@lru_cache(maxsize=256)
+def _parse_scene_path(scene_path, template):
+    match = compile_path_template(template).search(scene_path.replace('\\', '/').replace('//', '/'))
+    return tuple(match.groupdict().items()) if match else None
+
+
+def parse_scene_path(scene_path, template=SCENE_PATH_TEMPLATE):
+    """按模板解析场景路径，结果按 (路径, 模板) 缓存
+
+    Args:
+        scene_path: 场景文件路径
+        template: 路径模板
+
+    Returns:
+        dict: 字段名到目录名的映射，路径不符合模板时返回None
+    """
+    fields = _parse_scene_path(scene_path, template)
+    return dict(fields) if fields is not None else None
+
+
+class SceneContext:
+    """一个场景文件的路径信息和缓存目录"""
+
+    def __init__(self, scene_path, project_config=None, shot_data=None):
+        """解析场景路径
+
+        Args:
+            scene_path: 场景文件路径
+            project_config: 项目配置字典，默认使用共享的配置管理器
+            shot_data: 镜头数据字典，默认使用共享的配置管理器
+
+        Raises:
+            RuntimeError: 路径不符合项目结构
+        """
+        if project_config is None:
+            project_config = get_config_manager().project_config
+        if shot_data is None:
+            shot_data = get_config_manager().shot_data
+        path_templates = project_config.get("path_templates", {})
+
+        self.scene_path = scene_path
+        self.template = path_templates.get("scene_path", SCENE_PATH_TEMPLATE)
+        fields = parse_scene_path(scene_path, self.template)
+        if not fields:
+            raise RuntimeError("文件路径结构不符合预期，请确保文件在正确的项目结构中")
+        self.fields = fields
+
+        self.episode = fields.get("episode")
+        self.sequence = fields.get("sequence")
+        self.shot = fields.get("shot")
+        # 角色和道具缓存沿用原有命名，依次使用 sequence、shot 和 task 目录
+        self.cache_naming = (self.sequence, self.shot, fields.get("task"))
+
+        self.file_dir = os.path.dirname(scene_path)
+        self.file_name = os.path.basename(scene_path)
+        self.cache_dir = os.path.join(self.file_dir, "abc_cache")
+        self.cfx_shot_dir = path_templates.get("xgen_mesh_cache", DEFAULT_XGEN_MESH_CACHE).format(
+            episode=self.episode,
+            sequence=self.sequence,
+            shot=self.shot
+        )
+        self.fur_cache_dir = os.path.join(self.cfx_shot_dir, "publish", "xgen_mesh")
+        self.guides_cache_dir = path_templates.get("xgen_guides_cache", DEFAULT_XGEN_GUIDES_CACHE).format(
+            episode=self.episode,
+            sequence=self.sequence,
+            shot=self.shot
+        )
+        self.static_prop_store_dir = path_templates.get("static_prop_store", DEFAULT_STATIC_PROP_STORE).format(
+            episode=self.episode,
+            sequence=self.sequence,
+            shot=self.shot
+        )
+        self.frame_range_settings = load_frame_range_settings(project_config)
+        self.shot_index = get_shot_index(shot_data)
+        self._frame_range = None
+
+    @staticmethod
+    def playback_range():
+        """当前时间线的起始帧和结束帧"""
+        return cmds.playbackOptions(q=True, min=True), cmds.playbackOptions(q=True, max=True)
+
+    @staticmethod
+    def camera_names():
+        """场景中引用的文件名和相机节点名，用于从相机名称解析帧范围"""
+        names = [os.path.basename(path) for path in cmds.file(q=True, reference=True) or []]
+        names += cmds.listRelatives(cmds.ls(type="camera") or [], parent=True) or []
+        return names
+
+    def frame_range(self, refresh=False):
+        """镜头帧范围
+
+        来自 shot_data 或相机名称的结果只解析一次；退回时间线范围时不缓存，每次重新读取时间线。
+
+        Args:
+            refresh: 是否重新解析
+
+        Returns:
+            ShotFrameRange: 镜头帧范围
+        """
+        if self._frame_range is not None and not refresh:
+            return self._frame_range
+        frame_range = resolve_frame_range(
+            self.sequence, self.shot, self.shot_index, self.frame_range_settings,
+            camera_names=self.camera_names() if "camera" in self.frame_range_settings["sources"] else (),
+            playback_range=self.playback_range
+        )
+        if frame_range is None:
+            raise RuntimeError(f"无法确定镜头 {self.sequence}/{self.shot} 的帧范围")
+        if frame_range.source != "playback":
+            self._frame_range = frame_range
+        return frame_range
+
+    def scene_info(self):
+        """生成导出计划使用的场景信息字典，导出帧范围为镜头帧范围加上前后延长的帧数
+
+        Returns:
+            dict: 场景信息
+        """
+        frame_range = self.frame_range()
+        start_export_frame, end_export_frame = frame_range.export_range
+        episode, sequence, shot = self.cache_naming
+        return {
+            "start_frame": frame_range.start_frame,
+            "end_frame": frame_range.end_frame,
+            "start_export_frame": start_export_frame,
+            "end_export_frame": end_export_frame,
+            "frame_range_source": frame_range.source,
+            "current_file": self.scene_path,
+            "file_dir": self.file_dir,
+            "cache_dir": self.cache_dir,
+            "fur_cache_dir": self.fur_cache_dir,
+            "episode": episode,
+            "sequence": sequence,
+            "shot": shot,
+            "fur_episode": self.episode,
+            "fur_sequence": self.sequence,
+            "fur_shot": self.shot,
+            "file_name": self.file_name
+        }
+
+    def __repr__(self):
+        return f"SceneContext({self.episode!r}, {self.sequence!r}, {self.shot!r})"
+
+
+_scene_context = None
+
+
+def get_scene_context(refresh=False):
+    """获取当前场景的上下文，场景路径未变化时复用
+
+    Args:
+        refresh: 是否强制重新解析
+
+    Returns:
+        SceneContext: 场景上下文
+
+    Raises:
+        RuntimeError: 场景未保存或路径不符合项目结构
+    """
+    global _scene_context
+    current_file = cmds.file(q=True, sn=True)
+    if not current_file:
+        raise RuntimeError("请先保存Maya文件")
+    if refresh or _scene_context is None or _scene_context.scene_path != current_file:
+        _scene_context = SceneContext(current_file)
+        print(f"场景路径解析: episode={_scene_context.episode}, sequence={_scene_context.sequence}, "
+              f"shot={_scene_context.shot}")
+    return _scene_context
@@ -106,6 +106,51 @@ class SceneInfoManager:
         # 转换为列表并排序
         return sorted(list(collections))
     
+    @staticmethod
+    def get_xgen_guides(asset_id=None, name_pattern=r'guide'):
+        """按Collection查找场景中的XGen guides物体，用于无界面导出
+        
+        guides物体是短名称匹配name_pattern（不区分大小写）的transform，所属Collection取自其长路径中
+        第一个 col_xxx 名称。父节点已匹配的子节点不会重复列出。
+        
+        Args:
+            asset_id (str, optional): 资产ID，如'c001'。如果提供，只查找该资产命名空间下的guides
+            name_pattern (str): guides物体短名称的正则表达式
+        
+        Returns:
+            dict: (资产ID, Collection名称) 到guides物体列表的映射，如 {('c001', 'COL_Hair'): ['C001_rig:Hair_guides']}
+        """
+        guide_pattern = re.compile(name_pattern, re.IGNORECASE)
+        collection_pattern = re.compile(r'col_[a-zA-Z][a-zA-Z0-9_]*', re.IGNORECASE)
+        asset_id_pattern = re.compile(r'[cC]\d{3}')
+        
+        guides = {}
+        matched_paths = []
+        # 长路径排序后父节点总在子节点之前
+        for node in sorted(mc.ls(type='transform', long=True) or []):
+            short_name = node.rsplit('|', 1)[-1]
+            if not guide_pattern.search(short_name.rsplit(':', 1)[-1]):
+                continue
+            if any(node.startswith(parent + '|') for parent in matched_paths):
+                continue
+            
+            namespace = short_name.split(':')[0] if ':' in short_name else ''
+            id_match = asset_id_pattern.match(namespace)
+            if not id_match:
+                continue
+            node_asset_id = id_match.group().lower()
+            if asset_id and node_asset_id != asset_id.lower():
+                continue
+            
+            collection_match = collection_pattern.search(node)
+            if not collection_match:
+                continue
+            
+            matched_paths.append(node)
+            guides.setdefault((node_asset_id, collection_match.group()), []).append(node)
+        
+        return guides
+    
     @classmethod
     def refresh_scene_info(cls):
         """刷新场景信息，获取最新的资产ID和Collection列表
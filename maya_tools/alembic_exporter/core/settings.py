@@ -1,77 +1,278 @@
 import os
 import json
 
+# Alembic导出设置文件
+SETTINGS_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "alembic_settings.json"
+)
+
+# 设置项到AbcExport参数的映射，按此顺序生成参数
+FLAG_NAMES = [
+    ("verbose", "verbose"),
+    ("renderable_only", "renderableOnly"),
+    ("no_intermediate", "noIntermediate"),
+    ("strip_namespaces", "stripNamespaces"),
+    ("write_color_sets", "writeColorSets"),
+    ("write_face_sets", "writeFaceSets"),
+    ("world_space", "worldSpace"),
+    ("write_visibility", "writeVisibility"),
+    ("write_creases", "writeCreases"),
+    ("write_uv_sets", "writeUVSets"),
+    ("uv_write", "uvWrite"),
+    ("euler_filter", "eulerFilter"),
+    ("step", "step"),
+    ("data_format", "dataFormat"),
+]
+
+# 代理导出模式：bbox 每个模型导出为随包围盒变化的立方体，decimate 导出减面后的模型
+PROXY_MODES = ("bbox", "decimate")
+# decimate 模式默认减去的面数百分比
+DEFAULT_PROXY_REDUCE = 90
+
+# 内置导出配置，在基础设置上覆盖的设置项；alembic_settings.json 的 "profiles" 可以覆盖或新增配置
+DEFAULT_PROFILES = {
+    # 角色和道具动画缓存，直接使用基础设置
+    "anim": {},
+    # 毛发生长面需要导出隐藏和中间对象
+    "fur": {
+        "renderable_only": False,
+        "no_intermediate": False,
+    },
+    # XGen Guides只需要世界空间、可见性和UV
+    "guides": {
+        "verbose": False,
+        "renderable_only": False,
+        "no_intermediate": False,
+        "strip_namespaces": False,
+        "write_color_sets": False,
+        "write_face_sets": False,
+        "world_space": True,
+        "write_visibility": True,
+        "write_creases": False,
+        "write_uv_sets": True,
+        "uv_write": True,
+        "euler_filter": False,
+        "data_format": None,
+    },
+    # Layout预览用的轻量缓存：每4帧采样一次，只导出包围盒，不写UV、颜色集、面集和折痕
+    "layout_proxy": {
+        "write_color_sets": False,
+        "write_face_sets": False,
+        "write_creases": False,
+        "write_uv_sets": False,
+        "uv_write": False,
+        "step": 4,
+        "proxy": "bbox",
+    },
+    # 预演用的减面缓存：每2帧采样一次，模型减去90%的面
+    "layout_decimate": {
+        "write_color_sets": False,
+        "write_face_sets": False,
+        "write_creases": False,
+        "write_uv_sets": False,
+        "uv_write": False,
+        "step": 2,
+        "proxy": "decimate",
+        "proxy_reduce": DEFAULT_PROXY_REDUCE,
+    },
+}
+
+# 设置文件的缓存：(修改时间, 设置字典)，以及按修改时间缓存的导出配置
+_settings_cache = (None, None)
+_profiles_cache = (None, None)
+
+
+def _settings_mtime():
+    return os.path.getmtime(SETTINGS_FILE) if os.path.exists(SETTINGS_FILE) else None
+
+
+def load_settings_file():
+    """读取设置文件，文件未修改时直接返回缓存
+
+    Returns:
+        dict: 设置文件内容，文件不存在或损坏时返回空字典
+    """
+    global _settings_cache
+    mtime = _settings_mtime()
+    if _settings_cache[0] is not None and _settings_cache[0] == mtime:
+        return _settings_cache[1]
+
+    data = {}
+    if mtime is not None:
+        try:
+            with open(SETTINGS_FILE, 'r') as f:
+                data = json.load(f)
+            print(f"从配置文件加载Alembic导出设置: {SETTINGS_FILE}")
+        except Exception as e:
+            print(f"加载Alembic设置出错，使用默认值: {str(e)}")
+    else:
+        print(f"未找到Alembic设置文件，使用默认值: {SETTINGS_FILE}")
+    _settings_cache = (mtime, data)
+    return data
+
+
+def render_flags(settings):
+    """把设置渲染为AbcExport的job参数
+
+    AbcExport的开关参数不接受取值：值为True时只写参数名，为False或None时省略；其他值写为 "-参数 值"。
+
+    Args:
+        settings: 设置字典
+
+    Returns:
+        str: 参数字符串，如 "-verbose -worldSpace -dataFormat ogawa"
+    """
+    parts = []
+    for key, flag in FLAG_NAMES:
+        value = settings.get(key)
+        if value is True:
+            parts.append(f"-{flag}")
+        elif value is False or value is None:
+            continue
+        else:
+            parts.append(f"-{flag} {value}")
+    return " ".join(parts)
+
+
+class ExportProfile:
+    """一组命名的导出设置，AbcExport参数只在创建时渲染一次"""
+
+    def __init__(self, name, settings):
+        """初始化导出配置
+
+        Args:
+            name: 配置名称，如 "anim"、"fur"
+            settings: 完整的设置字典，除AbcExport参数外还可以包含 "proxy"（代理导出模式）和 "proxy_reduce"
+
+        Raises:
+            ValueError: 代理导出模式不存在
+        """
+        self.name = name
+        self.settings = dict(settings)
+        self.flag_string = render_flags(self.settings)
+        proxy_mode = self.settings.get("proxy")
+        if proxy_mode and proxy_mode not in PROXY_MODES:
+            raise ValueError(f"导出配置 {name} 的代理模式无效: {proxy_mode}，可用模式: {', '.join(PROXY_MODES)}")
+
+    @property
+    def proxy(self):
+        """代理导出设置，如 {"mode": "decimate", "reduce": 90}；不使用代理时返回None"""
+        mode = self.settings.get("proxy")
+        if not mode:
+            return None
+        proxy = {"mode": mode}
+        if mode == "decimate":
+            proxy["reduce"] = self.settings.get("proxy_reduce", DEFAULT_PROXY_REDUCE)
+        return proxy
+
+    def as_dict(self):
+        """返回设置字典"""
+        return dict(self.settings)
+
+    def __repr__(self):
+        return f"ExportProfile({self.name!r}, {self.flag_string!r})"
+
+
+def get_export_profiles():
+    """获取所有导出配置，设置文件未修改时复用已渲染的配置
+
+    Returns:
+        dict: 配置名称到ExportProfile的映射
+    """
+    global _profiles_cache
+    mtime = _settings_mtime()
+    if _profiles_cache[1] is not None and _profiles_cache[0] == mtime:
+        return _profiles_cache[1]
+
+    data = load_settings_file()
+    base = AlembicExportSettings.defaults()
+    base.update({key: value for key, value in data.items() if key in base})
+
+    overrides = {name: dict(profile) for name, profile in DEFAULT_PROFILES.items()}
+    for name, profile in (data.get("profiles") or {}).items():
+        overrides.setdefault(name, {}).update(profile)
+
+    profiles = {}
+    for name, profile in overrides.items():
+        settings = dict(base)
+        settings.update(profile)
+        profiles[name] = ExportProfile(name, settings)
+    _profiles_cache = (mtime, profiles)
+    return profiles
+
+
+def get_export_profile(name):
+    """获取指定名称的导出配置
+
+    Args:
+        name: 配置名称
+
+    Returns:
+        ExportProfile: 导出配置
+
+    Raises:
+        KeyError: 配置不存在
+    """
+    profiles = get_export_profiles()
+    if name not in profiles:
+        raise KeyError(f"未定义的导出配置: {name}，可用配置: {', '.join(sorted(profiles))}")
+    return profiles[name]
+
+
 class AlembicExportSettings:
     def __init__(self):
         # 默认设置
-        self.verbose = True
-        self.renderable_only = True
-        self.strip_namespaces = False
-        self.write_color_sets = True
-        self.write_face_sets = True
-        self.world_space = True
-        self.write_visibility = True
-        self.write_creases = True
-        self.write_uv_sets = True
-        self.uv_write = True
-        self.euler_filter = True
-        self.data_format = "ogawa"
-        
+        for key, value in self.defaults().items():
+            setattr(self, key, value)
+
         # 从JSON文件加载设置
         self._load_settings_from_json()
-    
+
+    @staticmethod
+    def defaults():
+        """返回默认设置字典"""
+        return {
+            "verbose": True,
+            "renderable_only": True,
+            "no_intermediate": True,
+            "strip_namespaces": False,
+            "write_color_sets": True,
+            "write_face_sets": True,
+            "world_space": True,
+            "write_visibility": True,
+            "write_creases": True,
+            "write_uv_sets": True,
+            "uv_write": True,
+            "euler_filter": True,
+            "data_format": "ogawa"
+        }
+
     def _load_settings_from_json(self):
-        """从JSON文件加载Alembic导出设置"""
-        try:
-            # 定位data目录下的alembic_settings.json
-            module_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            settings_file = os.path.join(module_dir, "data", "alembic_settings.json")
-            
-            if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                
-                # 更新对象属性
-                for key, value in settings.items():
-                    if hasattr(self, key):
-                        setattr(self, key, value)
-                        
-                print(f"从配置文件加载Alembic导出设置: {settings_file}")
-            else:
-                print(f"未找到Alembic设置文件，使用默认值: {settings_file}")
-        except Exception as e:
-            print(f"加载Alembic设置出错，使用默认值: {str(e)}")
-    
+        """从JSON文件加载Alembic导出设置，文件未修改时使用缓存"""
+        # 更新对象属性
+        for key, value in load_settings_file().items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
     def as_dict(self):
         """返回设置字典"""
-        return {
-            "verbose": self.verbose,
-            "renderable_only": self.renderable_only,
-            "strip_namespaces": self.strip_namespaces,
-            "write_color_sets": self.write_color_sets,
-            "write_face_sets": self.write_face_sets,
-            "world_space": self.world_space,
-            "write_visibility": self.write_visibility,
-            "write_creases": self.write_creases,
-            "write_uv_sets": self.write_uv_sets,
-            "uv_write": self.uv_write,
-            "euler_filter": self.euler_filter,
-            "data_format": self.data_format
-        }
-    
+        return {key: getattr(self, key) for key in self.defaults()}
+
     def save_settings(self):
-        """将当前设置保存到JSON文件"""
+        """将当前设置保存到JSON文件，保留文件中的导出配置"""
         try:
-            module_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            settings_file = os.path.join(module_dir, "data", "alembic_settings.json")
-            
             # 确保目录存在
-            os.makedirs(os.path.dirname(settings_file), exist_ok=True)
-            
-            with open(settings_file, 'w') as f:
-                json.dump(self.as_dict(), f, indent=4)
-                
-            print(f"保存Alembic设置到: {settings_file}")
+            os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
+
+            data = self.as_dict()
+            profiles = load_settings_file().get("profiles")
+            if profiles:
+                data["profiles"] = profiles
+
+            with open(SETTINGS_FILE, 'w') as f:
+                json.dump(data, f, indent=4)
+
+            print(f"保存Alembic设置到: {SETTINGS_FILE}")
             return True
         except Exception as e:
             print(f"保存Alembic设置失败: {str(e)}")
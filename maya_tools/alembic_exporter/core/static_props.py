@@ -0,0 +1,193 @@
+"""
+静态道具缓存去重
+
+整个帧范围内没有动画的道具（在几帧上采样世界矩阵和模型包围盒，结果全部相同），每个镜头导出的缓存内容都一样。
+这类道具只导出起始帧的一个采样，缓存与镜头的帧范围无关，保存在同一集所有镜头共享的缓存库中，
+按 "引用文件 + 采样到的摆放状态 + 导出参数" 的哈希存放；
+其他镜头命中同一哈希时直接把缓存库中的文件硬链接到镜头的 abc_cache/<资产ID> 下（不支持硬链接时复制），不再导出。
+
+缓存库的读写只依赖标准库，采样需要Maya。
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+try:
+    import maya.cmds as mc
+except ImportError:
+    # 缓存库部分可以在Maya外使用和测试
+    mc = None
+
+# 采样的帧数（包含首尾帧）
+SAMPLE_FRAME_COUNT = 5
+# 比较矩阵和包围盒时保留的小数位数
+SAMPLE_PRECISION = 5
+PART_SUFFIX = ".part"
+
+
+def sample_frames(start_frame, end_frame, count=SAMPLE_FRAME_COUNT):
+    """在帧范围内均匀选取采样帧
+
+    Args:
+        start_frame: 起始帧
+        end_frame: 结束帧
+        count: 采样帧数
+
+    Returns:
+        list: 去重后的采样帧列表
+    """
+    if count <= 1 or end_frame <= start_frame:
+        return [start_frame]
+    step = (end_frame - start_frame) / float(count - 1)
+    return sorted({round(start_frame + step * index, 3) for index in range(count)})
+
+
+def static_frame_range(frame_range):
+    """静态道具导出使用的帧范围：只导出起始帧，一个采样的缓存可以用于任何帧范围的镜头
+
+    Args:
+        frame_range: 镜头的 (起始帧, 结束帧)
+
+    Returns:
+        tuple: (起始帧, 起始帧)
+    """
+    return (frame_range[0], frame_range[0])
+
+
+def static_prop_key(source, snapshot, flags):
+    """计算静态道具在缓存库中的键
+
+    Args:
+        source: 引用文件的信息，如 {"path": 路径, "size": 大小, "mtime": 修改时间}
+        snapshot: 静态道具的摆放状态（世界矩阵和包围盒）
+        flags: 导出参数字符串
+
+    Returns:
+        str: 十六进制SHA1
+    """
+    content = json.dumps({"source": source, "snapshot": snapshot, "flags": flags}, sort_keys=True)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _round_values(values):
+    if isinstance(values, (list, tuple)):
+        return [_round_values(value) for value in values]
+    return round(float(values), SAMPLE_PRECISION)
+
+
+def sample_static_snapshot(root, frames):
+    """在采样帧上读取根节点下所有transform的世界矩阵和模型包围盒
+
+    Args:
+        root: 导出的根节点
+        frames: 采样帧列表
+
+    Returns:
+        list | None: 所有采样帧一致时返回该状态，有任何变化时返回None
+    """
+    transforms = [root] + (mc.listRelatives(root, allDescendents=True, type="transform", fullPath=True) or [])
+    meshes = mc.listRelatives(root, allDescendents=True, type="mesh", fullPath=True, noIntermediate=True) or []
+    snapshot = None
+    for frame in frames:
+        state = [_round_values(mc.getAttr(f"{node}.worldMatrix[0]", time=frame)) for node in transforms]
+        state += [_round_values(mc.getAttr(f"{mesh}.boundingBoxMin", time=frame) +
+                                mc.getAttr(f"{mesh}.boundingBoxMax", time=frame)) for mesh in meshes]
+        if snapshot is None:
+            snapshot = state
+        elif state != snapshot:
+            return None
+    return snapshot
+
+
+def reference_source(root):
+    """根节点所属引用文件的路径、大小和修改时间，不是引用节点时返回None"""
+    if not mc.referenceQuery(root, isNodeReferenced=True):
+        return None
+    path = mc.referenceQuery(root, filename=True, withoutCopyNumber=True).replace('\\', '/')
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return {"path": path.lower(), "size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+
+def find_static_prop_key(job):
+    """判断道具任务是否静态，并计算缓存库的键
+
+    Args:
+        job: 道具的ExportJob
+
+    Returns:
+        str | None: 静态道具返回缓存库的键，有动画或无法判断时返回None
+    """
+    source = reference_source(job.root)
+    if source is None:
+        return None
+    snapshot = sample_static_snapshot(job.root, sample_frames(*job.frame_range))
+    if snapshot is None:
+        return None
+    return static_prop_key(source, snapshot, job.flags)
+
+
+def _link_or_copy(source_path, target_path):
+    """把文件硬链接到目标路径（先写临时文件再原子替换），不支持硬链接时复制"""
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        # 已经是同一个文件；对同一文件的两个硬链接重命名不会生效
+        return
+    target_dir = os.path.dirname(target_path)
+    if target_dir:
+        os.makedirs(target_dir, exist_ok=True)
+    part_path = target_path + PART_SUFFIX
+    if os.path.exists(part_path):
+        os.remove(part_path)
+    try:
+        os.link(source_path, part_path)
+    except OSError:
+        shutil.copyfile(source_path, part_path)
+    os.replace(part_path, target_path)
+
+
+class StaticPropStore:
+    """静态道具的共享缓存库"""
+
+    def __init__(self, store_dir):
+        """初始化
+
+        Args:
+            store_dir: 缓存库目录，与镜头缓存目录在同一个卷上时才能使用硬链接
+        """
+        self.store_dir = store_dir
+
+    def path_for(self, key):
+        """键对应的缓存库文件路径"""
+        return os.path.join(self.store_dir, key[:2], f"{key}.abc").replace('\\', '/')
+
+    def has(self, key):
+        """缓存库中是否已有该键的文件"""
+        return os.path.exists(self.path_for(key))
+
+    def link(self, key, output_path):
+        """把缓存库中的文件链接到镜头的输出路径
+
+        Args:
+            key: 缓存库的键
+            output_path: 镜头的输出路径
+        """
+        _link_or_copy(self.path_for(key), output_path)
+
+    def add(self, key, file_path):
+        """把刚导出的文件加入缓存库，并把镜头中的文件替换为指向缓存库的链接
+
+        Args:
+            key: 缓存库的键
+            file_path: 导出的文件路径
+
+        Returns:
+            str: 缓存库文件路径
+        """
+        store_path = self.path_for(key)
+        if not os.path.exists(store_path):
+            _link_or_copy(file_path, store_path)
+        self.link(key, file_path)
+        return store_path
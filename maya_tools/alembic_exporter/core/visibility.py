@@ -0,0 +1,85 @@
+"""
+几何体可见性覆盖
+
+毛发生长面的几何体在动画场景中通常是隐藏的，直接导出时缓存中也是隐藏状态。
+VisibilityOverride 在导出期间临时显示这些节点及其子transform，退出时一次性恢复原始可见性，
+导出失败或被取消时同样会恢复。
+"""
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+from maya_tools.alembic_exporter.core import profiling
+
+
+class VisibilityOverride:
+    """临时显示节点及其所有子transform，退出时恢复原始可见性
+
+    子节点用一次带类型过滤的 listRelatives 收集，可见性通过 OpenMaya 批量读取，
+    修改记录在一个 MDGModifier 中，退出时 undoIt 一次性恢复，导出失败时同样会恢复。
+
+    用法::
+
+        with VisibilityOverride(fur_roots):
+            mel.eval(command)
+    """
+
+    def __init__(self, roots):
+        """初始化可见性覆盖
+
+        Args:
+            roots: 根节点或根节点列表
+        """
+        if isinstance(roots, str):
+            roots = [roots]
+        self.roots = list(roots)
+        self.processed_count = 0
+        self.hidden_count = 0
+        self._modifier = None
+
+    def _collect_nodes(self):
+        """收集根节点及其所有子transform的长路径"""
+        if not self.roots:
+            return []
+        roots = cmds.ls(self.roots, long=True) or []
+        descendants = cmds.listRelatives(roots, allDescendents=True, type="transform", fullPath=True) or []
+        # 保持顺序去重
+        return list(dict.fromkeys(roots + descendants))
+
+    def __enter__(self):
+        with profiling.phase("visibility"):
+            return self._override()
+
+    def _override(self):
+        selection = om.MSelectionList()
+        for node in self._collect_nodes():
+            try:
+                selection.add(node)
+            except RuntimeError as e:
+                print(f"处理节点 {node} 时出错: {str(e)}")
+
+        modifier = om.MDGModifier()
+        for index in range(selection.length()):
+            plug = om.MFnDependencyNode(selection.getDependNode(index)).findPlug("visibility", False)
+            self.processed_count += 1
+            # 锁定或被连接驱动的可见性无法直接修改，保持原样
+            if plug.isLocked or plug.isDestination or plug.asBool():
+                continue
+            modifier.newPlugValueBool(plug, True)
+            self.hidden_count += 1
+
+        modifier.doIt()
+        self._modifier = modifier
+        print(f"处理了 {self.processed_count} 个节点，临时显示了 {self.hidden_count} 个隐藏的几何体")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._modifier is None:
+            return False
+        try:
+            with profiling.phase("visibility"):
+                self._modifier.undoIt()
+            print("已恢复几何体的原始可见性状态")
+        except RuntimeError as e:
+            print(f"恢复几何体可见性时出错: {str(e)}")
+        self._modifier = None
+        return False
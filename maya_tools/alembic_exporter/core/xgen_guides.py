@@ -1,12 +1,15 @@
+import os
 import maya.cmds as mc
-from maya_tools.common.config_manager import ConfigManager
-from maya_tools.alembic_exporter.export import export_xgen_guides
+from maya_tools.common.config_manager import get_config_manager
+from maya_tools.alembic_exporter.export import export_xgen_guides, plan_guide_exports, run_guide_exports
+from maya_tools.alembic_exporter.core.scene_info import SceneInfoManager
+from maya_tools.alembic_exporter.core.scene_context import get_scene_context
 
 class XGenGuidesManager:
     def __init__(self):
         """初始化XGen Guides管理器"""
-        # 创建配置管理器实例
-        self.config_manager = ConfigManager()
+        # 使用共享的配置管理器实例
+        self.config_manager = get_config_manager()
         
     @staticmethod
     def get_selected_guides():
@@ -31,7 +34,8 @@ class XGenGuidesManager:
             return node_name.split(':')[-1]
         return node_name
 
-    def export_guides(self, guides_list, asset_id=None, collection=None, start_frame=None, end_frame=None):
+    def export_guides(self, guides_list, asset_id=None, collection=None, start_frame=None, end_frame=None,
+                      export_dir=None):
         """导出guides到abc文件
         
         Args:
@@ -40,6 +44,7 @@ class XGenGuidesManager:
             collection (str): Collection名称，如COL_Hair
             start_frame (int, optional): 开始帧. Defaults to None.
             end_frame (int, optional): 结束帧. Defaults to None.
+            export_dir (str, optional): 导出目录，为None时弹出目录选择对话框
         
         Returns:
             bool: 是否成功导出至少一个文件
@@ -56,56 +61,80 @@ class XGenGuidesManager:
             print("错误：未提供collection名称")
             return False
             
-        # 让用户选择导出目录（只选择一次）
-        export_dir = mc.fileDialog2(
-            fileMode=3,  # 3表示目录选择模式
-            caption="选择导出目录",
-            okCaption="选择"
-        )
-        
-        if not export_dir:  # 用户取消选择
-            print("错误：用户取消选择导出目录")
-            return False
-            
-        export_dir = export_dir[0]  # fileDialog2返回的是列表
-        print(f"选择的导出目录: {export_dir}")
-            
-        # 创建guide计数字典
-        guide_counts = {}
-        successful_exports = 0
-        
-        # 遍历每个guides物体进行导出
-        for guide in guides_list:
-            # 获取不带namespace的名称用于文件命名
-            guide_name = self._remove_namespace(guide)
-            print(f"\n处理guide: {guide_name} (原始名称: {guide})")
-            
-            # 获取当前guide的计数，如果不存在则初始化为1
-            guide_counts[guide_name] = guide_counts.get(guide_name, 0) + 1
-            current_count = guide_counts[guide_name]
+        if export_dir is None:
+            # 默认从当前镜头的CFX目录开始选择
+            dialog_kwargs = {}
+            try:
+                cfx_shot_dir = get_scene_context().cfx_shot_dir
+                if os.path.isdir(cfx_shot_dir):
+                    dialog_kwargs["startingDirectory"] = cfx_shot_dir
+            except RuntimeError:
+                pass
             
-            # 构建导出ID（包含序号）
-            export_id = f"{asset_id}_{current_count:02d}"
-            print(f"导出ID: {export_id}")
-            
-            # 使用统一的导出函数，传入原始guide名称（带namespace）用于导出
-            exported_files = export_xgen_guides(
-                [guide], 
-                export_id, 
-                collection, 
-                start_frame, 
-                end_frame, 
-                export_dir
+            # 让用户选择导出目录（只选择一次）
+            export_dir = mc.fileDialog2(
+                fileMode=3,  # 3表示目录选择模式
+                caption="选择导出目录",
+                okCaption="选择",
+                **dialog_kwargs
             )
             
-            if exported_files:
-                successful_exports += 1
-                print(f"成功导出guide {guide_name} 到: {exported_files[0]}")
-            else:
-                print(f"导出 {guide_name} 失败")
-                
+            if not export_dir:  # 用户取消选择
+                print("错误：用户取消选择导出目录")
+                return False
+            
+            export_dir = export_dir[0]  # fileDialog2返回的是列表
+            print(f"选择的导出目录: {export_dir}")
+        
+        # 所有guides合并为一次导出，同名guide按出现顺序编号为 {asset_id}_01、{asset_id}_02...
+        exported_files = export_xgen_guides(
+            guides_list,
+            asset_id,
+            collection,
+            start_frame,
+            end_frame,
+            export_dir,
+            number_guides=True
+        )
+        
         print(f"\n导出总结:")
         print(f"- 总计处理: {len(guides_list)} 个guides")
-        print(f"- 成功导出: {successful_exports} 个文件")
+        print(f"- 成功导出: {len(exported_files)} 个文件")
         
-        return successful_exports > 0  # 如果至少有一个guide被成功导出，返回True
\ No newline at end of file
+        return len(exported_files) > 0  # 如果至少有一个guide被成功导出，返回True
+
+
+def export_scene_guides(asset_id=None, export_dir=None, start_frame=None, end_frame=None):
+    """无界面导出当前场景中所有资产的XGen Guides，可用于批量导出
+    
+    guides按资产和Collection自动查找（见SceneInfoManager.get_xgen_guides），导出目录默认由项目配置的
+    xgen_guides_cache 路径模板生成，所有guides合并为一次AbcExport导出。
+    
+    Args:
+        asset_id (str, optional): 只导出指定资产，如c001
+        export_dir (str, optional): 导出目录，默认使用当前镜头的guides缓存目录
+        start_frame (float, optional): 开始帧，默认使用镜头的导出帧范围（与模型缓存相同）
+        end_frame (float, optional): 结束帧，默认使用镜头的导出帧范围
+    
+    Returns:
+        list: 导出的文件路径列表
+    """
+    context = get_scene_context()
+    if export_dir is None:
+        export_dir = context.guides_cache_dir
+    if start_frame is None or end_frame is None:
+        export_start, export_end = context.frame_range().export_range
+        start_frame = export_start if start_frame is None else start_frame
+        end_frame = export_end if end_frame is None else end_frame
+    
+    guide_groups = SceneInfoManager.get_xgen_guides(asset_id)
+    if not guide_groups:
+        print("场景中未找到任何XGen guides")
+        return []
+    
+    exports = []
+    for (guide_asset_id, collection), guides in sorted(guide_groups.items()):
+        print(f"{guide_asset_id} {collection}: {len(guides)} 个guides")
+        exports.extend(plan_guide_exports(guides, guide_asset_id, collection, export_dir, number_guides=True))
+    
+    return run_guide_exports(exports, start_frame, end_frame)
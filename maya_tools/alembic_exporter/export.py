@@ -1,144 +1,26 @@
-import maya.cmds as cmds
 import maya.mel as mel
-from maya_tools.alembic_exporter.core.settings import AlembicExportSettings
+from maya_tools.alembic_exporter.core.settings import get_export_profile
 from maya_tools.alembic_exporter.core.helpers import get_char_geometry_from_references, get_prop_geometry_from_references, get_fur_groups
+from maya_tools.alembic_exporter.core.export_plan import ExportPlanner, ASSET_TYPE_NAMES
+from maya_tools.alembic_exporter.core.export_executor import ExportExecutor
+from maya_tools.alembic_exporter.core.export_events import ExportCancelled
+from maya_tools.alembic_exporter.core.output_finalizer import SCRATCH_DIR_ENV
+from maya_tools.alembic_exporter.core.static_props import StaticPropStore
+from maya_tools.alembic_exporter.core import profiling
+from maya_tools.alembic_exporter.chunked_export import export_plan_chunked
+from maya_tools.alembic_exporter.core.scene_context import SceneContext, get_scene_context
 import os
-import json
-import re
-
-# 导入ConfigManager
-from maya_tools.common.config_manager import ConfigManager
 
 
 def _get_scene_info():
-    """获取场景信息，包括帧范围、文件路径和项目结构信息"""
-    # 加载配置
-    config_manager = ConfigManager()
-    
-    # 获取当前时间线的起始帧和结束帧
-    start_frame = cmds.playbackOptions(q=True, min=True)
-    end_frame = cmds.playbackOptions(q=True, max=True)
-    
-    # 计算导出帧范围
-    start_export_frame = 50
-    end_export_frame = end_frame + 4
-    
-    # 获取当前Maya文件路径并创建缓存目录
-    current_file = cmds.file(q=True, sn=True)
-    if not current_file:
-        raise RuntimeError("请先保存Maya文件")
-        
-    # 解析路径信息
-    normalized_path = current_file.replace('\\', '/').replace('//', '/')
-    path_parts = normalized_path.split('/')
-    print(f"\n======== Maya文件路径解析 ========")
-    print(f"Maya文件路径: {normalized_path}")
-    print(f"路径部分: {path_parts}")
-    
-    # 常规路径解析（用于普通的角色和道具导出）
-    try:
-        project_index = path_parts.index("CSprojectFiles")
-        
-        # 提取标准路径组件 - 用于角色和道具（原始索引）
-        char_prop_episode = path_parts[project_index + 4] 
-        char_prop_sequence = path_parts[project_index + 5] 
-        char_prop_shot = path_parts[project_index + 6]
-        print(f"角色和道具路径解析: episode={char_prop_episode}, sequence={char_prop_sequence}, shot={char_prop_shot}")
-        
-        # 为毛发生长面提取正确的路径组件（修正后的索引）
-        fur_episode = path_parts[project_index + 3] 
-        fur_sequence = path_parts[project_index + 4] 
-        fur_shot = path_parts[project_index + 5] 
-        print(f"毛发生长面路径解析: episode={fur_episode}, sequence={fur_sequence}, shot={fur_shot}")
-        
-    except (ValueError, IndexError) as e:
-        print(f"路径解析错误: {str(e)}")
-        print(f"路径部分: {path_parts}")
-        raise RuntimeError("文件路径结构不符合预期，请确保文件在正确的项目结构中")
-        
-    file_dir = os.path.dirname(current_file)
-    cache_dir = os.path.join(file_dir, "abc_cache")
-    
-    # 创建缓存主目录
-    if not os.path.exists(cache_dir):
-        os.makedirs(cache_dir)
-    
-    # 从文件名中提取额外信息
-    file_name = os.path.basename(current_file)
-    print(f"\n======== 文件名分析 ========")
-    print(f"Maya文件名: {file_name}")
-    
-    # 尝试从文件名提取sequence和shot
-    seq_match = re.search(r'(Sq\d+)', file_name)
-    shot_match = re.search(r'(Sc\d+)', file_name)
-    
-    file_sequence = None
-    file_shot = None
-    
-    if seq_match:
-        file_sequence = seq_match.group(1)
-        print(f"从文件名提取的sequence: {file_sequence}")
-        # 如果从路径中提取失败，使用文件名中的
-        if not fur_sequence:
-            fur_sequence = file_sequence
-    
-    if shot_match:
-        file_shot = shot_match.group(1)
-        print(f"从文件名提取的shot: {file_shot}")
-        # 如果从路径中提取失败，使用文件名中的
-        if not fur_shot:
-            fur_shot = file_shot
-
-    # 分析期望的路径与当前路径的差异
-    print(f"\n======== 路径结构分析 ========")
-    print(f"角色和道具: episode={char_prop_episode}, sequence={char_prop_sequence}, shot={char_prop_shot}")
-    print(f"毛发生长面: episode={fur_episode}, sequence={fur_sequence}, shot={fur_shot}")
-    print(f"从文件名提取: sequence={file_sequence}, shot={file_shot}")
-    
-    # 从配置中获取毛发生长面路径模板
-    xgen_mesh_cache_template = config_manager.project_config.get("path_templates", {}).get(
-        "xgen_mesh_cache", 
-        "X:/projects/CSprojectFiles/Shot/CFX/{episode}/{sequence}/{shot}"
-    )
-    
-    # 使用模板生成毛发生长面导出路径
-    fur_cache_dir = xgen_mesh_cache_template.format(
-        episode=fur_episode,
-        sequence=fur_sequence,
-        shot=fur_shot
-    )
-    
-    # 添加publish/xgen_mesh子目录
-    fur_cache_dir = os.path.join(fur_cache_dir, "publish", "xgen_mesh")
-    print(f"\n毛发生长面导出路径: {fur_cache_dir}")
+    """获取场景信息，包括帧范围、文件路径和项目结构信息
     
-    # 创建目录（如果不存在）
-    if not os.path.exists(fur_cache_dir):
-        try:
-            os.makedirs(fur_cache_dir)
-            print(f"成功创建目录: {fur_cache_dir}")
-        except Exception as e:
-            print(f"创建目录出错: {str(e)}")
-    
-    print("======== 路径分析结束 ========\n")
-        
-    return {
-        "start_frame": start_frame,
-        "end_frame": end_frame,
-        "start_export_frame": start_export_frame,
-        "end_export_frame": end_export_frame,
-        "current_file": current_file,
-        "file_dir": file_dir,
-        "cache_dir": cache_dir,
-        "fur_cache_dir": fur_cache_dir,
-        "episode": char_prop_episode,  # 保留原有的episode用于角色和道具
-        "sequence": char_prop_sequence,  # 保留原有的sequence用于角色和道具
-        "shot": char_prop_shot,  # 保留原有的shot用于角色和道具
-        "fur_episode": fur_episode,  # 毛发专用episode
-        "fur_sequence": fur_sequence,  # 毛发专用sequence
-        "fur_shot": fur_shot,  # 毛发专用shot
-        "file_name": file_name  # 添加文件名
-    }
+    路径解析结果和镜头帧范围由SceneContext按场景缓存，帧范围来自shot_data、相机名称或时间线。
+    """
+    scene_info = get_scene_context().scene_info()
+    print(f"导出帧范围: {scene_info['start_export_frame']}-{scene_info['end_export_frame']} "
+          f"(镜头 {scene_info['start_frame']}-{scene_info['end_frame']}，来源: {scene_info['frame_range_source']})")
+    return scene_info
 
 
 def _find_asset_geometry(asset_type="char"):
@@ -166,259 +48,129 @@ def _find_asset_geometry(asset_type="char"):
         raise ValueError(f"不支持的资产类型: {asset_type}")
 
 
-def _make_geometries_visible(nodes, restore_info=None):
-    """临时设置几何体为可见状态，并返回原始状态信息用于恢复
+def plan_alembic_export(asset_types=("char", "prop"), profile=None):
+    """生成当前场景的导出计划，不访问磁盘也不执行导出
     
     Args:
-        nodes: 要处理的节点列表/字符串
-        restore_info: 之前保存的状态信息，如果提供则用于恢复状态
+        asset_types: 资产类型列表，按顺序生成任务，可选 "char"、"prop"、"fur"
+        profile: 可选，所有资产统一使用的导出配置，如 "layout_proxy"，输出文件名加上配置名称后缀
         
     Returns:
-        dict: 包含原始可见性状态的字典，用于后续恢复
+        ExportPlan: 导出计划，可序列化为JSON或交给ExportExecutor执行
     """
-    if restore_info is not None:
-        # 恢复模式 - 恢复之前的状态
-        print("正在恢复几何体原始可见性状态...")
-        for node, vis_value in restore_info.items():
-            if cmds.objExists(node):
-                try:
-                    cmds.setAttr(f"{node}.visibility", vis_value)
-                except Exception as e:
-                    print(f"恢复节点 {node} 的可见性时出错: {str(e)}")
-        return None
-    
-    # 保存当前状态并设置为可见
-    visibility_info = {}
-    all_nodes = []
-    
-    # 处理输入可能是单个节点或节点列表
-    if isinstance(nodes, str):
-        # 获取节点及其所有子节点
-        all_nodes.append(nodes)
-        children = cmds.listRelatives(nodes, allDescendents=True, fullPath=True) or []
-        all_nodes.extend(children)
-    else:
-        # 输入已经是节点列表
-        all_nodes = nodes
-        for node in nodes:
-            children = cmds.listRelatives(node, allDescendents=True, fullPath=True) or []
-            all_nodes.extend(children)
-    
-    # 获取所有变换节点和形状节点
-    transform_nodes = [n for n in all_nodes if cmds.objectType(n) == "transform"]
-    
-    # 处理所有找到的节点
-    processed_nodes = 0
-    hidden_nodes = 0
+    scene_info = _get_scene_info()
     
-    for node in transform_nodes:
-        try:
-            # 检查当前可见性
-            if cmds.attributeQuery("visibility", node=node, exists=True):
-                current_vis = cmds.getAttr(f"{node}.visibility")
-                visibility_info[node] = current_vis
-                
-                # 如果当前隐藏，则设置为可见
-                if not current_vis:
-                    cmds.setAttr(f"{node}.visibility", True)
-                    hidden_nodes += 1
-                
-                processed_nodes += 1
-        except Exception as e:
-            print(f"处理节点 {node} 时出错: {str(e)}")
+    asset_geometries = {}
+    for asset_type in asset_types:
+        asset_type_name = ASSET_TYPE_NAMES[asset_type]
+        geometries = {}
+        with profiling.phase("discovery"):
+            found = _find_asset_geometry(asset_type)
+        for asset_id, geometry_groups in found.items():
+            if not geometry_groups:
+                print(f"警告：未找到{asset_type_name} {asset_id} 的几何体组")
+                continue
+            geometries[asset_id] = geometry_groups
+        if not geometries:
+            print(f"场景中未找到任何{asset_type_name}模型")
+        asset_geometries[asset_type] = geometries
     
-    print(f"处理了 {processed_nodes} 个节点，临时显示了 {hidden_nodes} 个隐藏的几何体")
-    return visibility_info
+    with profiling.phase("planning"):
+        return ExportPlanner(scene_info, profile=profile).plan(asset_geometries)
 
 
-def _export_abc_file(asset_id, geometry, scene_info, settings, asset_type_name="角色"):
-    """导出单个资产的ABC缓存文件
+def _print_plan(plan):
+    """打印导出计划"""
+    print(f"导出计划: {plan.scene_file}，共 {len(plan)} 个任务")
+    for job in plan:
+        print(f"  [{job.asset_type_name}] {job.export_id}: {job.root} -> {job.output_path}")
+
+
+def _export_assets(asset_types, force=False, dry_run=False, single_pass=False, callback=None, cancel_flag=None,
+                   scratch_dir=None, dedup_static=False, profile=None):
+    """生成并执行指定类型资产的导出计划
     
     Args:
-        asset_id: 资产ID，如 "C001" 或 "P001"，或带序号的"c001_01"
-        geometry: 几何体组节点
-        scene_info: 场景信息字典
-        settings: 导出设置
-        asset_type_name: 资产类型名称，用于日志显示
+        asset_types: 资产类型列表
+        force: 是否忽略导出清单，强制重新导出所有资产
+        dry_run: 为True时只生成并打印计划，不执行导出
+        single_pass: 是否用一条多job的AbcExport命令导出所有资产
+        callback: 可选，接收ExportEvent进度事件的回调函数
+        cancel_flag: 可选，CancelFlag实例，用于中止导出
+        scratch_dir: 可选，本地临时目录，默认读取环境变量ABC_SCRATCH_DIR；设置后先导出到本地再在后台复制到缓存目录
+        dedup_static: 是否把没有动画的道具放入集数共享的静态道具缓存库，其他镜头直接链接
+        profile: 可选，所有资产统一使用的导出配置，如 "layout_proxy"
         
     Returns:
-        str: 导出的文件路径
+        list | ExportPlan: 导出的文件路径列表（包含因未变化而跳过的文件）；dry_run时返回导出计划
     """
-    # 选择正确的缓存目录
-    if asset_type_name == "毛发生长面" and scene_info.get("fur_cache_dir"):
-        # 使用配置的毛发缓存目录
-        base_cache_dir = scene_info["fur_cache_dir"]
-        print(f"使用毛发专用缓存路径: {base_cache_dir}")
-        
-        # 毛发生长面不需要创建资产子目录，直接使用base_cache_dir
-        asset_cache_dir = base_cache_dir
-        
-        # 从asset_id中提取基础ID和序号部分
-        # 例如: "c001_02" -> 基础ID="c001", 序号="02"
-        if "_" in asset_id:
-            # 如果asset_id中已有序号（如c001_01），则拆分它
-            base_id, index = asset_id.rsplit("_", 1)
-            print(f"拆分资产ID: 基础ID={base_id}, 序号={index}")
-        else:
-            # 如果asset_id中没有序号，则使用基础ID和默认序号01
-            base_id = asset_id
-            index = "01"
-            print(f"使用基础资产ID: {base_id}, 默认序号: {index}")
-        
-        # 使用毛发专用的sequence和shot构建文件名
-        sequence = scene_info.get("fur_sequence", "Sq03")  # 毛发专用sequence
-        shot = scene_info.get("fur_shot", "Sc0090")         # 毛发专用shot
-        
-        print(f"毛发文件命名使用: sequence={sequence}, shot={shot}")
-        
-        # 构建文件名
-        cache_name = f"{sequence}_{shot}_xgenMesh_{base_id}_{index}.abc"
-        print(f"最终输出文件名: {cache_name}")
-    else:
-        # 使用默认缓存目录
-        base_cache_dir = scene_info["cache_dir"]
-        
-        # 提取基础资产ID（去除序号部分）
-        if "_" in asset_id:
-            base_id = asset_id.rsplit("_", 1)[0]  # 例如：从"c001_01"提取"c001"
-            print(f"从资产ID中提取基础ID: {base_id}")
-        else:
-            base_id = asset_id
-        
-        # 创建基础资产ID的缓存子目录，而不是为每个序号创建目录
-        asset_cache_dir = os.path.join(base_cache_dir, base_id)
-        if not os.path.exists(asset_cache_dir):
-            os.makedirs(asset_cache_dir)
-        
-        # 构建常规缓存文件路径（使用原有的episode、sequence和shot）
-        cache_name = f"{scene_info['episode']}_{scene_info['sequence']}_{scene_info['shot']}_{asset_id}.abc"
-    
-    # 确保目录存在
-    if not os.path.exists(asset_cache_dir):
-        os.makedirs(asset_cache_dir)
-    
-    # 构建完整的导出路径
-    export_path = os.path.join(asset_cache_dir, cache_name).replace('\\', '/')
-    print(f"最终完整导出路径: {export_path}")
-    
-    # 为毛发生长面特别处理：确保renderableOnly为false，导出所有几何体
-    renderable_only_value = 'false' if asset_type_name == "毛发生长面" else settings.renderable_only
-    # 必须同时处理其他可能阻止隐藏几何体导出的参数
-    no_intermediates_value = 'false' if asset_type_name == "毛发生长面" else 'true'
-    
-    if asset_type_name == "毛发生长面":
-        print("⚠️ 毛发生长面导出：设置特殊参数确保隐藏几何体被导出")
-        print("  - renderableOnly=false: 包括不可渲染的对象")
-        print("  - noIntermediate=false: 包括中间对象")
-        
-        # 临时修改所有几何体的可见性（毛发生长面特殊处理）
-        visibility_backup = _make_geometries_visible(geometry)
-        print("已临时设置所有几何体为可见状态，将在导出后恢复")
-    
-    # 构建导出命令
-    command = (
-        f'AbcExport -j "-frameRange {scene_info["start_export_frame"]} {scene_info["end_export_frame"]} '
-        f'-root {geometry} -file {export_path} '
-        f'-verbose {settings.verbose} '
-        f'-renderableOnly {renderable_only_value} '
-        f'-noIntermediate {no_intermediates_value} '
-        f'-writeColorSets {settings.write_color_sets} '
-        f'-writeFaceSets {settings.write_face_sets} '
-        f'-worldSpace {settings.world_space} '
-        f'-writeVisibility {settings.write_visibility} '
-        f'-writeCreases {settings.write_creases} '
-        f'-writeUVSets {settings.write_uv_sets} '
-        f'-uvWrite {settings.uv_write} '
-        f'-eulerFilter {settings.euler_filter} '
-        f'-dataFormat {settings.data_format} "'
-    )
-    
-    try:
-        print(f"正在导出{asset_type_name} {asset_id} 的 Alembic 缓存...")
-        print(f"导出命令: {command}")
-        result = mel.eval(command)
-        
-        # 导出后恢复可见性状态（如果是毛发生长面）
-        if asset_type_name == "毛发生长面" and visibility_backup:
-            _make_geometries_visible(None, visibility_backup)
-            print("已恢复几何体的原始可见性状态")
-        
-        if os.path.exists(export_path):
-            print(f"成功导出{asset_type_name} {asset_id} 的 Alembic 缓存到: {export_path}")
-            return export_path
-        else:
-            raise RuntimeError(f"导出命令执行成功但未找到输出文件: {export_path}")
-            
-    except Exception as e:
-        # 确保异常情况下也恢复可见性
-        if asset_type_name == "毛发生长面" and visibility_backup:
-            _make_geometries_visible(None, visibility_backup)
-            print("已恢复几何体的原始可见性状态")
-        
-        raise RuntimeError(f"导出{asset_type_name} {asset_id} 的 Alembic 缓存时发生错误: {str(e)}")
+    plan = plan_alembic_export(asset_types, profile)
+    if not plan:
+        names = "、".join(ASSET_TYPE_NAMES[asset_type] for asset_type in asset_types)
+        raise RuntimeError(f"场景中未找到任何{names}模型")
+    
+    if dry_run:
+        _print_plan(plan)
+        return plan
+    
+    static_store = StaticPropStore(get_scene_context().static_prop_store_dir) if dedup_static else None
+    executor = ExportExecutor(force, callback=callback, cancel_flag=cancel_flag,
+                              scratch_dir=scratch_dir or os.environ.get(SCRATCH_DIR_ENV), static_store=static_store)
+    return executor.run(plan, single_pass=single_pass)
 
 
-def _export_assets(asset_type, asset_type_name):
-    """导出指定类型的资产
+def export_char_alembic(force=False, dry_run=False, callback=None, cancel_flag=None, scratch_dir=None, profile=None):
+    """导出场景中的角色模型到Alembic缓存
     
     Args:
-        asset_type: 资产类型，"char"表示角色，"prop"表示道具
-        asset_type_name: 资产类型名称，用于日志显示
-        
-    Returns:
-        list: 导出的文件路径列表
+        force (bool): 是否强制重新导出输入未变化的资产
+        dry_run (bool): 只返回导出计划，不执行导出
+        callback (callable): 接收ExportEvent进度事件的回调函数
+        cancel_flag (CancelFlag): 取消标记，用于中止导出
+        scratch_dir (str): 本地临时目录，先导出到本地再在后台复制到缓存目录
+        profile (str): 导出配置，如 "layout_proxy"，默认使用角色的anim配置
     """
-    # 获取场景信息
-    scene_info = _get_scene_info()
-    
-    # 获取导出设置
-    settings = AlembicExportSettings()
-    
-    # 获取资产几何体
-    asset_geometries = _find_asset_geometry(asset_type)
-    
-    # 检查是否找到资产
-    if not asset_geometries:
-        raise RuntimeError(f"场景中未找到任何{asset_type_name}模型")
-    
-    # 为每个资产创建单独的缓存
-    exported_files = []
-    for asset_id, geometry_groups in asset_geometries.items():
-        if not geometry_groups:
-            print(f"警告：未找到{asset_type_name} {asset_id} 的几何体组")
-            continue
-        
-        for index, geometry in enumerate(geometry_groups, 1):
-            try:
-                # 始终添加序号后缀，即使只有一个几何体组
-                export_id = f"{asset_id}_{index:02d}"
-                
-                export_path = _export_abc_file(export_id, geometry, scene_info, settings, asset_type_name)
-                exported_files.append(export_path)
-            except Exception as e:
-                print(f"导出{asset_type_name} {asset_id} 时出错: {str(e)}")
-    
-    return exported_files
-
+    return _export_assets(["char"], force, dry_run, callback=callback, cancel_flag=cancel_flag, scratch_dir=scratch_dir,
+                          profile=profile)
 
-def export_char_alembic():
-    """导出场景中的角色模型到Alembic缓存"""
-    return _export_assets("char", "角色")
 
-
-def export_prop_alembic():
-    """导出场景中的道具模型到Alembic缓存"""
-    return _export_assets("prop", "道具")
+def export_prop_alembic(force=False, dry_run=False, callback=None, cancel_flag=None, scratch_dir=None,
+                        dedup_static=False, profile=None):
+    """导出场景中的道具模型到Alembic缓存
+    
+    Args:
+        force (bool): 是否强制重新导出输入未变化的资产
+        dry_run (bool): 只返回导出计划，不执行导出
+        callback (callable): 接收ExportEvent进度事件的回调函数
+        cancel_flag (CancelFlag): 取消标记，用于中止导出
+        scratch_dir (str): 本地临时目录，先导出到本地再在后台复制到缓存目录
+        dedup_static (bool): 没有动画的道具只导出一次，其他镜头链接共享缓存库中的文件
+        profile (str): 导出配置，如 "layout_proxy"，默认使用道具的anim配置
+    """
+    return _export_assets(["prop"], force, dry_run, callback=callback, cancel_flag=cancel_flag, scratch_dir=scratch_dir,
+                          dedup_static=dedup_static, profile=profile)
 
 
-def export_fur_alembic():
-    """导出场景中的毛发生长面(Fur_Grp)到Alembic缓存"""
+def export_fur_alembic(force=False, dry_run=False, callback=None, cancel_flag=None, scratch_dir=None, profile=None):
+    """导出场景中的毛发生长面(Fur_Grp)到Alembic缓存
+    
+    Args:
+        force (bool): 是否强制重新导出输入未变化的资产
+        dry_run (bool): 只返回导出计划，不执行导出
+        callback (callable): 接收ExportEvent进度事件的回调函数
+        cancel_flag (CancelFlag): 取消标记，用于中止导出
+        scratch_dir (str): 本地临时目录，先导出到本地再在后台复制到缓存目录
+        profile (str): 导出配置，默认使用fur配置
+    """
     print("\n==== 毛发生长面导出 ====")
     print("将导出所有毛发生长面几何体，包括隐藏的几何体")
     print("⚠️ 注意：如果有隐藏几何体，会临时设置为可见状态进行导出，导出后将恢复原始状态")
     
     # 运行标准导出流程
-    result = _export_assets("fur", "毛发生长面")
+    result = _export_assets(["fur"], force, dry_run, callback=callback, cancel_flag=cancel_flag,
+                            scratch_dir=scratch_dir, profile=profile)
+    if dry_run:
+        return result
     
     # 导出后提供路径信息
     if result:
@@ -429,35 +181,129 @@ def export_fur_alembic():
     
     return result
 
-def export_alembic():
-    """导出所有角色和道具的Alembic缓存"""
+def export_alembic(single_pass=False, include_fur=False, force=False, dry_run=False, chunk_size=None, chunk_workers=4,
+                   callback=None, cancel_flag=None, scratch_dir=None, dedup_static=False, profile=None):
+    """导出所有角色和道具的Alembic缓存
+    
+    Args:
+        single_pass (bool): 是否用一条多job的AbcExport命令导出所有资产，时间线只求值一次
+        include_fur (bool): 是否同时导出毛发生长面
+        force (bool): 是否忽略导出清单，强制重新导出输入未变化的资产
+        dry_run (bool): 只生成并返回包含所有资产的导出计划，不执行导出
+        chunk_size (int): 设置后按此帧数分段，由多个mayapy工作进程并行导出后拼接；镜头较短时退回单次导出
+        chunk_workers (int): 分段导出的工作进程数量
+        callback (callable): 接收ExportEvent进度事件的回调函数
+        cancel_flag (CancelFlag): 取消标记，设置后在当前AbcExport命令结束后中止导出并抛出ExportCancelled
+        scratch_dir (str): 本地临时目录，默认读取环境变量ABC_SCRATCH_DIR；设置后先导出到本地，
+            再由后台线程校验哈希并原子重命名到缓存目录（不适用于分段导出）
+        dedup_static (bool): 没有动画的道具只导出一次，保存在集数共享的缓存库中，其他镜头直接链接（不适用于分段导出）
+        profile (str): 所有资产统一使用的导出配置，如Layout预览用的 "layout_proxy"（每4帧采样、只导出包围盒）
+            或 "layout_decimate"（减面模型）；输出文件名加上配置名称后缀，不会覆盖正式缓存
+        
+    Returns:
+        list | ExportPlan: 导出的文件路径列表；dry_run时返回导出计划
+    """
+    asset_types = ["char", "prop", "fur"] if include_fur else ["char", "prop"]
+    if dry_run:
+        plan = plan_alembic_export(asset_types, profile)
+        _print_plan(plan)
+        return plan
+    
+    if chunk_size:
+        plan = plan_alembic_export(asset_types, profile)
+        if not plan:
+            raise RuntimeError("场景中未找到任何可导出的资产")
+        return export_plan_chunked(plan, chunk_size, chunk_workers, force, callback=callback, cancel_flag=cancel_flag)
+    
+    if single_pass:
+        return _export_assets(asset_types, force, single_pass=True, callback=callback, cancel_flag=cancel_flag,
+                              scratch_dir=scratch_dir, dedup_static=dedup_static, profile=profile)
+    
     char_files = []
     prop_files = []
+    fur_files = []
     
     try:
-        char_files = export_char_alembic()
+        char_files = export_char_alembic(force, callback=callback, cancel_flag=cancel_flag, scratch_dir=scratch_dir,
+                                         profile=profile)
         print(f"成功导出 {len(char_files)} 个角色的 Alembic 缓存")
+    except ExportCancelled:
+        raise
     except Exception as e:
         print(f"导出角色时出错: {str(e)}")
     
     try:
-        prop_files = export_prop_alembic()
+        prop_files = export_prop_alembic(force, callback=callback, cancel_flag=cancel_flag, scratch_dir=scratch_dir,
+                                         dedup_static=dedup_static, profile=profile)
         print(f"成功导出 {len(prop_files)} 个道具的 Alembic 缓存")
+    except ExportCancelled:
+        raise
     except Exception as e:
         print(f"导出道具时出错: {str(e)}")
     
-    return char_files + prop_files
+    if include_fur:
+        try:
+            fur_files = export_fur_alembic(force, callback=callback, cancel_flag=cancel_flag, scratch_dir=scratch_dir,
+                                           profile=profile)
+        except ExportCancelled:
+            raise
+        except Exception as e:
+            print(f"导出毛发生长面时出错: {str(e)}")
+    
+    return char_files + prop_files + fur_files
+
+def _guide_job_string(guide, export_path, start_frame, end_frame):
+    """构建单个guide的AbcExport -j 参数字符串，参数来自guides导出配置"""
+    return (
+        f'-frameRange {start_frame} {end_frame} '
+        f'-root {guide} -file {export_path} '
+        f'{get_export_profile("guides").flag_string}'
+    )
+
+
+def plan_guide_exports(guides_list, asset_id, collection, export_dir, number_guides=False):
+    """计算每个guide的导出文件路径
+    
+    Args:
+        guides_list (list): guides物体列表
+        asset_id (str): 资产ID；number_guides为False时应已包含序号，如c001_01
+        collection (str): Collection名称，如COL_Hair
+        export_dir (str): 导出目录路径
+        number_guides (bool): 是否按guide名称（去除namespace）自动添加序号，同名guide依次为01、02...
+        
+    Returns:
+        list: [(guide, 导出文件路径), ...]
+    """
+    guide_counts = {}
+    exports = []
+    for guide in guides_list:
+        # 移除namespace
+        guide_name = guide.split(':')[-1]
+        if number_guides:
+            guide_counts[guide_name] = guide_counts.get(guide_name, 0) + 1
+            export_id = f"{asset_id}_{guide_counts[guide_name]:02d}"
+        else:
+            export_id = asset_id
+        file_name = f"{collection}_{guide_name}_{export_id}.abc"
+        exports.append((guide, os.path.join(export_dir, file_name).replace('\\', '/')))
+    return exports
+
 
-def export_xgen_guides(guides_list, asset_id=None, collection=None, start_frame=None, end_frame=None, export_dir=None):
+def export_xgen_guides(guides_list, asset_id=None, collection=None, start_frame=None, end_frame=None, export_dir=None,
+                       number_guides=False):
     """导出XGen Guides到Alembic缓存，每个guide物体单独导出一个abc文件
     
+    所有guide合并为一条多job的AbcExport命令，时间线只求值一次，导出后一次列出目录验证所有输出。
+    合并导出失败时逐个重新导出，以定位有问题的guide。
+    
     Args:
         guides_list (list): 要导出的guides物体列表
-        asset_id (str): 资产ID，如c001_01
+        asset_id (str): 资产ID，如c001_01；number_guides为True时传入不带序号的c001
         collection (str): Collection名称，如COL_Hair
         start_frame (int, optional): 开始帧. Defaults to None.
         end_frame (int, optional): 结束帧. Defaults to None.
         export_dir (str): 导出目录路径
+        number_guides (bool): 是否按guide名称自动添加序号
     
     Returns:
         list: 导出的文件路径列表
@@ -466,45 +312,84 @@ def export_xgen_guides(guides_list, asset_id=None, collection=None, start_frame=
         return []
     
     # 如果未指定帧范围，使用当前时间线范围
-    if start_frame is None:
-        start_frame = cmds.playbackOptions(query=True, minTime=True)
-    if end_frame is None:
-        end_frame = cmds.playbackOptions(query=True, maxTime=True)
-        
-    exported_files = []
+    if start_frame is None or end_frame is None:
+        playback_start, playback_end = SceneContext.playback_range()
+        start_frame = playback_start if start_frame is None else start_frame
+        end_frame = playback_end if end_frame is None else end_frame
     
-    # 遍历每个guides物体进行导出
-    for guide in guides_list:
+    exports = plan_guide_exports(guides_list, asset_id, collection, export_dir, number_guides)
+    return run_guide_exports(exports, start_frame, end_frame)
+
+
+def _stat_outputs(export_dirs, export_paths):
+    """每个目录扫描一次，读取计划中的输出文件的修改时间和大小
+
+    Args:
+        export_dirs (list): 输出目录列表
+        export_paths (set): 统一为正斜杠的输出文件路径
+
+    Returns:
+        dict: 存在的输出文件路径到 (修改时间, 大小) 的映射
+    """
+    stats = {}
+    for export_dir in export_dirs:
         try:
-            # 移除namespace
-            guide_name = guide.split(':')[-1] if ':' in guide else guide
-            
-            # 构建文件名 - 使用传入的asset_id（已包含序号）
-            file_name = f"{collection}_{guide_name}_{asset_id}.abc"
-            export_path = os.path.join(export_dir, file_name).replace('\\', '/')
-            
-            # 构建导出命令，只包含必要的参数
-            command = (
-                f'AbcExport -j "-frameRange {start_frame} {end_frame} '
-                f'-root {guide} -file {export_path} '
-                f'-worldSpace -writeVisibility -writeUVSets -uvWrite"'
-            )
-            
-            print(f"执行导出命令: {command}")
-            
-            # 执行导出
-            result = mel.eval(command)
-            
-            # 验证文件是否真正创建
-            if os.path.exists(export_path):
-                exported_files.append(export_path)
-                print(f"成功导出并验证文件存在: {export_path}")
-            else:
-                print(f"警告：导出命令执行成功但文件未找到: {export_path}")
-                continue
-            
-        except Exception as e:
-            print(f"导出 {guide_name} 失败: {str(e)}")
-            continue
+            with os.scandir(export_dir) as entries:
+                for entry in entries:
+                    path = os.path.join(export_dir, entry.name).replace('\\', '/')
+                    if path in export_paths and entry.is_file():
+                        stat = entry.stat()
+                        stats[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            print(f"无法读取导出目录 {export_dir}: {str(e)}")
+    return stats
+
+
+def run_guide_exports(exports, start_frame, end_frame):
+    """用一条多job的AbcExport命令导出guides，并验证输出
     
-    return exported_files
\ No newline at end of file
+    Args:
+        exports (list): plan_guide_exports返回的 [(guide, 导出文件路径), ...]，可以来自多个资产和Collection
+        start_frame (float): 开始帧
+        end_frame (float): 结束帧
+    
+    Returns:
+        list: 导出的文件路径列表
+    """
+    if not exports:
+        return []
+    export_dirs = sorted({os.path.dirname(export_path) for _, export_path in exports})
+    for export_dir in export_dirs:
+        os.makedirs(export_dir, exist_ok=True)
+    
+    job_strings = [_guide_job_string(guide, export_path, start_frame, end_frame) for guide, export_path in exports]
+    command = "AbcExport " + " ".join(f'-j "{job}"' for job in job_strings)
+    # 导出前的修改时间和大小来自同一文件系统，网络盘上与本机时钟不同步时也能判断文件是否被重新写出
+    export_paths = {export_path.replace('\\', '/') for _, export_path in exports}
+    previous_stats = _stat_outputs(export_dirs, export_paths)
+    try:
+        print(f"正在单次导出 {len(exports)} 个guides...")
+        print(f"执行导出命令: {command}")
+        with profiling.phase("guides_export"):
+            mel.eval(command)
+    except Exception as e:
+        print(f"合并导出guides失败，改为逐个导出: {str(e)}")
+        for (guide, export_path), job in zip(exports, job_strings):
+            try:
+                with profiling.phase("guides_export"):
+                    mel.eval(f'AbcExport -j "{job}"')
+            except Exception as e:
+                print(f"导出 {guide} 失败: {str(e)}")
+    
+    # 验证所有文件是否在本次导出中写出：新出现的文件，或修改时间、大小与导出前不同的文件（忽略上次导出遗留的旧文件）
+    current_stats = _stat_outputs(export_dirs, export_paths)
+    exported_files = []
+    for guide, export_path in exports:
+        path = export_path.replace('\\', '/')
+        if path in current_stats and current_stats[path] != previous_stats.get(path):
+            exported_files.append(export_path)
+        else:
+            print(f"警告：导出 {guide} 后文件未找到或未更新: {export_path}")
+    
+    print(f"成功导出 {len(exported_files)}/{len(exports)} 个guides")
+    return exported_files
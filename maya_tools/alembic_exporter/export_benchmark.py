@@ -0,0 +1,71 @@
+"""
+Alembic导出模式耗时对比脚本
+
+此脚本在Maya中分别运行逐资产导出（每个资产一次AbcExport）和单次多job导出，
+对比两者的耗时。可以直接在Maya脚本编辑器中运行此脚本。
+注意：两种模式会写出相同的缓存文件，后一次会覆盖前一次的结果。
+两次导出都使用 force=True，否则第二次会按导出清单跳过第一次刚导出的资产。
+"""
+
+import time
+import maya.cmds as mc
+from maya_tools.alembic_exporter.export import export_alembic
+
+
+def _time_export(label, **kwargs):
+    """运行一次导出并计时
+
+    Args:
+        label: 日志中显示的模式名称
+        **kwargs: 传给export_alembic的参数
+
+    Returns:
+        tuple: (耗时秒数, 导出的文件列表)
+    """
+    print(f"\n===== {label} =====")
+    start = time.perf_counter()
+    exported_files = export_alembic(**kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label}: 导出 {len(exported_files)} 个文件，耗时 {elapsed:.2f} 秒")
+    return elapsed, exported_files
+
+
+def compare_export_modes(include_fur=False):
+    """对比逐资产导出和单次多job导出的耗时
+
+    Args:
+        include_fur (bool): 是否同时导出毛发生长面
+
+    Returns:
+        dict: 两种模式的耗时和文件数量
+    """
+    current_file = mc.file(q=True, sn=True)
+    if not current_file:
+        print("错误: 请先保存Maya文件，然后再运行对比")
+        return {}
+
+    per_asset_time, per_asset_files = _time_export("逐资产导出", include_fur=include_fur, force=True)
+    single_pass_time, single_pass_files = _time_export("单次多job导出", single_pass=True, include_fur=include_fur,
+                                                     force=True)
+
+    speedup = per_asset_time / single_pass_time if single_pass_time else 0.0
+    print("\n============================================")
+    print(f"场景: {current_file}")
+    print(f"逐资产导出: {per_asset_time:.2f} 秒 ({len(per_asset_files)} 个文件)")
+    print(f"单次多job导出: {single_pass_time:.2f} 秒 ({len(single_pass_files)} 个文件)")
+    print(f"加速比: {speedup:.2f}x")
+    print("============================================\n")
+
+    return {
+        "scene": current_file,
+        "per_asset_seconds": per_asset_time,
+        "per_asset_files": len(per_asset_files),
+        "single_pass_seconds": single_pass_time,
+        "single_pass_files": len(single_pass_files),
+        "speedup": speedup
+    }
+
+
+# 如果直接运行此脚本，则执行对比
+if __name__ == "__main__":
+    compare_export_modes()
@@ -0,0 +1,88 @@
+"""
+批量导出农场的工作进程
+
+由 batch_farm.ExportFarm 以独立解释器（通常是mayapy）启动，每个进程持有自己的
+maya.standalone 会话。进程从标准输入逐行读取JSON任务，调用可插拔的导出入口函数，
+并把结果以带前缀的JSON行写回标准输出，其他打印内容原样透传给调度器作为日志。
+
+此模块只依赖标准库，入口函数和初始化函数通过 "模块:函数" 字符串在运行时导入。
+"""
+
+import os
+import sys
+import json
+import argparse
+import importlib
+import traceback
+
+# 确保 maya_tools 所在目录在导入路径中
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+# 以脚本运行时本目录在导入路径中；不通过包导入，避免在工作进程初始化前导入Maya
+from batch_farm import RESULT_PREFIX
+
+
+def load_callable(spec):
+    """根据 "模块:函数" 字符串导入可调用对象
+
+    Args:
+        spec: 如 "maya_tools.alembic_exporter.batch_export:export_scene_file"
+
+    Returns:
+        callable: 导入的函数
+    """
+    module_name, _, func_name = spec.partition(":")
+    if not module_name or not func_name:
+        raise ValueError(f"入口格式错误，应为 模块:函数 : {spec}")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def _send(channel, message):
+    """向调度器发送一条结果消息"""
+    channel.write(RESULT_PREFIX + json.dumps(message, ensure_ascii=False) + "\n")
+    channel.flush()
+
+
+def main(argv=None):
+    """工作进程主循环"""
+    parser = argparse.ArgumentParser(description="Alembic批量导出工作进程")
+    parser.add_argument("--entry", required=True, help="导出入口，格式为 模块:函数")
+    parser.add_argument("--init", default="", help="进程启动时调用一次的初始化函数，格式为 模块:函数")
+    args = parser.parse_args(argv)
+
+    channel = sys.stdout
+
+    try:
+        if args.init:
+            load_callable(args.init)()
+        entry = load_callable(args.entry)
+    except Exception as e:
+        _send(channel, {"status": "init_error", "error": str(e), "traceback": traceback.format_exc()})
+        return 1
+
+    _send(channel, {"status": "ready", "pid": os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            task = json.loads(line)["task"]
+        except Exception as e:
+            _send(channel, {"status": "error", "error": f"无法解析任务: {str(e)}"})
+            continue
+
+        try:
+            result = entry(task)
+            _send(channel, {"status": "ok", "result": result})
+        except Exception as e:
+            _send(channel, {"status": "error", "error": str(e), "traceback": traceback.format_exc()})
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+批量导出农场测试用的桩导出入口，不依赖Maya
+
+任务为字典，mode 字段决定桩函数的行为。
+"""
+import os
+import time
+
+
+def export_stub(task):
+    """根据任务的mode模拟导出结果"""
+    mode = task.get("mode", "ok")
+    if mode == "ok":
+        return [f"{task['name']}.abc"]
+    if mode == "fail":
+        raise RuntimeError(f"导出失败: {task['name']}")
+    if mode == "hang":
+        time.sleep(60)
+        return []
+    if mode == "crash_once":
+        # 第一次调用时直接退出进程，模拟Maya崩溃
+        marker = task["marker"]
+        if not os.path.exists(marker):
+            open(marker, 'w').close()
+            os._exit(3)
+        return [f"{task['name']}.abc"]
+    raise ValueError(f"未知的mode: {mode}")
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Alembic缓存校验单元测试
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import struct
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import abc_verify
+
+
+def build_ogawa(frozen=True, samples=55, start_frame=50, fps=abc_verify.DEFAULT_FPS):
+    """生成一个最小的Ogawa缓存：一个xform下有一个mesh，带一个均匀时间采样"""
+    buf = bytearray(16)
+
+    def data(payload):
+        position = len(buf)
+        buf.extend(struct.pack("<Q", len(payload)) + payload)
+        return position | abc_verify.OGAWA_DATA_BIT
+
+    def group(children):
+        position = len(buf)
+        buf.extend(struct.pack(f"<Q{len(children)}Q", len(children), *children))
+        return position
+
+    mesh = group([0, data(b"headers")])
+    xform = group([0, mesh, data(b"headers")])
+    top = group([0, xform, data(b"headers")])
+    time_samplings = struct.pack("<IdId", 1, 1.0, 1, 0.0) + struct.pack("<IdId", samples, 1 / fps, 1, start_frame / fps)
+    root = group([data(b"\x01"), data(b"\x02"), top, data(b""), data(time_samplings), data(b"")])
+    buf[:16] = abc_verify.OGAWA_HEADER.pack(abc_verify.OGAWA_MAGIC, 0xFF if frozen else 0, 1, root)
+    return bytes(buf)
+
+
+class TestAbcVerify(unittest.TestCase):
+    """测试Ogawa后备读取和校验规则"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        # 固定使用Ogawa后备读取
+        self._abc = abc_verify.Abc
+        abc_verify.Abc = None
+
+    def tearDown(self):
+        abc_verify.Abc = self._abc
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_reads_samples_frame_range_and_objects(self):
+        result = abc_verify.verify_abc_file(self._write("ok.abc", build_ogawa()), expected_frame_range=(50, 104))
+        self.assertTrue(result["ok"], result["errors"])
+        self.assertEqual(result["reader"], "ogawa")
+        self.assertEqual(result["samples"], 55)
+        self.assertEqual(result["frame_range"], [50, 104])
+        self.assertEqual(result["objects"]["total"], 2)
+
+    def test_frame_range_mismatch_fails(self):
+        result = abc_verify.verify_abc_file(self._write("short.abc", build_ogawa(samples=30)), (50, 104))
+        self.assertFalse(result["ok"])
+
+    def test_frame_range_uses_scene_fps(self):
+        path = self._write("pal.abc", build_ogawa(fps=25.0))
+        self.assertTrue(abc_verify.verify_abc_file(path, (50, 104), fps=abc_verify.time_unit_fps("pal"))["ok"])
+        result = abc_verify.verify_abc_file(path, (50, 104), fps=abc_verify.time_unit_fps("film"))
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["frame_range"], [48, 99.84])
+        self.assertEqual(abc_verify.time_unit_fps("23.976fps"), 23.976)
+        with self.assertRaises(ValueError):
+            abc_verify.time_unit_fps("unknown")
+
+    def test_unfinished_empty_and_truncated_files_fail(self):
+        content = build_ogawa()
+        paths = [
+            self._write("crashed.abc", build_ogawa(frozen=False)),
+            self._write("empty.abc", b""),
+            self._write("truncated.abc", content[:len(content) // 2]),
+        ]
+        results = abc_verify.verify_abc_files(paths, workers=2)
+        self.assertEqual([result["path"] for result in results], [path.replace('\\', '/') for path in paths])
+        self.assertFalse(any(result["ok"] for result in results))
+        self.assertIn("未写完", results[0]["errors"][0])
+
+    def test_report(self):
+        self._write("ok.abc", build_ogawa())
+        self._write("empty.abc", b"")
+        results = abc_verify.verify_abc_files(abc_verify.find_abc_files([self.temp_dir]))
+        report_path = os.path.join(self.temp_dir, abc_verify.REPORT_NAME)
+        abc_verify.write_report(results, report_path)
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual((report["total"], report["failed"]), (2, 1))
+        self.assertTrue(report["failed_files"][0].endswith("empty.abc"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+批量导出农场调度器单元测试，使用桩导出入口，不需要Maya
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(TEST_DIR, '..')))
+
+from batch_farm import ExportFarm, find_maya_files
+
+
+class TestExportFarm(unittest.TestCase):
+    """测试并行导出调度器"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_farm(self, **kwargs):
+        options = {
+            "worker_count": 2,
+            "timeout": 30,
+            "retries": 1,
+            "worker_entry": "stub_exporter:export_stub",
+            "worker_init": "",
+            "extra_paths": [TEST_DIR]
+        }
+        options.update(kwargs)
+        return ExportFarm(**options)
+
+    def test_success_and_failure_counts(self):
+        """测试成功和失败的统计合并"""
+        tasks = [{"name": f"sc{i:04d}", "mode": "ok"} for i in range(5)]
+        tasks.append({"name": "broken", "mode": "fail"})
+        summary_path = os.path.join(self.temp_dir, "summary.json")
+
+        summary = self._create_farm().run(tasks, summary_path=summary_path)
+
+        self.assertEqual(summary["total"], 6)
+        self.assertEqual(summary["success"], 5)
+        self.assertEqual(summary["fail"], 1)
+        self.assertEqual([r["task"] for r in summary["files"]], tasks)
+        failed = summary["files"][-1]
+        self.assertEqual(failed["attempts"], 2)
+        self.assertIn("broken", failed["error"])
+
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["success"], 5)
+
+    def test_crashed_worker_is_restarted(self):
+        """测试工作进程崩溃后重启并重试"""
+        marker = os.path.join(self.temp_dir, "crashed")
+        tasks = [{"name": "crash", "mode": "crash_once", "marker": marker}, {"name": "after", "mode": "ok"}]
+
+        summary = self._create_farm(worker_count=1).run(tasks)
+
+        self.assertEqual(summary["success"], 2)
+        self.assertEqual(summary["files"][0]["attempts"], 2)
+        self.assertEqual(summary["files"][0]["exported"], ["crash.abc"])
+
+    def test_timeout_kills_worker(self):
+        """测试单个任务超时后工作进程被终止，后续任务继续执行"""
+        tasks = [{"name": "hang", "mode": "hang"}, {"name": "after", "mode": "ok"}]
+
+        summary = self._create_farm(worker_count=1, timeout=2, retries=0).run(tasks)
+
+        self.assertEqual(summary["fail"], 1)
+        self.assertIn("超时", summary["files"][0]["error"])
+        self.assertEqual(summary["files"][1]["status"], "success")
+
+    def test_missing_interpreter_fails_every_task(self):
+        """测试工作进程无法启动时所有任务记为失败，队列不会阻塞"""
+        tasks = [{"name": f"sc{i:04d}", "mode": "ok"} for i in range(4)]
+
+        summary = self._create_farm(worker_count=1, queue_size=1,
+                                    python_exe=os.path.join(self.temp_dir, "missing", "mayapy")).run(tasks)
+
+        self.assertEqual((summary["success"], summary["fail"]), (0, 4))
+        self.assertTrue(all("无法启动" in record["error"] for record in summary["files"]))
+
+    def test_find_maya_files(self):
+        """测试Maya文件查找"""
+        os.makedirs(os.path.join(self.temp_dir, "Sc0010"))
+        for name in ("Sc0010/a.ma", "Sc0010/b.MB", "Sc0010/c.abc"):
+            open(os.path.join(self.temp_dir, name), 'w').close()
+
+        files = [os.path.basename(f) for f in find_maya_files(self.temp_dir)]
+        self.assertEqual(files, ["a.ma", "b.MB"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+导出清单单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.export_manifest import ExportManifest, SceneFingerprint
+
+
+class TestExportManifest(unittest.TestCase):
+    """测试导出清单的跳过判断"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "abc_cache")
+        self.scene_path = os.path.join(self.temp_dir, "Sq04_Sc0110_anim.ma")
+        self.export_path = os.path.join(self.cache_dir, "c001", "Sq04_Sc0110_work_c001_01.abc")
+        os.makedirs(os.path.dirname(self.export_path))
+        self._write(self.scene_path, "scene v1")
+        self._write(self.export_path, "abc data")
+        self.settings = {"uv_write": True, "data_format": "ogawa"}
+        self.root = "|c001_rig|c001:Geometry"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, path, content):
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def _record(self):
+        manifest = ExportManifest(self.cache_dir)
+        manifest.record(self.export_path, SceneFingerprint(self.scene_path), (50, 104), self.settings, self.root)
+        manifest.save()
+
+    def _is_up_to_date(self, frame_range=(50, 104), settings=None, root=None, modified=False):
+        manifest = ExportManifest(self.cache_dir)
+        return manifest.is_up_to_date(self.export_path, SceneFingerprint(self.scene_path, modified), frame_range,
+                                      settings or self.settings, root or self.root)
+
+    def test_unchanged_inputs_are_skipped(self):
+        """测试输入未变化时可以跳过"""
+        self.assertFalse(self._is_up_to_date())
+        self._record()
+        self.assertTrue(self._is_up_to_date())
+
+    def test_changed_inputs_are_exported(self):
+        """测试帧范围、设置、根节点或场景内容变化时需要重新导出"""
+        self._record()
+        self.assertFalse(self._is_up_to_date(frame_range=(1001, 1100)))
+        self.assertFalse(self._is_up_to_date(settings={"uv_write": False, "data_format": "ogawa"}))
+        self.assertFalse(self._is_up_to_date(root="|c001_rig1|c001:Geometry"))
+
+        self._write(self.scene_path, "scene v2")
+        self.assertFalse(self._is_up_to_date())
+
+    def test_touched_scene_with_same_content_is_skipped(self):
+        """测试只修改了时间戳的场景通过哈希判断为未变化"""
+        self._record()
+        stat = os.stat(self.scene_path)
+        os.utime(self.scene_path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(self._is_up_to_date())
+
+    def test_unsaved_scene_is_exported(self):
+        """测试场景有未保存的修改时不跳过，且导出结果不记录为与已保存场景一致"""
+        self._record()
+        self.assertFalse(self._is_up_to_date(modified=True))
+
+        manifest = ExportManifest(self.cache_dir)
+        manifest.record(self.export_path, SceneFingerprint(self.scene_path, modified=True), (50, 104),
+                        self.settings, self.root)
+        manifest.save()
+        self.assertFalse(self._is_up_to_date())
+
+    def test_missing_or_truncated_output_is_exported(self):
+        """测试输出文件丢失或大小变化时需要重新导出"""
+        self._record()
+        self._write(self.export_path, "abc")
+        self.assertFalse(self._is_up_to_date())
+        os.remove(self.export_path)
+        self.assertFalse(self._is_up_to_date())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+导出计划单元测试
+"""
+import unittest
+import sys
+import os
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.export_plan import ExportPlanner, ExportPlan, ExportJob, split_frame_range, build_chunk_plans
+from core.settings import ExportProfile, DEFAULT_PROFILES, render_flags
+
+
+SCENE_INFO = {
+    "start_export_frame": 50,
+    "end_export_frame": 104,
+    "current_file": "X:/projects/CSprojectFiles/Shot/Animation/PV/Sq04/Sc0110/work/Sq04_Sc0110_anim.ma",
+    "cache_dir": "X:/projects/CSprojectFiles/Shot/Animation/PV/Sq04/Sc0110/work/abc_cache",
+    "fur_cache_dir": "X:/projects/CSprojectFiles/Shot/CFX/PV/Sq04/Sc0110/publish/xgen_mesh",
+    "episode": "Sq04",
+    "sequence": "Sc0110",
+    "shot": "work",
+    "fur_sequence": "Sq04",
+    "fur_shot": "Sc0110",
+}
+
+SETTINGS = {
+    "verbose": True,
+    "renderable_only": True,
+    "no_intermediate": True,
+    "strip_namespaces": False,
+    "write_color_sets": True,
+    "write_face_sets": True,
+    "world_space": True,
+    "write_visibility": True,
+    "write_creases": True,
+    "write_uv_sets": True,
+    "uv_write": True,
+    "euler_filter": True,
+    "data_format": "ogawa",
+}
+
+
+def build_profiles(settings):
+    profiles = {}
+    for name, overrides in DEFAULT_PROFILES.items():
+        profile_settings = dict(settings)
+        profile_settings.update(overrides)
+        profiles[name] = ExportProfile(name, profile_settings)
+    return profiles
+
+
+PROFILES = build_profiles(SETTINGS)
+
+
+class TestExportPlanner(unittest.TestCase):
+    """测试导出计划的路径和参数规则"""
+
+    def setUp(self):
+        self.planner = ExportPlanner(SCENE_INFO, PROFILES)
+
+    def test_char_paths_use_base_id_directory(self):
+        plan = self.planner.plan({"char": {"C001": ["|c001_rig|c001:Geometry", "|c001_rig1|c001_1:Geometry"]}})
+        self.assertEqual([job.export_id for job in plan], ["C001_01", "C001_02"])
+        self.assertEqual(
+            plan.jobs[1].output_path,
+            SCENE_INFO["cache_dir"] + "/C001/Sq04_Sc0110_work_C001_02.abc"
+        )
+
+    def test_fur_paths_and_flags(self):
+        plan = self.planner.plan({"fur": {"c001": ["|c001:Fur_Grp"]}})
+        job = plan.jobs[0]
+        self.assertEqual(job.output_path, SCENE_INFO["fur_cache_dir"] + "/Sq04_Sc0110_xgenMesh_c001_01.abc")
+        self.assertEqual(job.profile, "fur")
+        self.assertNotIn("-renderableOnly", job.flags)
+        self.assertNotIn("-noIntermediate", job.flags)
+        self.assertIn("-worldSpace", job.flags)
+
+    def test_job_string(self):
+        plan = self.planner.plan({"prop": {"P002": ["|p002_rig|p002:Geometry"]}})
+        job_string = plan.jobs[0].job_string()
+        self.assertTrue(job_string.startswith(
+            "-frameRange 50 104 -root |p002_rig|p002:Geometry "
+            "-file " + SCENE_INFO["cache_dir"] + "/P002/Sq04_Sc0110_work_P002_01.abc -verbose "
+        ))
+        self.assertTrue(job_string.endswith("-renderableOnly -noIntermediate -writeColorSets -writeFaceSets "
+                                            "-worldSpace -writeVisibility -writeCreases -writeUVSets -uvWrite "
+                                            "-eulerFilter -dataFormat ogawa "))
+        self.assertTrue(plan.jobs[0].job_string(frame_range=(50, 50)).startswith("-frameRange 50 50 -root "))
+
+    def test_plan_records_used_profiles(self):
+        plan = self.planner.plan({"char": {"C001": ["|c001_rig|c001:Geometry"]}, "fur": {"c001": ["|c001:Fur_Grp"]}})
+        self.assertEqual(sorted(plan.settings), ["anim", "fur"])
+        self.assertFalse(plan.settings["fur"]["renderable_only"])
+
+    def test_json_round_trip(self):
+        plan = self.planner.plan({
+            "char": {"C001": ["|c001_rig|c001:Geometry"]},
+            "fur": {"c001": ["|c001:Fur_Grp"]},
+        })
+        restored = ExportPlan.from_json(plan.to_json())
+        self.assertEqual(restored.as_dict(), plan.as_dict())
+        self.assertIsInstance(restored.jobs[0], ExportJob)
+        self.assertEqual([job.asset_type for job in restored.filter(["fur"])], ["fur"])
+
+
+class TestChunkPlans(unittest.TestCase):
+    """测试分段导出的帧范围切分"""
+
+    def test_split_frame_range(self):
+        self.assertEqual(split_frame_range(50, 1049.0, 400), [(50, 449), (450, 849), (850, 1049.0)])
+        self.assertEqual(split_frame_range(50, 104, 500), [(50, 104)])
+
+    def test_chunk_plans_keep_job_order(self):
+        plan = ExportPlanner(SCENE_INFO, PROFILES).plan({
+            "char": {"C001": ["|c001_rig|c001:Geometry"]},
+            "fur": {"c001": ["|c001:Fur_Grp"]},
+        })
+        chunk_plans = build_chunk_plans(plan, [(50, 79), (80, 104)], "/tmp/chunks")
+        self.assertEqual(len(chunk_plans), 2)
+        self.assertEqual([job.export_id for job in chunk_plans[1]], ["C001_01", "c001_01"])
+        self.assertEqual(chunk_plans[1].jobs[0].frame_range, (80, 104))
+        self.assertEqual(chunk_plans[1].jobs[1].output_path,
+                         "/tmp/chunks/chunk_002/002_Sq04_Sc0110_xgenMesh_c001_01.abc")
+        self.assertEqual(chunk_plans[1].jobs[1].flags, plan.jobs[1].flags)
+
+
+class TestExportProfiles(unittest.TestCase):
+    """测试导出配置的参数渲染"""
+
+    def test_switch_flags_render_without_values(self):
+        self.assertEqual(render_flags({"verbose": True, "renderable_only": False, "data_format": "ogawa"}),
+                         "-verbose -dataFormat ogawa")
+
+    def test_guides_profile_matches_minimal_flags(self):
+        self.assertEqual(PROFILES["guides"].flag_string, "-worldSpace -writeVisibility -writeUVSets -uvWrite")
+
+    def test_layout_proxy_skips_uvs(self):
+        self.assertNotIn("-uvWrite", PROFILES["layout_proxy"].flag_string)
+
+    def test_layout_profiles_subsample_and_proxy(self):
+        self.assertIn("-step 4 ", PROFILES["layout_proxy"].flag_string)
+        self.assertEqual(PROFILES["layout_proxy"].proxy, {"mode": "bbox"})
+        self.assertEqual(PROFILES["layout_decimate"].proxy, {"mode": "decimate", "reduce": 90})
+        self.assertIsNone(PROFILES["anim"].proxy)
+        self.assertNotIn("-step", PROFILES["anim"].flag_string)
+
+    def test_profile_override_uses_suffixed_paths(self):
+        plan = ExportPlanner(SCENE_INFO, PROFILES, profile="layout_proxy").plan({
+            "char": {"C001": ["|c001_rig|c001:Geometry"]},
+            "fur": {"c001": ["|c001:Fur_Grp"]},
+        })
+        self.assertEqual({job.profile for job in plan}, {"layout_proxy"})
+        self.assertEqual(plan.jobs[0].output_path,
+                         SCENE_INFO["cache_dir"] + "/C001/Sq04_Sc0110_work_C001_01_layout_proxy.abc")
+        self.assertEqual(plan.jobs[1].proxy, {"mode": "bbox"})
+        self.assertTrue(plan.jobs[0].job_string(root="|C001_01_bboxProxy").startswith(
+            "-frameRange 50 104 -root |C001_01_bboxProxy "))
+        self.assertEqual(ExportPlan.from_json(plan.to_json()).jobs[0].proxy, {"mode": "bbox"})
+        with self.assertRaises(KeyError):
+            ExportPlanner(SCENE_INFO, PROFILES, profile="missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
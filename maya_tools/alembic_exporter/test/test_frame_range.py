@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+镜头帧范围单元测试
+"""
+import unittest
+import sys
+import os
+
+# 添加父目录和仓库根目录到路径，以便导入模块和 maya_tools.common
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from core.frame_range import (build_shot_index, get_shot_index, load_frame_range_settings, resolve_frame_range,
+                              sampled_frame_range)
+from maya_tools.common.camera_utils import parse_camera_frame_range
+
+
+SHOT_DATA = {
+    "Episode": {
+        "PV": {
+            "Sequences": {
+                "Sq04": {
+                    "Shots": {
+                        "sc0110": {"Chars": ["C001"], "frame_range": [1001, 1096]},
+                        "sc0120": {"Chars": ["C001"], "frame_range": [1001, 1040], "pre_roll": 20},
+                        "sc0130": {"Chars": ["C001"]},
+                    }
+                }
+            }
+        }
+    }
+}
+
+PROJECT_CONFIG = {"frame_range": {"pre_roll": 10, "post_roll": 4}, "camera_settings": {"file_prefix": "cam_"}}
+
+
+class TestFrameRange(unittest.TestCase):
+    """测试帧范围来源的优先级和前后延长"""
+
+    def setUp(self):
+        self.settings = load_frame_range_settings(PROJECT_CONFIG)
+        self.index = build_shot_index(SHOT_DATA)
+
+    def test_parse_camera_frame_range(self):
+        self.assertEqual(parse_camera_frame_range("X:/cam/cam_Sq04_Sc0110_1001_1104.fbx"), (1001, 1104))
+        self.assertEqual(parse_camera_frame_range("camera:cam_Sq04_Sc0110_120"), (1, 120))
+        self.assertIsNone(parse_camera_frame_range("persp"))
+        self.assertIsNone(parse_camera_frame_range("cam_Sq04_1104_1001"))
+
+    def test_shot_data_takes_priority(self):
+        frame_range = resolve_frame_range("Sq04", "Sc0110", self.index, self.settings,
+                                          camera_names=["cam_Sq04_Sc0110_1_50.fbx"], playback_range=(50, 60))
+        self.assertEqual(frame_range.source, "shot_data")
+        self.assertEqual(frame_range.export_range, (991, 1100))
+
+        frame_range = resolve_frame_range("Sq04", "Sc0120", self.index, self.settings)
+        self.assertEqual(frame_range.export_range, (981, 1044))
+
+    def test_falls_back_to_camera_then_playback(self):
+        frame_range = resolve_frame_range("Sq04", "Sc0130", self.index, self.settings,
+                                          camera_names=["persp", "cam_Sq04_Sc0130_1001_1020.fbx"],
+                                          playback_range=lambda: self.fail("不应读取时间线"))
+        self.assertEqual((frame_range.source, frame_range.export_range), ("camera", (991, 1024)))
+
+        frame_range = resolve_frame_range("Sq04", "Sc0130", self.index, self.settings, playback_range=(1, 24))
+        self.assertEqual((frame_range.source, frame_range.export_range), ("playback", (-9, 28)))
+        self.assertIsNone(resolve_frame_range("Sq04", "Sc0130", self.index, self.settings))
+
+    def test_sampled_frame_range(self):
+        self.assertEqual(sampled_frame_range(1001, 1100, 4), (1001, 1097))
+        self.assertEqual(sampled_frame_range(1001, 1100, None), (1001, 1100))
+
+    def test_shot_index_is_reused(self):
+        self.assertIs(get_shot_index(SHOT_DATA), get_shot_index(SHOT_DATA))
+        self.assertNotIn(("sq04", "sc0130"), self.index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+导出文件后台落盘单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.output_finalizer import OutputFinalizer, scratch_path_for, PART_SUFFIX
+
+
+class TestOutputFinalizer(unittest.TestCase):
+    """测试本地临时文件复制到最终位置"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.scratch_dir = os.path.join(self.temp_dir, "scratch")
+        self.share_dir = os.path.join(self.temp_dir, "share", "abc_cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_scratch_paths_do_not_collide(self):
+        first = scratch_path_for(self.scratch_dir, "X:/cache/C001/Sq04_Sc0110_work_C001_01.abc")
+        second = scratch_path_for(self.scratch_dir, "X:/other/C001/Sq04_Sc0110_work_C001_01.abc")
+        self.assertNotEqual(first, second)
+        self.assertTrue(first.endswith("/Sq04_Sc0110_work_C001_01.abc"))
+
+    def test_finalize_moves_files_atomically(self):
+        finalizer = OutputFinalizer(self.scratch_dir, max_workers=2)
+        output_paths = [os.path.join(self.share_dir, f"C00{index}", "cache.abc") for index in range(1, 4)]
+        for index, output_path in enumerate(output_paths):
+            scratch_path = finalizer.scratch_path(output_path)
+            os.makedirs(os.path.dirname(scratch_path), exist_ok=True)
+            with open(scratch_path, 'wb') as f:
+                f.write(b"abc" * (index + 1))
+            finalizer.submit(output_path)
+        missing_path = os.path.join(self.share_dir, "C009", "cache.abc")
+        finalizer.submit(missing_path)
+
+        errors = finalizer.wait()
+        finalizer.shutdown()
+        self.assertIsNotNone(errors.pop(missing_path))
+        self.assertEqual(set(errors.values()), {None})
+        for index, output_path in enumerate(output_paths):
+            with open(output_path, 'rb') as f:
+                self.assertEqual(f.read(), b"abc" * (index + 1))
+            self.assertFalse(os.path.exists(output_path + PART_SUFFIX))
+            self.assertFalse(os.path.exists(finalizer.scratch_path(output_path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+导出耗时统计单元测试
+"""
+import unittest
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import profiling
+
+
+class TestProfiling(unittest.TestCase):
+    """测试阶段计时、计数和报告合并"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_hooks_are_noop_without_profiler(self):
+        self.assertIsNone(profiling.get_profiler())
+        with profiling.phase("abc_export"):
+            profiling.count("jobs_exported")
+        self.assertIsNone(profiling.get_profiler())
+
+    def test_phases_and_counters_accumulate(self):
+        report_path = os.path.join(self.temp_dir, "shot01", profiling.TIMING_REPORT_NAME)
+        with profiling.profile_scene("shot01.ma", report_path, count_commands=False) as profiler:
+            for _ in range(3):
+                with profiling.phase("visibility"):
+                    pass
+            profiling.count("jobs_exported", 2)
+        self.assertIsNone(profiling.get_profiler())
+
+        report = profiler.as_dict()
+        self.assertEqual(report["phases"]["visibility"]["calls"], 3)
+        self.assertEqual(report["counters"], {"jobs_exported": 2})
+        with open(report_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["scene"], "shot01.ma")
+        self.assertTrue(os.path.exists(os.path.splitext(report_path)[0] + ".csv"))
+
+    def test_aggregate_reports(self):
+        reports = [
+            {"scene": "shot01.ma", "total_seconds": 10.0,
+             "phases": {"abc_export": {"seconds": 8.0, "calls": 1}}, "counters": {"jobs_exported": 3}},
+            {"scene": "shot02.ma", "total_seconds": 5.0,
+             "phases": {"abc_export": {"seconds": 3.0, "calls": 1}, "stitch": {"seconds": 1.0, "calls": 2}},
+             "maya_commands": {"mel.eval": 4}},
+        ]
+        output_path = os.path.join(self.temp_dir, profiling.SUMMARY_REPORT_NAME)
+        summary = profiling.aggregate_timing_reports(reports, output_path)
+
+        self.assertEqual(summary["scenes"], 2)
+        self.assertEqual(summary["total_seconds"], 15.0)
+        self.assertEqual(summary["phases"]["abc_export"], {"seconds": 11.0, "calls": 2})
+        self.assertEqual(summary["maya_commands"], {"mel.eval": 4})
+        with open(os.path.splitext(output_path)[0] + ".csv", 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["scene", "total_seconds", "abc_export", "stitch"])
+        self.assertEqual(rows[1][-1], "0.0")
+
+
+if __name__ == '__main__':
+    unittest.main()
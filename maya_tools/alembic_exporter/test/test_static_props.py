@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+静态道具缓存库单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.static_props import StaticPropStore, static_prop_key, static_frame_range, sample_frames
+
+
+class TestStaticPropStore(unittest.TestCase):
+    """测试静态道具缓存库的键和链接"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = StaticPropStore(os.path.join(self.temp_dir, "static_prop_cache"))
+        self.source = {"path": "x:/assets/prop/p002/p002_rig.ma", "size": 1024, "mtime": 1700000000}
+        self.snapshot = [[1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 5.0, 0.0, 2.0, 1.0]]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _shot_path(self, shot):
+        return os.path.join(self.temp_dir, shot, "abc_cache", "P002", f"Sq04_{shot}_work_P002_01.abc")
+
+    def test_key_depends_on_placement_and_flags(self):
+        key = static_prop_key(self.source, self.snapshot, "-uvWrite")
+        self.assertEqual(key, static_prop_key(dict(self.source), list(self.snapshot), "-uvWrite"))
+        moved = [self.snapshot[0][:12] + [6.0, 0.0, 2.0, 1.0]]
+        self.assertNotEqual(key, static_prop_key(self.source, moved, "-uvWrite"))
+        self.assertNotEqual(key, static_prop_key(self.source, self.snapshot, "-uvWrite -writeCreases"))
+
+    def test_add_then_link_other_shot(self):
+        key = static_prop_key(self.source, self.snapshot, "-uvWrite")
+        first = self._shot_path("Sc0110")
+        os.makedirs(os.path.dirname(first))
+        with open(first, 'wb') as f:
+            f.write(b"Ogawa static prop")
+
+        self.assertFalse(self.store.has(key))
+        store_path = self.store.add(key, first)
+        self.assertTrue(self.store.has(key))
+
+        second = self._shot_path("Sc0120")
+        self.store.link(key, second)
+        with open(second, 'rb') as f:
+            self.assertEqual(f.read(), b"Ogawa static prop")
+        self.assertFalse(os.path.exists(second + ".part"))
+        if hasattr(os, "link"):
+            self.assertTrue(os.path.samefile(second, store_path))
+
+    def test_static_frame_range_is_a_single_sample(self):
+        self.assertEqual(static_frame_range((50, 104)), (50, 50))
+
+    def test_sample_frames(self):
+        self.assertEqual(sample_frames(50, 104), [50, 63.5, 77, 90.5, 104])
+        self.assertEqual(sample_frames(50, 50), [50])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,9 @@ import maya.cmds as mc
 from maya_tools.alembic_exporter.export import export_char_alembic, export_prop_alembic, export_fur_alembic
 from maya_tools.alembic_exporter.core.xgen_guides import XGenGuidesManager
 from maya_tools.alembic_exporter.core.scene_info import SceneInfoManager
+from maya_tools.alembic_exporter.core import export_events
+from maya_tools.alembic_exporter.core.export_events import CancelFlag, ExportCancelled
+from maya_tools.common.maya_utils import show_progress, update_progress, end_progress
 
 class XGenGuidesDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
@@ -334,12 +337,17 @@ class AlembicExporterGUI(QtWidgets.QWidget):
         
         self.setWindowTitle("Alembic缓存导出工具")
         self.setMinimumWidth(380)  # 减小最小宽度
-        self.setFixedHeight(190)  # 减小窗口高度
+        self.setFixedHeight(220)  # 减小窗口高度，保留进度条的位置
         self.setup_ui()
         
         # 创建XGen Guides导出窗口实例
         self.xgen_guides_dialog = None
         
+        # 当前导出的取消标记和进度计数
+        self.cancel_flag = None
+        self._job_count = 0
+        self._done_count = 0
+        
     def setup_ui(self):
         # 创建主布局
         main_layout = QtWidgets.QVBoxLayout(self)
@@ -418,44 +426,101 @@ class AlembicExporterGUI(QtWidgets.QWidget):
         cfx_layout.addLayout(cfx_grid)
         main_layout.addWidget(cfx_group)
         
+        # 进度条和取消按钮，导出时显示
+        progress_layout = QtWidgets.QHBoxLayout()
+        progress_layout.setSpacing(3)
+        self.progress_bar = show_progress("Alembic缓存导出", "", 100, parent=self)
+        progress_layout.addWidget(self.progress_bar)
+        self.cancel_btn = QtWidgets.QPushButton("取消")
+        self.cancel_btn.setFixedSize(60, 22)
+        self.cancel_btn.clicked.connect(self.cancel_export)
+        progress_layout.addWidget(self.cancel_btn)
+        main_layout.addLayout(progress_layout)
+        self._set_exporting(False)
+        
         # 状态标签
         self.status_label = QtWidgets.QLabel("")
         self.status_label.setWordWrap(True)
         self.status_label.setContentsMargins(0, 0, 0, 0)  # 移除状态标签的边距
         main_layout.addWidget(self.status_label)
         
-    def export_character(self):
-        """导出角色缓存"""
+    def _set_exporting(self, exporting):
+        """切换导出中的界面状态"""
+        self.progress_bar.setVisible(exporting)
+        self.cancel_btn.setVisible(exporting)
+        self.cancel_btn.setEnabled(exporting)
+        for button in (self.export_char_btn, self.export_prop_btn, self.export_fur_btn, self.export_guides_btn):
+            button.setEnabled(not exporting)
+            
+    def cancel_export(self):
+        """请求取消当前导出"""
+        if self.cancel_flag:
+            self.cancel_flag.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("正在取消导出...")
+            
+    def _on_export_event(self, event):
+        """根据导出事件更新进度条"""
+        if event.kind == export_events.QUEUED:
+            self._job_count += 1
+            self.progress_bar.setMaximum(self._job_count * 100)
+        elif event.kind in (export_events.FINISHED, export_events.FAILED):
+            self._done_count += 1
+            update_progress(self.progress_bar, self._done_count * 100, f"{self._done_count}/{self._job_count}")
+        elif event.kind == export_events.FRAME and event.progress is not None:
+            if event.job is None:
+                # 单次导出的逐帧进度对所有任务生效
+                value = int(event.progress * self._job_count * 100)
+            else:
+                value = self._done_count * 100 + int(event.progress * 100)
+            update_progress(self.progress_bar, value, f"{event.job.export_id if event.job else ''} 第 {event.frame} 帧")
+        elif event.kind == export_events.STARTED:
+            self.status_label.setText(f"正在导出 {event.job.asset_type_name} {event.job.export_id}...")
+        
+        # 保持界面响应，使取消按钮可以点击
+        QtWidgets.QApplication.processEvents()
+        
+    def _run_export(self, export_func, success_text, empty_text):
+        """执行导出并显示进度
+        
+        Args:
+            export_func: 导出函数，接收callback和cancel_flag参数
+            success_text: 成功时的状态文本，包含 {count} 占位符
+            empty_text: 没有导出任何文件时的状态文本
+        """
+        self.cancel_flag = CancelFlag()
+        self._job_count = 0
+        self._done_count = 0
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self._set_exporting(True)
         try:
-            files = export_char_alembic()
+            files = export_func(callback=self._on_export_event, cancel_flag=self.cancel_flag)
             if files:
-                self.status_label.setText(f"成功导出 {len(files)} 个角色的 Alembic 缓存")
+                self.status_label.setText(success_text.format(count=len(files)))
             else:
-                self.status_label.setText("没有找到可导出的角色模型")
+                self.status_label.setText(empty_text)
+        except ExportCancelled:
+            self.status_label.setText("导出已取消")
         except Exception as e:
             self.status_label.setText(f"导出失败: {str(e)}")
+        finally:
+            end_progress(self.progress_bar)
+            self._set_exporting(False)
+            self.cancel_flag = None
+        
+    def export_character(self):
+        """导出角色缓存"""
+        self._run_export(export_char_alembic, "成功导出 {count} 个角色的 Alembic 缓存", "没有找到可导出的角色模型")
             
     def export_prop(self):
         """导出道具缓存"""
-        try:
-            files = export_prop_alembic()
-            if files:
-                self.status_label.setText(f"成功导出 {len(files)} 个道具的 Alembic 缓存")
-            else:
-                self.status_label.setText("没有找到可导出的道具模型")
-        except Exception as e:
-            self.status_label.setText(f"导出失败: {str(e)}")
+        self._run_export(export_prop_alembic, "成功导出 {count} 个道具的 Alembic 缓存", "没有找到可导出的道具模型")
             
     def export_fur(self):
         """导出毛发生长面缓存"""
-        try:
-            files = export_fur_alembic()
-            if files:
-                self.status_label.setText(f"成功导出 {len(files)} 个毛发生长面 Fur_Grp 的 Alembic 缓存")
-            else:
-                self.status_label.setText("没有找到可导出的毛发生长面 Fur_Grp")
-        except Exception as e:
-            self.status_label.setText(f"导出失败: {str(e)}")
+        self._run_export(export_fur_alembic, "成功导出 {count} 个毛发生长面 Fur_Grp 的 Alembic 缓存",
+                         "没有找到可导出的毛发生长面 Fur_Grp")
 
     def show_guides_dialog(self):
         """显示XGen Guides导出窗口"""
@@ -481,7 +546,8 @@ def show_window():
     
     # 关闭已有窗口
     for widget in QtWidgets.QApplication.allWidgets():
-        if isinstance(widget, AlembicExporterGUI):
+        # 按类名判断，重载后旧窗口是旧类的实例
+        if type(widget).__name__ == AlembicExporterGUI.__name__:
             widget.close()
     
     # 创建新窗口, 使用Maya主窗口作为父窗口
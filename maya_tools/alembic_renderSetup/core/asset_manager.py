@@ -1,10 +1,15 @@
 import os
 import maya.cmds as mc
 from maya_tools.common.asset_manager import AssetManager as CommonAssetManager
+from maya_tools.common.asset_status import AssetStatusChecker
+from maya_tools.common.cache_index import ScanCancelled, get_cache_index, parse_cache_name, DEFAULT_VERSION
 from .path_checker import PathChecker
 from maya_tools.alembic_renderSetup.core.config import PATH_TEMPLATES
-import glob
 import re
+import fnmatch
+
+# 从XGen缓存文件名中提取描述名称
+XGEN_DESCRIPTION_PATTERN = re.compile(r'(DES_[^_]+)_.*?')
 
 
 class AssetManager(CommonAssetManager):
@@ -57,47 +62,24 @@ class AssetManager(CommonAssetManager):
             "Environment": shot_data.get("Environment", "")
         }
 
-    def check_asset(self, asset_id, asset_type):
-        """检查资产状态"""
+    def _check_shot_assets(self, assets):
+        """批量检查当前镜头的资产，abc_cache 和 Asset/<类型> 目录各只列出一次
+        
+        Args:
+            assets (dict): 资产类型到资产ID列表的映射，如 {"Chars": ["C001"], "Props": []}
+            
+        Returns:
+            dict: 资产ID到状态的映射
+        """
         if not all([self.current_episode, self.current_sequence, self.current_shot]):
             raise ValueError("请先选择一个镜头")
 
-        # 构建完整路径
-        shot_path = os.path.join(self.checker.anm_path, self.current_episode, self.current_sequence, self.current_shot,
-                                 "work")
+        checker = AssetStatusChecker(self.checker.anm_path, self.checker.project_root)
+        return checker.check_shot(self.current_episode, self.current_sequence, self.current_shot, assets)
 
-        # 检查路径是否存在
-        if not os.path.exists(shot_path):
-            raise ValueError(f"路径不存在: {shot_path}")
-
-        # 检查abc_cache文件夹
-        abc_cache_path = os.path.join(shot_path, "abc_cache")
-        if not os.path.exists(abc_cache_path) or not os.path.isdir(abc_cache_path):
-            raise ValueError(f"未找到abc_cache文件夹: {abc_cache_path}")
-
-        # 获取abc_cache中的所有文件夹
-        cache_folders = [f.lower() for f in os.listdir(abc_cache_path)
-                         if os.path.isdir(os.path.join(abc_cache_path, f))]
-
-        # 检查缓存文件夹
-        cache_exists = asset_id.lower() in cache_folders
-
-        # 检查LookDev文件
-        lookdev_exists = False
-        lookdev_path = None
-        try:
-            lookdev_path = self.checker._check_lookdev_file(asset_id, asset_type, import_file=False)
-            lookdev_exists = lookdev_path is not None
-        except:
-            lookdev_exists = False
-
-        # 返回状态
-        return {
-            "cache_exists": cache_exists,
-            "lookdev_exists": lookdev_exists,
-            "lookdev_path": lookdev_path,
-            "type": asset_type
-        }
+    def check_asset(self, asset_id, asset_type):
+        """检查资产状态"""
+        return self._check_shot_assets({asset_type: [asset_id]})[asset_id]
 
     def check_all_assets(self):
         """检查当前镜头的所有资产"""
@@ -106,16 +88,12 @@ class AssetManager(CommonAssetManager):
 
         assets = self.get_shot_assets(self.current_episode, self.current_sequence, self.current_shot)
 
-        self.asset_status = {}
-
-        # 检查角色
-        for char_id in assets["Chars"]:
-            self.asset_status[char_id] = self.check_asset(char_id, "Chars")
-
-        # 检查道具
-        for prop_id in assets["Props"]:
-            self.asset_status[prop_id] = self.check_asset(prop_id, "Props")
+        # 角色和道具一起检查，状态中包含每个资产的ABC文件数量
+        self.asset_status = self._check_shot_assets({"Chars": assets["Chars"], "Props": assets["Props"]})
 
+        missing = [asset_id for asset_id, status in self.asset_status.items() if not status["lookdev_exists"]]
+        if missing:
+            print(f"未找到LookDev文件的资产: {', '.join(missing)}")
         return self.asset_status
 
     def import_asset(self, asset_id):
@@ -222,62 +200,141 @@ class AssetManager(CommonAssetManager):
         
         return updated_count > 0
 
-    def find_cloth_caches(self, episode, sequence, shot, asset_id):
+    def _cache_publish_dir(self, template_key, episode, sequence, shot):
         """
-        查找指定资产的布料缓存文件
+        构建镜头的CFX缓存发布目录
         
         Args:
+            template_key (str): 路径模板名称，"cloth_sim_path"或"xgen_sim_path"
             episode (str): 集号
             sequence (str): 场次
             shot (str): 镜头号
-            asset_id (str): 资产ID，例如"c001"
             
         Returns:
-            list: 布料缓存文件列表，每项包含文件名和路径信息
+            str: 发布目录，模板未定义时返回None
         """
-        # 从配置获取布料缓存根路径
-        cloth_path_template = PATH_TEMPLATES.get("cloth_sim_path", "")
-        if not cloth_path_template:
-            mc.warning("布料缓存路径模板未在配置中定义")
-            return []
+        path_template = PATH_TEMPLATES.get(template_key, "")
+        if not path_template:
+            return None
         
         # 处理场次命名格式 - 确保Sq03变为Sq03，sc0090变为Sc0090
-        formatted_sequence = sequence
         formatted_shot = shot.capitalize() if shot.startswith("sc") or shot.startswith("Sc") else shot
-        
-        # 构建布料缓存发布目录
-        publish_dir = os.path.join(
-            cloth_path_template.format(
-                episode=episode,
-                sequence=formatted_sequence,
-                shot=formatted_shot
-            ),
+        return os.path.join(
+            path_template.format(episode=episode, sequence=sequence, shot=formatted_shot),
             "publish"
         )
+
+    def _cloth_cache_info(self, record, asset_id):
+        """文件记录匹配 *cloth*{asset_id}*.abc（忽略大小写）时返回布料缓存信息，否则返回None"""
+        if not fnmatch.fnmatchcase(record["filename"].lower(), f"*cloth*{asset_id}*.abc".lower()):
+            return None
+        return self.get_cache_info(record["path"], record)
+
+    def _xgen_cache_info(self, record, asset_id):
+        """文件记录是资产的XGen缓存时返回带描述名称的缓存信息，否则返回None"""
+        filename = record["filename"]
         
-        if not os.path.exists(publish_dir):
-            mc.warning(f"布料缓存目录不存在: {publish_dir}")
-            return []
+        # 跳过布料缓存(含有cloth关键词)
+        if "cloth" in filename.lower() or not fnmatch.fnmatchcase(filename.lower(), f"*{asset_id}*.abc".lower()):
+            return None
+        
+        # 提取描述名称
+        match = XGEN_DESCRIPTION_PATTERN.search(filename)
+        if not match:
+            return None
+        cache_info = self.get_cache_info(record["path"], record)
+        cache_info["description"] = match.group(1)
+        return cache_info
+
+    def _find_caches(self, template_key, cache_info_func, episode, sequence, shot, asset_id,
+                     refresh=False, cancel_event=None, on_found=None):
+        """
+        从缓存索引查找资产的缓存文件，目录未变化时不访问网络盘
         
-        # 查找匹配条件的布料缓存
-        search_pattern = os.path.join(publish_dir, f"*cloth*{asset_id}*.abc")
-        cache_files = glob.glob(search_pattern)
+        Args:
+            template_key (str): 路径模板名称，"cloth_sim_path"或"xgen_sim_path"
+            cache_info_func: 文件记录匹配时返回缓存信息、否则返回None的函数
+            episode (str): 集号
+            sequence (str): 场次
+            shot (str): 镜头号
+            asset_id (str): 资产ID
+            refresh (bool): 是否重新扫描缓存目录，不使用缓存索引
+            cancel_event (threading.Event): 可选，取消标记，扫描时逐个文件检查
+            on_found: 可选，每找到一个缓存时调用，参数为缓存信息
+            
+        Returns:
+            list: 按文件名排序的缓存信息列表，带版本信息，目录不存在时返回None
+            
+        Raises:
+            ScanCancelled: 查找被取消
+        """
+        def collect(record):
+            # 扫描过程中逐个回调，此时还没有版本目录
+            cache_info = cache_info_func(record, asset_id)
+            if cache_info:
+                on_found(cache_info)
         
-        # 提取文件信息
+        publish_dir = self._cache_publish_dir(template_key, episode, sequence, shot)
+        catalog = get_cache_index().get_catalog(publish_dir, refresh, cancel_event, collect if on_found else None)
+        if catalog is None:
+            return None
+        return self._catalog_cache_infos(catalog, catalog.records, cache_info_func, asset_id)
+
+    def _catalog_cache_infos(self, catalog, records, cache_info_func, asset_id):
+        """筛选资产的缓存，附加版本目录中的版本信息"""
         result = []
-        for file_path in cache_files:
-            cache_info = self.get_cache_info(file_path)
+        for record in records:
+            cache_info = cache_info_func(record, asset_id)
             if cache_info:
+                cache_info.update(catalog.version_info(record))
                 result.append(cache_info)
+        return result
+
+    def find_cloth_caches(self, episode, sequence, shot, asset_id, refresh=False, cancel_event=None, on_found=None):
+        """
+        查找指定资产的布料缓存文件
+        
+        Args:
+            episode (str): 集号
+            sequence (str): 场次
+            shot (str): 镜头号
+            asset_id (str): 资产ID，例如"c001"
+            refresh (bool): 是否重新扫描缓存目录，不使用缓存索引
+            cancel_event (threading.Event): 可选，取消标记，取消时抛出 ScanCancelled
+            on_found: 可选，每找到一个缓存时调用，用于逐步显示结果
+            
+        Returns:
+            list: 布料缓存文件列表，每项包含文件名和路径信息
+        """
+        if not PATH_TEMPLATES.get("cloth_sim_path"):
+            mc.warning("布料缓存路径模板未在配置中定义")
+            return []
         
+        # 从缓存索引查找，目录未变化时不访问网络盘
+        result = self._find_caches("cloth_sim_path", self._cloth_cache_info, episode, sequence, shot, asset_id,
+                                   refresh, cancel_event, on_found)
+        if result is None:
+            mc.warning(f"布料缓存目录不存在: {self._cache_publish_dir('cloth_sim_path', episode, sequence, shot)}")
+            return []
         return result
 
-    def get_cache_info(self, file_path):
+    def get_cache_info(self, file_path, record=None):
+        """
+        获取缓存文件信息
+        
+        Args:
+            file_path (str): 缓存文件路径
+            record (dict): 可选，缓存索引中的文件记录，提供时不再读取文件大小和修改时间
+            
+        Returns:
+            dict: 缓存文件信息
+        """
         filename = os.path.basename(file_path)
+        if record is None:
+            record = {"size": os.path.getsize(file_path), "mtime": os.path.getmtime(file_path)}
         
-        # 尝试提取版本信息
-        version_match = re.search(r'_(\d+)\.abc$', filename)
-        version = int(version_match.group(1)) if version_match else 1
+        # 提取版本信息，支持 _003.abc 和 _v003.abc
+        version = parse_cache_name(filename)[1] or DEFAULT_VERSION
         
         # 确定缓存类型
         cache_type = "未知"
@@ -292,11 +349,12 @@ class AssetManager(CommonAssetManager):
             "path": file_path,
             "version": version,
             "type": cache_type,
-            "size": os.path.getsize(file_path) / (1024 * 1024),  # 大小(MB)
-            "date_modified": os.path.getmtime(file_path)  # 修改日期
+            "size": record["size"] / (1024 * 1024),  # 大小(MB)
+            "date_modified": record["mtime"]  # 修改日期
         }
 
-    def find_xgen_caches(self, episode, sequence, shot, asset_id):
+
+    def find_xgen_caches(self, episode, sequence, shot, asset_id, refresh=False, cancel_event=None, on_found=None):
         """
         查找指定资产的XGen缓存文件
         
@@ -305,56 +363,61 @@ class AssetManager(CommonAssetManager):
             sequence (str): 场次
             shot (str): 镜头号
             asset_id (str): 资产ID，例如"c001"
+            refresh (bool): 是否重新扫描缓存目录，不使用缓存索引
+            cancel_event (threading.Event): 可选，取消标记，取消时抛出 ScanCancelled
+            on_found: 可选，每找到一个缓存时调用，用于逐步显示结果
             
         Returns:
             list: XGen缓存文件列表，每项包含描述名称和路径信息
         """
-        # 从配置获取XGen缓存根路径
-        xgen_path_template = PATH_TEMPLATES.get("xgen_sim_path", "")
-        if not xgen_path_template:
+        if not PATH_TEMPLATES.get("xgen_sim_path"):
             mc.warning("XGen缓存路径模板未在配置中定义")
             return []
         
-        # 处理场次命名格式 - 确保Sq03变为Sq03，sc0090变为Sc0090
-        formatted_sequence = sequence
-        formatted_shot = shot.capitalize() if shot.startswith("sc") or shot.startswith("Sc") else shot
-        
-        # 构建XGen缓存发布目录
-        publish_dir = os.path.join(
-            xgen_path_template.format(
-                episode=episode,
-                sequence=formatted_sequence,
-                shot=formatted_shot
-            ),
-            "publish"
-        )
-        
-        if not os.path.exists(publish_dir):
-            mc.warning(f"XGen缓存目录不存在: {publish_dir}")
+        # 从缓存索引查找，与布料缓存共用同一目录的索引
+        result = self._find_caches("xgen_sim_path", self._xgen_cache_info, episode, sequence, shot, asset_id,
+                                   refresh, cancel_event, on_found)
+        if result is None:
+            mc.warning(f"XGen缓存目录不存在: {self._cache_publish_dir('xgen_sim_path', episode, sequence, shot)}")
             return []
+        return result
+
+    def find_shot_caches(self, episode, sequence, shot, asset_ids, refresh=False, cancel_event=None):
+        """
+        一次扫描镜头的缓存目录，按资产ID分出所有资产的布料和XGen缓存
         
-        # 查找匹配条件的XGen缓存
-        search_pattern = os.path.join(publish_dir, f"*{asset_id}*.abc")
-        cache_files = glob.glob(search_pattern)
-        
-        # 过滤并提取描述名称
-        result = []
-        desc_pattern = re.compile(r'(DES_[^_]+)_.*?')
+        布料和XGen缓存目录相同时只读取一次，筛选规则与 find_cloth_caches/find_xgen_caches 相同。
         
-        for file_path in cache_files:
-            filename = os.path.basename(file_path)
-            
-            # 跳过布料缓存(含有cloth关键词)
-            if "cloth" in filename.lower():
-                continue
+        Args:
+            episode (str): 集号
+            sequence (str): 场次
+            shot (str): 镜头号
+            asset_ids (list): 镜头中的资产ID
+            refresh (bool): 是否重新扫描缓存目录，不使用缓存索引
+            cancel_event (threading.Event): 可选，取消标记，取消时抛出 ScanCancelled
             
-            # 提取描述名称
-            match = desc_pattern.search(filename)
-            if match:
-                desc_name = match.group(1)
-                cache_info = self.get_cache_info(file_path)
-                if cache_info:
-                    cache_info["description"] = desc_name
-                    result.append(cache_info)
+        Returns:
+            dict: {asset_id: {"cloth": [...], "xgen": [...]}}
+        """
+        cache_index = get_cache_index()
+        # 发布目录到版本目录的映射，布料和XGen目录相同时只读取一次
+        scanned = {}
+        catalogs = {}
+        for cache_type, template_key in (("cloth", "cloth_sim_path"), ("xgen", "xgen_sim_path")):
+            publish_dir = self._cache_publish_dir(template_key, episode, sequence, shot)
+            if publish_dir and publish_dir not in scanned:
+                scanned[publish_dir] = cache_index.get_catalog(publish_dir, refresh, cancel_event)
+                if scanned[publish_dir] is None:
+                    print(f"缓存目录不存在: {publish_dir}")
+            catalogs[cache_type] = scanned.get(publish_dir)
         
+        result = {}
+        for asset_id in asset_ids:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ScanCancelled()
+            result[asset_id] = {}
+            for cache_type, cache_info_func in (("cloth", self._cloth_cache_info), ("xgen", self._xgen_cache_info)):
+                catalog = catalogs[cache_type]
+                result[asset_id][cache_type] = self._catalog_cache_infos(
+                    catalog, catalog.records, cache_info_func, asset_id) if catalog else []
         return result
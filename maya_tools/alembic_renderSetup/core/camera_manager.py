@@ -3,6 +3,7 @@ import os
 from .utils import handle_error
 from .config import CAMERA_SETTINGS, FRAME_RATE
 from .render_manager import RenderManager
+from maya_tools.common.camera_utils import parse_camera_frame_range
 
 class CameraManager:
     """相机管理类"""
@@ -103,30 +104,10 @@ class CameraManager:
     
     @staticmethod
     def parse_frame_range(camera_name):
-        """从相机文件名解析帧范围"""
+        """从相机文件名解析帧范围，规则见 maya_tools.common.camera_utils，无法解析时返回 (None, None)"""
         # 安全获取file_prefix，默认为"cam_"
-        file_prefix = CAMERA_SETTINGS.get("file_prefix", "cam_").lower()
-        
-        if not camera_name.lower().startswith(file_prefix):
-            return None, None
-            
-        try:
-            parts = camera_name.split('_')
-            frame_numbers = []
-            
-            for part in parts:
-                clean_part = part.split('.')[0]
-                if clean_part.isdigit():
-                    frame_numbers.append(int(clean_part))
-            
-            if len(frame_numbers) >= 2:
-                return frame_numbers[-2], frame_numbers[-1]
-            elif frame_numbers:
-                return 1, frame_numbers[0]
-            
-        except:
-            pass
-        return None, None
+        frame_range = parse_camera_frame_range(camera_name, CAMERA_SETTINGS.get("file_prefix", "cam_"))
+        return frame_range or (None, None)
 
     @staticmethod
     def check_camera_exists(namespace="camera"):
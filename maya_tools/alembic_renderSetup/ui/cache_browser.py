@@ -11,6 +11,7 @@ import maya.mel as mel
 from PySide2 import QtWidgets, QtCore, QtGui
 from datetime import datetime
 import threading
+import itertools
 import time
 import xgenm as xg
 import xgenm.xgGlobal as xgg
@@ -20,6 +21,7 @@ import logging
 
 from ..core.asset_manager import AssetManager
 from ..core.utils import update_status
+from maya_tools.common.cache_index import ScanCancelled, get_cache_index
 from maya_tools.alembic_renderSetup.core import cloth_cache_importer
 from maya_tools.alembic_renderSetup.core import xgen_cache_importer
 from maya_tools.alembic_renderSetup.core import utils
@@ -34,68 +36,214 @@ class XGenColumns:
     FILENAME = 0
 
 
-class CacheThread(QtCore.QThread):
-    """缓存搜索线程，避免UI卡顿"""
-    # 自定义信号
-    update_signal = QtCore.Signal(list, str)  # 传递找到的缓存列表和类型
-    error_signal = QtCore.Signal(str)   # 传递错误信息
-    finished_signal = QtCore.Signal(str, int)  # 传递完成状态和找到的缓存数量
+# 缓存查找线程数，布料、XGen和镜头预取各占一个
+MAX_SEARCH_THREADS = 3
+
+
+class _SearchSignals(QtCore.QObject):
+    """查找任务的信号，在主线程创建，工作线程中发出的信号排队到主线程处理"""
+
+    found = QtCore.Signal(int, object)  # 传递请求编号和找到的缓存信息
+    finished = QtCore.Signal(int, object)  # 传递请求编号和查找结果
+    error = QtCore.Signal(int, str)  # 传递请求编号和错误信息
+
+
+class _SearchJob(QtCore.QRunnable):
+    """在线程池中运行的查找任务"""
+
+    def __init__(self, request_id, search, cancel_event, signals):
+        """初始化查找任务
+
+        Args:
+            request_id: 请求编号
+            search: 查找函数，参数为 (cancel_event, on_found)，返回查找结果
+            cancel_event: 取消标记
+            signals: _SearchSignals 实例
+        """
+        super(_SearchJob, self).__init__()
+        self.request_id = request_id
+        self.search = search
+        self.cancel_event = cancel_event
+        self.signals = signals
+        self.setAutoDelete(True)
+
+    def _on_found(self, cache_info):
+        if not self.cancel_event.is_set():
+            self.signals.found.emit(self.request_id, cache_info)
+
+    def run(self):
+        """运行任务，排队期间已被取代的任务直接返回"""
+        if self.cancel_event.is_set():
+            return
+        try:
+            result = self.search(self.cancel_event, self._on_found)
+        except ScanCancelled:
+            return
+        except Exception as e:
+            if not self.cancel_event.is_set():
+                self.signals.error.emit(self.request_id, str(e))
+            return
+        if not self.cancel_event.is_set():
+            self.signals.finished.emit(self.request_id, result)
+
+
+class CacheSearchExecutor(QtCore.QObject):
+    """缓存查找执行器
+
+    查找任务在线程池中运行，按通道（"cloth"、"xgen"、"shot"）合并：同一通道提交新请求时取消上一个请求，
+    只交付最新请求的结果。取消是协作式的，查找函数在扫描循环中检查取消标记并尽快退出，主线程不等待。
+    """
+
+    found_signal = QtCore.Signal(str, object)  # 传递通道和找到的缓存信息，用于逐步显示
+    finished_signal = QtCore.Signal(str, object)  # 传递通道和查找结果
+    error_signal = QtCore.Signal(str, str)  # 传递通道和错误信息
+
+    def __init__(self, parent=None, max_threads=MAX_SEARCH_THREADS):
+        super(CacheSearchExecutor, self).__init__(parent)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._signals = _SearchSignals(self)
+        self._signals.found.connect(self._on_found)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.error.connect(self._on_error)
+        self._request_ids = itertools.count(1)
+        # 通道到最新请求 (请求编号, 取消标记) 的映射
+        self._latest = {}
+
+    def submit(self, channel, search):
+        """提交查找请求，取消同一通道中尚未完成的请求
+
+        Args:
+            channel: 通道名称
+            search: 查找函数，参数为 (cancel_event, on_found)，返回查找结果
+
+        Returns:
+            int: 请求编号
+        """
+        self.cancel(channel)
+        request_id = next(self._request_ids)
+        cancel_event = threading.Event()
+        self._latest[channel] = (request_id, cancel_event)
+        self._pool.start(_SearchJob(request_id, search, cancel_event, self._signals))
+        return request_id
+
+    def cancel(self, channel):
+        """取消通道中尚未完成的请求，不等待线程结束
+
+        Returns:
+            bool: 是否有被取消的请求
+        """
+        latest = self._latest.pop(channel, None)
+        if latest is None:
+            return False
+        latest[1].set()
+        return True
+
+    def is_busy(self, channel):
+        """通道中是否有尚未完成的请求"""
+        return channel in self._latest
+
+    def shutdown(self, msecs=5000):
+        """取消所有请求并等待线程池中的任务退出
+
+        Args:
+            msecs: 最长等待时间（毫秒）
+        """
+        for channel in list(self._latest):
+            self.cancel(channel)
+        self._pool.waitForDone(msecs)
+
+    def _channel_of(self, request_id):
+        """请求仍是所在通道的最新请求时返回通道名称，否则返回None"""
+        for channel, (latest_id, _) in self._latest.items():
+            if latest_id == request_id:
+                return channel
+        return None
+
+    def _on_found(self, request_id, cache_info):
+        channel = self._channel_of(request_id)
+        if channel is not None:
+            self.found_signal.emit(channel, cache_info)
+
+    def _on_finished(self, request_id, result):
+        channel = self._channel_of(request_id)
+        if channel is not None:
+            del self._latest[channel]
+            self.finished_signal.emit(channel, result)
+
+    def _on_error(self, request_id, error_msg):
+        channel = self._channel_of(request_id)
+        if channel is not None:
+            del self._latest[channel]
+            self.error_signal.emit(channel, error_msg)
+
+
+class ShotCaches:
+    """当前镜头所有资产的布料和XGen缓存列表
+
+    选择镜头时由 CacheSearchExecutor 的 "shot" 通道一次填充，之后选择资产直接从内存读取；切换镜头或刷新时显式失效。
+    """
+
+    def __init__(self):
+        self.key = None
+        # 资产ID（小写）到 {类型: 缓存列表} 的映射
+        self._assets = {}
+        # 正在预取的资产ID（小写）
+        self.pending = set()
+
+    def matches(self, episode, sequence, shot):
+        """是否为指定镜头的缓存"""
+        return self.key == (episode, sequence, shot)
+
+    def reset(self, episode=None, sequence=None, shot=None, pending=()):
+        """切换到新镜头，清空所有缓存列表
 
-    def __init__(self, asset_manager, episode, sequence, shot, asset_id, cache_type):
-        """初始化搜索线程
-        
         Args:
-            asset_manager: 资产管理器实例
             episode: 剧集
             sequence: 场次
             shot: 镜头号
-            asset_id: 资产ID
-            cache_type: 缓存类型，"cloth"或"xgen"
+            pending: 即将预取的资产ID
         """
-        super(CacheThread, self).__init__()
-        self.asset_manager = asset_manager
-        self.episode = episode
-        self.sequence = sequence
-        self.shot = shot
-        self.asset_id = asset_id
-        self.cache_type = cache_type
-        self.is_running = True
+        self.key = (episode, sequence, shot) if shot else None
+        self._assets = {}
+        self.pending = {asset_id.lower() for asset_id in pending}
 
-    def run(self):
-        """运行线程"""
-        try:
-            if not all([self.episode, self.sequence, self.shot, self.asset_id]):
-                self.error_signal.emit("缺少必要信息，无法查找缓存")
-                return
+    def get(self, asset_id, cache_type):
+        """获取资产的缓存列表
 
-            # 根据类型调用不同的查找方法
-            if self.cache_type == "cloth":
-                try:
-                    caches = self.asset_manager.find_cloth_caches(
-                        self.episode, self.sequence, self.shot, self.asset_id
-                    )
-                    self.update_signal.emit(caches, "cloth")
-                    self.finished_signal.emit("cloth", len(caches))
-                except Exception as e:
-                    self.error_signal.emit(f"查找布料缓存时出错: {str(e)}")
-            elif self.cache_type == "xgen":
-                try:
-                    caches = self.asset_manager.find_xgen_caches(
-                        self.episode, self.sequence, self.shot, self.asset_id
-                    )
-                    self.update_signal.emit(caches, "xgen")
-                    self.finished_signal.emit("xgen", len(caches))
-                except Exception as e:
-                    self.error_signal.emit(f"查找XGen缓存时出错: {str(e)}")
-        except Exception as e:
-            self.error_signal.emit(f"查找缓存时发生错误: {str(e)}")
-        finally:
-            self.is_running = False
+        Returns:
+            list | None: 缓存列表，尚未加载时返回None
+        """
+        return self._assets.get(asset_id.lower(), {}).get(cache_type)
 
-    def stop(self):
-        """停止线程"""
-        self.is_running = False
-        self.wait()
+    def is_pending(self, asset_id):
+        """资产的缓存是否正在预取"""
+        return asset_id.lower() in self.pending
+
+    def set(self, asset_id, cache_type, caches):
+        """保存单个资产一种类型的缓存列表"""
+        self._assets.setdefault(asset_id.lower(), {})[cache_type] = caches
+
+    def update(self, asset_caches):
+        """保存预取结果
+
+        Args:
+            asset_caches: {asset_id: {类型: 缓存列表}}
+        """
+        for asset_id, caches in asset_caches.items():
+            self._assets.setdefault(asset_id.lower(), {}).update(caches)
+            self.pending.discard(asset_id.lower())
+
+    def invalidate(self, asset_id=None):
+        """使缓存列表失效
+
+        Args:
+            asset_id: 资产ID，为None时清空整个镜头
+        """
+        if asset_id is None:
+            self._assets = {}
+        else:
+            self._assets.pop(asset_id.lower(), None)
 
 
 class XGenBlendShapeDialog(QtWidgets.QDialog):
@@ -543,8 +691,9 @@ class XGenBlendShapeDialog(QtWidgets.QDialog):
             # 7. 添加publish/xgen_mesh子目录
             fur_cache_dir = os.path.join(fur_cache_dir, "publish", "xgen_mesh")
             
-            # 8. 检查目录是否存在
-            if not os.path.exists(fur_cache_dir):
+            # 8. 从缓存索引读取目录中的文件，同时检查目录是否存在
+            records = get_cache_index().get_files(fur_cache_dir)
+            if records is None:
                 QtWidgets.QMessageBox.warning(
                     self, 
                     "警告", 
@@ -567,7 +716,6 @@ class XGenBlendShapeDialog(QtWidgets.QDialog):
             QtWidgets.QApplication.processEvents()
             
             # 10. 在目录中查找匹配当前资产的.abc文件
-            matching_files = []
             file_pattern = f"{fur_sequence}_{fur_shot}_xgenMesh_{asset_id.lower()}_*.abc"
             print(f"搜索文件模式: {file_pattern}")
             
@@ -576,35 +724,23 @@ class XGenBlendShapeDialog(QtWidgets.QDialog):
             QtWidgets.QApplication.processEvents()
             
             # 列出所有匹配的文件 - 改进匹配逻辑，忽略xgenMesh部分的大小写
-            for filename in os.listdir(fur_cache_dir):
-                # 使用正则表达式进行更灵活的匹配，忽略xgenMesh部分的大小写
-                file_lower = filename.lower()
-                pattern_lower = f"{fur_sequence.lower()}_{fur_shot.lower()}_xgenmesh_{asset_id.lower()}_"
-                
-                # 检查文件名是否匹配模式并以.abc结尾
-                if file_lower.startswith(pattern_lower) and file_lower.endswith(".abc"):
-                    matching_files.append(filename)
-                    print(f"找到匹配文件: {filename}")
+            pattern_lower = f"{fur_sequence.lower()}_{fur_shot.lower()}_xgenmesh_{asset_id.lower()}_"
+            matching_records = [record for record in records
+                                if record["filename"].lower().startswith(pattern_lower)]
                     
-            # 备用方案：如果未找到文件，尝试直接列出目录内容并手动检查
-            if not matching_files:
-                print(f"未找到匹配的文件，列出目录内容:")
-                try:
-                    all_files = os.listdir(fur_cache_dir)
-                    for file in all_files:
-                        print(f"  - {file}")
-                        
-                        # 使用更宽松的匹配条件，只检查关键部分
-                        if (asset_id.lower() in file.lower() and 
-                            fur_sequence.lower() in file.lower() and 
-                            fur_shot.lower() in file.lower() and 
-                            file.lower().endswith(".abc")):
-                            print(f"  ✓ 使用宽松条件匹配到文件: {file}")
-                            matching_files.append(file)
-                except Exception as e:
-                    print(f"列出目录内容时出错: {str(e)}")
-            
-            if not matching_files:
+            # 备用方案：如果未找到文件，使用更宽松的匹配条件，只检查关键部分
+            if not matching_records:
+                print(f"未找到匹配的文件，目录内容:")
+                for record in records:
+                    file_lower = record["filename"].lower()
+                    print(f"  - {record['filename']}")
+                    if (asset_id.lower() in file_lower and 
+                        fur_sequence.lower() in file_lower and 
+                        fur_shot.lower() in file_lower):
+                        print(f"  ✓ 使用宽松条件匹配到文件: {record['filename']}")
+                        matching_records.append(record)
+            
+            if not matching_records:
                 progress_dialog.close()
                 QtWidgets.QMessageBox.warning(
                     self, 
@@ -613,13 +749,12 @@ class XGenBlendShapeDialog(QtWidgets.QDialog):
                 )
                 return
                 
-            # 如果找到多个文件，使用最新的文件
-            if len(matching_files) > 1:
-                print(f"找到多个匹配文件，将使用最新的文件")
-                # 按修改时间排序
-                matching_files.sort(key=lambda x: os.path.getmtime(os.path.join(fur_cache_dir, x)), reverse=True)
-            
-            selected_file = matching_files[0]
+            # 文件名末尾的 _01、_02 是资产的实例序号而不是版本号，按修改时间选择最新导出的文件；
+            # 修改时间来自缓存索引，不再逐个读取文件
+            if len(matching_records) > 1:
+                print(f"找到 {len(matching_records)} 个匹配文件，将使用最新的文件")
+            selected_record = max(matching_records, key=lambda record: record["mtime"])
+            selected_file = selected_record["filename"]
             full_path = os.path.join(fur_cache_dir, selected_file).replace("\\", "/")
             print(f"选择文件: {full_path}")
             
@@ -1054,12 +1189,16 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         self.current_shot = ""
         self.current_asset_id = ""
         
-        # 搜索线程
-        self.cloth_thread = None
-        self.xgen_thread = None
+        # 缓存查找执行器，布料、XGen和镜头预取各为一个通道，只交付最新请求的结果
+        self.search_executor = CacheSearchExecutor(self)
+        self.search_executor.found_signal.connect(self._on_search_found)
+        self.search_executor.finished_signal.connect(self._on_search_finished)
+        self.search_executor.error_signal.connect(self._on_search_error)
         
-        # 缓存机制
-        self.cache = {}  # 格式: {(episode, sequence, shot, asset_id, type): caches}
+        # 镜头级缓存，选择镜头时预取所有资产的缓存列表
+        self.shot_caches = ShotCaches()
+        # 列表当前对应的完整缓存列表（含旧版本），切换只显示最新版本时重新筛选
+        self._displayed_caches = {"cloth": None, "xgen": None}
         
         # 跟踪当前打开的XGenBlendShapeDialog
         self.xgen_bs_dialog = None
@@ -1072,6 +1211,13 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
+        # 版本筛选
+        self.latest_only_check = QtWidgets.QCheckBox("只显示最新版本")
+        self.latest_only_check.setToolTip("每个资产的布料或XGen描述只显示版本号最高的缓存")
+        self.latest_only_check.setChecked(True)
+        self.latest_only_check.toggled.connect(self._on_latest_only_toggled)
+        main_layout.addWidget(self.latest_only_check)
+        
         # 布料缓存部分
         cloth_group = QtWidgets.QGroupBox("布料缓存")
         cloth_layout = QtWidgets.QVBoxLayout(cloth_group)
@@ -1101,11 +1247,11 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         
         self.refresh_cloth_btn = QtWidgets.QPushButton("刷新")
         self.refresh_cloth_btn.setToolTip("刷新布料缓存列表")
-        self.refresh_cloth_btn.clicked.connect(lambda: self._refresh_caches("cloth", False))
+        self.refresh_cloth_btn.clicked.connect(lambda: self._refresh_caches("cloth", True))
         
         self.stop_cloth_btn = QtWidgets.QPushButton("停止")
         self.stop_cloth_btn.setToolTip("停止查找缓存")
-        self.stop_cloth_btn.clicked.connect(lambda: self._stop_search("cloth"))
+        self.stop_cloth_btn.clicked.connect(lambda: self._on_stop_clicked("cloth"))
         self.stop_cloth_btn.setEnabled(False)
         
         cloth_btn_layout.addWidget(self.import_cloth_btn)
@@ -1146,11 +1292,11 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         
         self.refresh_xgen_btn = QtWidgets.QPushButton("刷新")
         self.refresh_xgen_btn.setToolTip("刷新XGen缓存列表")
-        self.refresh_xgen_btn.clicked.connect(lambda: self._refresh_caches("xgen", False))
+        self.refresh_xgen_btn.clicked.connect(lambda: self._refresh_caches("xgen", True))
         
         self.stop_xgen_btn = QtWidgets.QPushButton("停止")
         self.stop_xgen_btn.setToolTip("停止查找缓存")
-        self.stop_xgen_btn.clicked.connect(lambda: self._stop_search("xgen"))
+        self.stop_xgen_btn.clicked.connect(lambda: self._on_stop_clicked("xgen"))
         self.stop_xgen_btn.setEnabled(False)
         
         xgen_btn_layout.addWidget(self.xgen_blendshape_btn)
@@ -1171,6 +1317,89 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         # 在这里只设置连接方式，实际的线程创建在需要时进行
         pass
         
+    def prefetch_shot(self, episode, sequence, shot, asset_ids, refresh=False):
+        """在后台一次扫描镜头的缓存目录，预取镜头中所有资产的缓存列表
+        
+        Args:
+            episode: 剧集
+            sequence: 场次
+            shot: 镜头
+            asset_ids: 镜头中的资产ID列表
+            refresh: 是否重新扫描缓存目录，不使用缓存索引
+        """
+        if not refresh and self.shot_caches.matches(episode, sequence, shot):
+            return
+        
+        self.search_executor.cancel("shot")
+        self.shot_caches.reset(episode, sequence, shot, asset_ids)
+        if not asset_ids:
+            return
+        
+        key = (episode, sequence, shot)
+        asset_ids = list(asset_ids)
+        
+        def search(cancel_event, on_found):
+            return key, self.asset_manager.find_shot_caches(*key, asset_ids, refresh, cancel_event)
+        
+        self.search_executor.submit("shot", search)
+        
+    def invalidate_shot_caches(self):
+        """使当前镜头的缓存列表失效，下次选择资产时重新查找"""
+        self.search_executor.cancel("shot")
+        self.shot_caches.reset()
+        
+    def _on_prefetch_loaded(self, key, asset_caches):
+        """处理预取结果
+        
+        Args:
+            key: 镜头键 (episode, sequence, shot)
+            asset_caches: {asset_id: {类型: 缓存列表}}
+        """
+        if not self.shot_caches.matches(*key):
+            return
+        self.shot_caches.update(asset_caches)
+        
+        # 预取期间选择的资产，此时显示其缓存列表
+        if self.current_asset_id and self.shot_caches.matches(self.current_episode, self.current_sequence,
+                                                              self.current_shot):
+            for cache_type in ("cloth", "xgen"):
+                caches = self.shot_caches.get(self.current_asset_id, cache_type)
+                if caches is not None:
+                    self._show_caches(caches, cache_type)
+        
+    def _on_prefetch_error(self, error_msg):
+        """预取失败时清除等待状态，当前资产改为单独查找"""
+        self.shot_caches.pending.clear()
+        if self.current_asset_id:
+            self._refresh_caches("cloth", False)
+            self._refresh_caches("xgen", False)
+        
+    def _show_caches(self, caches, cache_type):
+        """显示缓存列表并更新状态"""
+        self._on_search_complete(cache_type, len(caches))
+        self._display_caches(caches, cache_type)
+        
+    def _display_caches(self, caches, cache_type):
+        """按版本筛选填充列表
+        
+        Args:
+            caches: 完整的缓存列表
+            cache_type: 缓存类型，"cloth"或"xgen"
+        """
+        visible = caches
+        if self.latest_only_check.isChecked():
+            visible = [cache for cache in caches if cache.get("is_latest", True)]
+        self._process_cache_results(visible, cache_type)
+        self._displayed_caches[cache_type] = caches
+        if len(visible) != len(caches):
+            self._update_count_label(cache_type, len(visible), len(caches))
+        
+    def _on_latest_only_toggled(self, checked):
+        """切换只显示最新版本，用已有结果重新筛选，不重新查找"""
+        for cache_type, caches in self._displayed_caches.items():
+            if caches is not None:
+                self._display_caches(caches, cache_type)
+        
     def update_cache_lists(self, episode, sequence, shot, asset_id):
         """更新缓存列表，显示指定资产的缓存文件
         
@@ -1186,6 +1415,11 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         self.current_shot = shot
         self.current_asset_id = asset_id
         
+        # 未经预取的镜头，逐个资产查找的结果同样保存在镜头缓存中
+        if not self.shot_caches.matches(episode, sequence, shot):
+            self.search_executor.cancel("shot")
+            self.shot_caches.reset(episode, sequence, shot)
+        
         # 如果资产ID改变，关闭可能打开的XGenBlendShapeDialog
         if hasattr(self, 'xgen_bs_dialog') and self.xgen_bs_dialog is not None:
             try:
@@ -1205,6 +1439,8 @@ class CacheBrowserWidget(QtWidgets.QWidget):
             cache_type (str): 缓存类型，"cloth"或"xgen"
             force (bool): 是否强制刷新
         """
+        if force:
+            self.shot_caches.invalidate(self.current_asset_id or None)
         if cache_type == "cloth":
             self._search_cloth_caches(force_refresh=force)
         else:
@@ -1216,46 +1452,7 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         参数:
             force_refresh (bool): 是否强制刷新，不使用缓存
         """
-        if not all([self.current_episode, self.current_sequence, self.current_shot, self.current_asset_id]):
-            self._update_status("cloth", "请先选择资产")
-            return
-            
-        # 尝试从缓存获取
-        cache_key = (self.current_episode, self.current_sequence, self.current_shot, self.current_asset_id, "cloth")
-        if not force_refresh and cache_key in self.cache:
-            self._process_cache_results(self.cache[cache_key], "cloth")
-            return
-            
-        # 停止现有搜索
-        self._stop_search("cloth")
-        
-        # 更新UI状态
-        self._update_status("cloth", "正在搜索缓存...")
-        self._set_stop_button_enabled("cloth", True)
-        
-        # 清空列表
-        self._clear_list("cloth")
-        
-        # 创建并启动搜索线程
-        thread = CacheThread(
-            self.asset_manager,
-            self.current_episode,
-            self.current_sequence,
-            self.current_shot,
-            self.current_asset_id,
-            "cloth"
-        )
-        
-        # 连接信号
-        thread.update_signal.connect(self._on_thread_update)
-        thread.error_signal.connect(self._on_thread_error)
-        thread.finished_signal.connect(self._on_thread_finished)
-        
-        # 保存线程引用
-        self.cloth_thread = thread
-        
-        # 启动线程
-        thread.start()
+        self._search_caches("cloth", force_refresh)
     
     def _search_xgen_caches(self, force_refresh=False):
         """搜索XGen缓存
@@ -1263,71 +1460,115 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         参数:
             force_refresh (bool): 是否强制刷新，不使用缓存
         """
+        self._search_caches("xgen", force_refresh)
+        
+    def _search_caches(self, cache_type, force_refresh=False):
+        """在后台查找当前资产的缓存，结果逐步显示
+        
+        参数:
+            cache_type (str): 缓存类型，"cloth"或"xgen"
+            force_refresh (bool): 是否强制刷新，不使用缓存
+        """
         if not all([self.current_episode, self.current_sequence, self.current_shot, self.current_asset_id]):
-            self._update_status("xgen", "请先选择资产")
+            self._update_status(cache_type, "请先选择资产")
             return
             
-        # 尝试从缓存获取
-        cache_key = (self.current_episode, self.current_sequence, self.current_shot, self.current_asset_id, "xgen")
-        if not force_refresh and cache_key in self.cache:
-            self._process_cache_results(self.cache[cache_key], "xgen")
+        # 优先使用镜头预取的结果
+        if not force_refresh and self._use_shot_caches(cache_type):
             return
-            
-        # 停止现有搜索
-        self._stop_search("xgen")
         
         # 更新UI状态
-        self._update_status("xgen", "正在搜索缓存...")
-        self._set_stop_button_enabled("xgen", True)
+        self._clear_list(cache_type)
+        self._update_status(cache_type, "正在搜索缓存...")
+        self._set_stop_button_enabled(cache_type, True)
         
-        # 清空列表
-        self._clear_list("xgen")
+        # 提交查找请求，同一类型中尚未完成的查找会被取消
+        key = (self.current_episode, self.current_sequence, self.current_shot)
+        asset_id = self.current_asset_id
+        if cache_type == "cloth":
+            finder = self.asset_manager.find_cloth_caches
+        else:
+            finder = self.asset_manager.find_xgen_caches
         
-        # 创建并启动搜索线程
-        thread = CacheThread(
-            self.asset_manager,
-            self.current_episode,
-            self.current_sequence,
-            self.current_shot,
-            self.current_asset_id,
-            "xgen"
-        )
+        def search(cancel_event, on_found):
+            return key, asset_id, finder(*key, asset_id, force_refresh, cancel_event, on_found)
         
-        # 连接信号
-        thread.update_signal.connect(self._on_thread_update)
-        thread.error_signal.connect(self._on_thread_error)
-        thread.finished_signal.connect(self._on_thread_finished)
+        self.search_executor.submit(cache_type, search)
         
-        # 保存线程引用
-        self.xgen_thread = thread
+    def _use_shot_caches(self, cache_type):
+        """从镜头缓存显示当前资产的缓存列表
         
-        # 启动线程
-        thread.start()
+        Args:
+            cache_type: 缓存类型，"cloth"或"xgen"
+            
+        Returns:
+            bool: 已加载或正在预取时返回True，否则需要单独查找
+        """
+        if not self.shot_caches.matches(self.current_episode, self.current_sequence, self.current_shot):
+            return False
+        caches = self.shot_caches.get(self.current_asset_id, cache_type)
+        if caches is not None:
+            self._stop_search(cache_type)
+            self._show_caches(caches, cache_type)
+            return True
+        if self.shot_caches.is_pending(self.current_asset_id) and self.search_executor.is_busy("shot"):
+            self._stop_search(cache_type)
+            self._clear_list(cache_type)
+            self._update_status(cache_type, "正在预取镜头缓存...")
+            return True
+        return False
+        
+    def _on_search_found(self, channel, cache_info):
+        """查找过程中每找到一个缓存时追加到列表
         
-    def _on_thread_update(self, caches, cache_type):
-        """处理线程更新信号
+        Args:
+            channel: 查找通道，"cloth"或"xgen"
+            cache_info: 缓存信息
+        """
+        if channel not in ("cloth", "xgen"):
+            return
+        self._add_cache_item(channel, cache_info)
+        list_widget = self.cloth_list if channel == "cloth" else self.xgen_list
+        self._update_count_label(channel, list_widget.count())
+        
+    def _on_search_finished(self, channel, result):
+        """处理查找完成
         
         Args:
-            caches: 找到的缓存列表
-            cache_type: 缓存类型，"cloth"或"xgen"
+            channel: 查找通道，"cloth"、"xgen"或"shot"
+            result: 查找结果
         """
-        # 更新缓存
-        cache_key = (self.current_episode, self.current_sequence, self.current_shot, self.current_asset_id, cache_type)
-        self.cache[cache_key] = caches
+        if channel == "shot":
+            self._on_prefetch_loaded(*result)
+            return
         
-        # 处理结果
-        self._process_cache_results(caches, cache_type)
+        key, asset_id, caches = result
+        # 保存到镜头缓存
+        if self.shot_caches.matches(*key):
+            self.shot_caches.set(asset_id, channel, caches)
         
-    def _on_thread_error(self, error_msg):
-        """处理线程错误信号
+        # 按完整结果重新填充列表，顺序与文件名一致
+        self._show_caches(caches, channel)
+        
+    def _on_search_error(self, channel, error_msg):
+        """处理查找错误
         
         Args:
+            channel: 查找通道
             error_msg: 错误信息
         """
-        mc.warning(error_msg)
+        if channel == "shot":
+            mc.warning(f"预取镜头缓存时出错: {error_msg}")
+            self._on_prefetch_error(error_msg)
+            return
+        
+        type_name = "布料" if channel == "cloth" else "XGen"
+        mc.warning(f"查找{type_name}缓存时出错: {error_msg}")
+        self._update_status(channel, "查找缓存时出错")
+        self._set_stop_button_enabled(channel, False)
         
-    def _on_thread_finished(self, cache_type, count):
-        """处理线程完成信号
+    def _on_search_complete(self, cache_type, count):
+        """更新查找完成后的状态
         
         Args:
             cache_type: 缓存类型，"cloth"或"xgen"
@@ -1364,17 +1605,19 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         else:
             self.xgen_status_label.setText(status)
             
-    def _update_count_label(self, cache_type, count):
+    def _update_count_label(self, cache_type, count, total=None):
         """更新缓存数量标签
         
         参数:
             cache_type (str): 缓存类型，"cloth"或"xgen"
-            count (int): 缓存数量
+            count (int): 显示的缓存数量
+            total (int): 可选，包含旧版本的缓存总数
         """
+        text = f"{count} 个缓存" if total is None else f"{count}/{total} 个缓存"
         if cache_type == "cloth":
-            self.cloth_count_label.setText(f"{count} 个缓存")
+            self.cloth_count_label.setText(text)
         else:
-            self.xgen_count_label.setText(f"{count} 个缓存")
+            self.xgen_count_label.setText(text)
             
     def _set_stop_button_enabled(self, cache_type, enabled):
         """设置停止按钮状态
@@ -1394,25 +1637,25 @@ class CacheBrowserWidget(QtWidgets.QWidget):
         Args:
             cache_type: 缓存类型，"cloth"或"xgen"
         """
+        self._displayed_caches[cache_type] = None
         if cache_type == "cloth":
             self.cloth_list.clear()
         else:
             self.xgen_list.clear()
             
     def _stop_search(self, cache_type):
-        """停止搜索
+        """取消尚未完成的查找，不等待线程结束
         
         Args:
             cache_type: 缓存类型，"cloth"或"xgen"
         """
-        if cache_type == "cloth" and self.cloth_thread is not None:
-            self.cloth_thread.stop()
-            self.cloth_thread = None
-            self._set_stop_button_enabled("cloth", False)
-        elif cache_type == "xgen" and self.xgen_thread is not None:
-            self.xgen_thread.stop()
-            self.xgen_thread = None
-            self._set_stop_button_enabled("xgen", False)
+        if self.search_executor.cancel(cache_type):
+            self._set_stop_button_enabled(cache_type, False)
+            
+    def _on_stop_clicked(self, cache_type):
+        """停止按钮，取消查找并保留已找到的结果"""
+        self._stop_search(cache_type)
+        self._update_status(cache_type, "已停止查找")
             
     def _update_cloth_list(self, cloth_caches):
         """更新布料缓存列表
@@ -1421,24 +1664,8 @@ class CacheBrowserWidget(QtWidgets.QWidget):
             cloth_caches: 布料缓存列表
         """
         self._clear_list("cloth")
-        
-        # 填充列表 - 简化版本，只显示文件名
         for cache in cloth_caches:
-            filename = cache.get("filename", "")
-            item = QtWidgets.QListWidgetItem(filename)
-            
-            # 设置工具提示显示完整路径
-            item.setToolTip(cache.get("path", ""))
-            
-            # 保存完整路径供后续使用
-            item.setData(QtCore.Qt.UserRole, cache.get("path", ""))
-            
-            # 保存其他信息以便需要时使用
-            version = cache.get("version", 0)
-            item.setData(QtCore.Qt.UserRole + 1, version)
-            
-            # 添加到列表
-            self.cloth_list.addItem(item)
+            self._add_cache_item("cloth", cache)
             
         # 更新计数
         self._update_count_label("cloth", len(cloth_caches))
@@ -1450,27 +1677,41 @@ class CacheBrowserWidget(QtWidgets.QWidget):
             xgen_caches: XGen缓存列表
         """
         self._clear_list("xgen")
-        
-        # 填充列表 - 简化版本，只显示文件名
         for cache in xgen_caches:
-            filename = cache.get("filename", "")
-            item = QtWidgets.QListWidgetItem(filename)
-            
-            # 设置工具提示显示完整路径和描述
-            tooltip = f"{cache.get('path', '')}\n描述: {cache.get('description', '')}"
-            item.setToolTip(tooltip)
-            
-            # 保存完整路径供后续使用
-            item.setData(QtCore.Qt.UserRole, cache.get("path", ""))
-            
-            # 保存描述信息
-            item.setData(QtCore.Qt.UserRole + 1, cache.get("description", ""))
-            
-            # 添加到列表
-            self.xgen_list.addItem(item)
+            self._add_cache_item("xgen", cache)
             
         # 更新计数
         self._update_count_label("xgen", len(xgen_caches))
+        
+    def _add_cache_item(self, cache_type, cache):
+        """向列表添加一个缓存项 - 简化版本，只显示文件名
+        
+        Args:
+            cache_type: 缓存类型，"cloth"或"xgen"
+            cache: 缓存信息
+        """
+        item = QtWidgets.QListWidgetItem(cache.get("filename", ""))
+        
+        # 保存完整路径供后续使用
+        item.setData(QtCore.Qt.UserRole, cache.get("path", ""))
+        
+        # 版本信息来自缓存目录的版本目录，逐步显示时还没有
+        version_text = ""
+        if "version_count" in cache:
+            version_text = f"\n版本: {cache.get('version')}（共 {cache['version_count']} 个版本）"
+            if not cache.get("is_latest", True):
+                item.setForeground(QtGui.QBrush(QtGui.QColor("#888888")))
+        
+        if cache_type == "cloth":
+            # 设置工具提示显示完整路径，保存版本信息以便需要时使用
+            item.setToolTip(cache.get("path", "") + version_text)
+            item.setData(QtCore.Qt.UserRole + 1, cache.get("version", 0))
+            self.cloth_list.addItem(item)
+        else:
+            # 设置工具提示显示完整路径和描述，保存描述信息
+            item.setToolTip(f"{cache.get('path', '')}\n描述: {cache.get('description', '')}{version_text}")
+            item.setData(QtCore.Qt.UserRole + 1, cache.get("description", ""))
+            self.xgen_list.addItem(item)
             
     def _import_selected_caches(self, cache_type):
         """导入选中的缓存文件"""
@@ -1763,8 +2004,7 @@ class CacheBrowserWidget(QtWidgets.QWidget):
             
     def closeEvent(self, event):
         """窗口关闭事件，确保线程停止"""
-        self._stop_search("cloth")
-        self._stop_search("xgen")
+        self.search_executor.shutdown()
         
         # 关闭可能打开的XGenBlendShapeDialog
         if hasattr(self, 'xgen_bs_dialog') and self.xgen_bs_dialog is not None:
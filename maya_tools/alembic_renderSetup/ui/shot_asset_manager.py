@@ -295,6 +295,10 @@ class ShotAssetManagerUI(QtWidgets.QDialog):
             self.prop_list.addItem(item)
         self.load_camera_list()
 
+        # 后台预取镜头中所有资产的布料和XGen缓存，之后选择资产时直接显示
+        asset_ids = [asset.split(" ")[0] for asset in assets["Chars"] + assets["Props"]]
+        self.cache_browser.prefetch_shot(episode, sequence, shot_id, asset_ids)
+
     def show_char_context_menu(self, position):
         """显示角色列表的右键菜单"""
         self._show_asset_context_menu(self.char_list, position, "Chars")
@@ -521,8 +525,10 @@ class ShotAssetManagerUI(QtWidgets.QDialog):
             char_id = item.text().split(" (")[0]
             status = asset_status.get(char_id, {})
 
-            # 获取资产对应的ABC文件数量
-            abc_count = self._get_asset_abc_count(char_id)
+            # 获取资产对应的ABC文件数量，批量检查时已经统计
+            abc_count = status.get("abc_count")
+            if abc_count is None:
+                abc_count = self._get_asset_abc_count(char_id)
 
             # 更新项目文本，添加数量信息
             item.setText(f"{char_id} ({abc_count})")
@@ -549,8 +555,10 @@ class ShotAssetManagerUI(QtWidgets.QDialog):
             prop_id = item.text().split(" (")[0]
             status = asset_status.get(prop_id, {})
 
-            # 获取资产对应的ABC文件数量
-            abc_count = self._get_asset_abc_count(prop_id)
+            # 获取资产对应的ABC文件数量，批量检查时已经统计
+            abc_count = status.get("abc_count")
+            if abc_count is None:
+                abc_count = self._get_asset_abc_count(prop_id)
 
             # 更新项目文本，添加数量信息
             item.setText(f"{prop_id} ({abc_count})")
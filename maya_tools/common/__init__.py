@@ -1,16 +1,37 @@
-from .path_manager import PathManager
-from .asset_manager import AssetManager
-from .maya_utils import handle_error, show_progress, update_progress, end_progress, import_reference
-from .config_manager import ConfigManager
+"""
+通用模块
+
+公共类和函数在第一次访问时才导入所在的子模块，因此 cache_index、camera_utils 等不依赖Maya的子模块
+可以在Maya外导入和测试。
+"""
+
+import importlib
+
+# 公共名称到所在子模块
+_EXPORTS = {
+    'PathManager': 'path_manager',
+    'AssetManager': 'asset_manager',
+    'handle_error': 'maya_utils',
+    'show_progress': 'maya_utils',
+    'update_progress': 'maya_utils',
+    'end_progress': 'maya_utils',
+    'import_reference': 'maya_utils',
+    'ConfigManager': 'config_manager',
+    'get_config_manager': 'config_manager',
+    'SceneIndex': 'scene_index',
+    'get_scene_index': 'scene_index',
+    'invalidate_scene_index': 'scene_index',
+    'CacheIndex': 'cache_index',
+    'get_cache_index': 'cache_index',
+    'parse_camera_frame_range': 'camera_utils',
+}
 
 # 导出公共函数和类
-__all__ = [
-    'PathManager', 
-    'AssetManager', 
-    'handle_error', 
-    'show_progress', 
-    'update_progress', 
-    'end_progress', 
-    'import_reference',
-    'ConfigManager'
-] 
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """按需导入公共名称所在的子模块"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -2,6 +2,7 @@ import os
 import json
 import maya.cmds as mc
 from .path_manager import PathManager
+from .scene_index import get_scene_index
 
 class AssetManager:
     """资产管理类，处理角色和道具等资产的共用逻辑"""
@@ -61,40 +62,17 @@ class AssetManager:
             return "Unknown"
     
     def find_geometry_by_pattern(self, pattern_prefix):
-        """根据前缀模式查找几何体"""
-        import re
-        asset_meshes = {}
+        """根据前缀模式查找几何体
         
-        # 获取所有 transform 节点
-        all_transforms = mc.ls(type="transform", long=True)
+        使用共享的场景索引，一次查询得到所有Geometry组及其父节点，不再逐个transform调用ls
         
-        # 正则表达式模式
-        pattern = rf"{pattern_prefix.lower()}(\d+)"
-        
-        for node in all_transforms:
-            # 获取节点的短名称
-            short_name = node.split('|')[-1].lower()
+        Args:
+            pattern_prefix: 资产前缀，如 "c" 表示角色，"p" 表示道具
             
-            # 查找匹配的节点
-            match = re.search(pattern, short_name)
-            if match:
-                asset_id = f"{pattern_prefix.upper()}{match.group(1)}"
-                
-                # 检查是否存在 Geometry 组
-                geometry_path = f"{node}|*:Geometry"
-                geometry_groups = mc.ls(geometry_path, long=True)
-                
-                if geometry_groups:
-                    # 确保字典中有这个资产的条目
-                    if asset_id not in asset_meshes:
-                        asset_meshes[asset_id] = []
-                    
-                    # 添加所有找到的 Geometry 组
-                    for geo_group in geometry_groups:
-                        if geo_group not in asset_meshes[asset_id]:
-                            asset_meshes[asset_id].append(geo_group)
-        
-        return asset_meshes
+        Returns:
+            dict: 资产ID到几何体组列表的映射
+        """
+        return get_scene_index().geometry_by_prefix(pattern_prefix)
     
     def get_char_geometry(self):
         """获取场景中所有角色几何体"""
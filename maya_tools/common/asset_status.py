@@ -0,0 +1,150 @@
+"""
+镜头资产状态批量检查
+
+逐个资产检查时，每个资产都要重新列出镜头的 abc_cache 目录、整个 Asset/<类型> 目录（查找 "资产ID_名称"
+文件夹）以及 LookDev/work 目录，一个20个资产的镜头要在网络盘上列目录60多次。
+
+这里一次检查镜头中的所有资产：abc_cache 和每种资产类型的 Asset/<类型> 目录各只列出一次并建立索引，
+每个资产只需再列出自己的 LookDev/work 和缓存文件夹，这部分可以在线程池中并行。
+目录用 os.scandir 列出；多个LookDev文件按修改时间选择时使用目录项的 stat，Windows上不需要再访问文件。
+
+不依赖Maya，可以在Maya外测试。
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# 并行检查LookDev目录的线程数
+DEFAULT_WORKERS = 8
+LOOKDEV_SUFFIX = "_lookdev.ma"
+
+
+def list_entries(path):
+    """用 os.scandir 列出目录
+
+    Args:
+        path: 目录路径
+
+    Returns:
+        list | None: os.DirEntry 列表，目录不存在或无法读取时返回None
+    """
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return None
+
+
+def build_prefix_map(folder_names):
+    """建立资产ID（小写）到 "资产ID_名称" 文件夹的映射，同一ID有多个文件夹时取第一个
+
+    Args:
+        folder_names: 文件夹名称列表
+
+    Returns:
+        dict: 如 {"c001": "C001_Hero"}
+    """
+    prefix_map = {}
+    for name in folder_names:
+        prefix, separator, _ = name.partition('_')
+        if separator:
+            prefix_map.setdefault(prefix.lower(), name)
+    return prefix_map
+
+
+class AssetStatusChecker:
+    """一次检查镜头中所有资产的abc缓存文件夹和LookDev文件"""
+
+    def __init__(self, anm_path, project_root, lister=list_entries, max_workers=DEFAULT_WORKERS):
+        """初始化
+
+        Args:
+            anm_path: 动画镜头根目录
+            project_root: 项目根目录，资产位于 <project_root>/Asset/<类型>
+            lister: 列目录的函数，返回目录项列表，目录不存在时返回None
+            max_workers: 并行检查的线程数，不大于1时依次检查
+        """
+        self.anm_path = anm_path
+        self.project_root = project_root
+        self.lister = lister
+        self.max_workers = max_workers
+
+    def check_shot(self, episode, sequence, shot, assets):
+        """检查镜头中所有资产的状态
+
+        Args:
+            episode: 剧集
+            sequence: 场次
+            shot: 镜头
+            assets: 资产类型到资产ID列表的映射，如 {"Chars": ["C001"], "Props": ["P001"]}
+
+        Returns:
+            dict: 资产ID到状态的映射，状态包含 cache_exists、abc_count、lookdev_exists、lookdev_path 和 type
+
+        Raises:
+            ValueError: 镜头目录或abc_cache文件夹不存在
+        """
+        shot_path = os.path.join(self.anm_path, episode, sequence, shot, "work")
+        abc_cache_path = os.path.join(shot_path, "abc_cache")
+        abc_entries = self.lister(abc_cache_path)
+        if abc_entries is None:
+            if self.lister(shot_path) is None:
+                raise ValueError(f"路径不存在: {shot_path}")
+            raise ValueError(f"未找到abc_cache文件夹: {abc_cache_path}")
+        cache_folders = {entry.name.lower(): entry.name for entry in abc_entries if entry.is_dir()}
+
+        # 每种资产类型的目录只列出一次
+        jobs = []
+        for asset_type, asset_ids in assets.items():
+            if not asset_ids:
+                continue
+            asset_base_path = os.path.join(self.project_root, "Asset", asset_type)
+            entries = self.lister(asset_base_path) or []
+            prefix_map = build_prefix_map(entry.name for entry in entries)
+            for asset_id in asset_ids:
+                jobs.append((asset_id, asset_type, abc_cache_path, cache_folders.get(asset_id.lower()),
+                             asset_base_path, self._asset_folder(prefix_map, entries, asset_id)))
+
+        if self.max_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+                results = list(pool.map(lambda job: self._check_asset(*job), jobs))
+        else:
+            results = [self._check_asset(*job) for job in jobs]
+        return {job[0]: status for job, status in zip(jobs, results)}
+
+    @staticmethod
+    def _asset_folder(prefix_map, entries, asset_id):
+        """查找资产文件夹，资产ID本身含下划线时按前缀逐个比较"""
+        if '_' not in asset_id:
+            return prefix_map.get(asset_id.lower())
+        prefix = asset_id.lower() + "_"
+        for entry in entries:
+            if entry.name.lower().startswith(prefix):
+                return entry.name
+        return None
+
+    def _check_asset(self, asset_id, asset_type, abc_cache_path, cache_folder, asset_base_path, asset_folder):
+        """检查单个资产，只列出资产自己的缓存文件夹和LookDev/work目录"""
+        abc_count = 0
+        if cache_folder:
+            entries = self.lister(os.path.join(abc_cache_path, cache_folder)) or []
+            abc_count = sum(1 for entry in entries if entry.name.lower().endswith(".abc"))
+
+        lookdev_path = None
+        if asset_folder:
+            lookdev_dir = os.path.join(asset_base_path, asset_folder, "LookDev", "work")
+            candidates = [entry for entry in self.lister(lookdev_dir) or []
+                          if entry.name.endswith(LOOKDEV_SUFFIX) and entry.name.startswith(asset_folder)]
+            if len(candidates) > 1:
+                # 多个文件时使用最新的文件
+                candidates.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            if candidates:
+                lookdev_path = os.path.join(lookdev_dir, candidates[0].name)
+
+        return {
+            "cache_exists": cache_folder is not None,
+            "abc_count": abc_count,
+            "lookdev_exists": lookdev_path is not None,
+            "lookdev_path": lookdev_path,
+            "type": asset_type
+        }
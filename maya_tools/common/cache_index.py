@@ -0,0 +1,366 @@
+"""
+CFX缓存目录索引
+
+布料和XGen缓存都发布在镜头的 publish 目录（网络盘）下。每次选择资产都 glob 一遍目录、再对每个文件
+getsize/getmtime 会产生大量网络请求；这里用 os.scandir 一次列出目录中的 .abc 文件及其大小和修改时间，
+按目录（即镜头）保存在内存中，并写入本地JSON文件供下次打开Maya时使用。
+
+索引按目录修改时间增量刷新：目录的修改时间不变就复用索引中的文件列表，只有新增、删除或重命名了文件的
+目录才重新扫描。同一目录在 STAT_INTERVAL 秒内的重复查询连目录修改时间也不读取。
+原文件被覆盖时目录修改时间不一定变化，需要时用 refresh=True 强制重新扫描。
+
+查询可以传入 threading.Event 作为取消标记，扫描循环中逐个文件检查，取消时抛出 ScanCancelled，
+不保存扫描了一半的结果；on_record 回调在找到每个文件时调用，用于逐步显示结果。
+
+CacheCatalog 把目录中的文件按去掉版本号后的文件名（即资产+布料名称或XGen描述）分组，组内按版本排序，
+每次扫描后只建立一次，最新版本直接从中读取，不再逐个读取文件的修改时间。
+
+不依赖Maya，可以在Maya外测试。
+"""
+
+import os
+import re
+import json
+import time
+import fnmatch
+import threading
+
+# 索引文件路径可以通过环境变量指定
+INDEX_PATH_ENV = "MAYA_TOOLS_CACHE_INDEX"
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".maya_tools", "cfx_cache_index.json")
+INDEX_VERSION = 1
+# 同一目录两次读取修改时间的最小间隔（秒）
+STAT_INTERVAL = 5.0
+CACHE_EXTENSION = ".abc"
+# 文件名末尾的版本号，写作 _003.abc、_v003.abc 或 .v003.abc，没有版本号的文件按版本1处理
+VERSION_PATTERN = re.compile(r'[_.]v?(\d+)(?=\.abc$)', re.IGNORECASE)
+DEFAULT_VERSION = 1
+
+_cache_index = None
+
+
+class ScanCancelled(Exception):
+    """查询被取消"""
+
+
+def _check_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise ScanCancelled()
+
+
+def normalize_dir(directory):
+    """统一目录路径写法，作为索引的键"""
+    return os.path.normcase(os.path.normpath(directory)).replace("\\", "/")
+
+
+def scan_directory(directory, cancel_event=None, on_record=None):
+    """用 os.scandir 列出目录中的缓存文件
+
+    Args:
+        directory: 目录路径
+        cancel_event: 可选，取消标记，每个文件检查一次
+        on_record: 可选，找到文件时调用，参数为带 "path" 的文件记录
+
+    Returns:
+        list: [{"filename", "size", "mtime"}]，按文件名排序
+
+    Raises:
+        ScanCancelled: 扫描被取消
+    """
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            _check_cancelled(cancel_event)
+            if not entry.name.lower().endswith(CACHE_EXTENSION):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                # 扫描过程中被删除的文件
+                continue
+            record = {"filename": entry.name, "size": stat.st_size, "mtime": stat.st_mtime}
+            files.append(record)
+            if on_record is not None:
+                on_record(dict(record, path=os.path.join(directory, entry.name)))
+    files.sort(key=lambda record: record["filename"])
+    return files
+
+
+def parse_cache_name(filename):
+    """拆分缓存文件名中的分组名称和版本号
+
+    Args:
+        filename: 文件名，如 "Sq04_Sc0110_cloth_C001_v003.abc"
+
+    Returns:
+        tuple: (分组名称, 版本号)，如 ("Sq04_Sc0110_cloth_C001", 3)，没有版本号时版本号为None
+    """
+    match = VERSION_PATTERN.search(filename)
+    if match:
+        return filename[:match.start()], int(match.group(1))
+    return filename.rsplit('.', 1)[0], None
+
+
+class CacheCatalog:
+    """一个缓存目录中按分组排序的各版本文件"""
+
+    def __init__(self, records):
+        """根据文件记录建立目录
+
+        Args:
+            records: 缓存索引的文件记录列表，[{"filename", "path", "size", "mtime"}]
+        """
+        self.records = list(records)
+        # 分组键（小写）到按 (版本号, 修改时间) 升序排列的记录列表
+        self._groups = {}
+        # 文件名到 (分组键, 版本号)
+        self._names = {}
+        for record in self.records:
+            stem, version = parse_cache_name(record["filename"])
+            key = stem.lower()
+            self._names[record["filename"]] = (key, version)
+            self._groups.setdefault(key, []).append(record)
+        for group in self._groups.values():
+            group.sort(key=lambda record: (self._names[record["filename"]][1] or DEFAULT_VERSION, record["mtime"]))
+        self._latest = {key: group[-1]["filename"] for key, group in self._groups.items()}
+
+    def group_key(self, record):
+        """文件所在分组的键"""
+        return self._names[record["filename"]][0]
+
+    def version(self, record):
+        """文件的版本号，没有版本号时为1"""
+        return self._names[record["filename"]][1] or DEFAULT_VERSION
+
+    def versions(self, record):
+        """与文件同组的所有版本，从旧到新排列"""
+        return list(self._groups[self.group_key(record)])
+
+    def is_latest(self, record):
+        """文件是否为所在分组的最新版本"""
+        return self._latest[self.group_key(record)] == record["filename"]
+
+    def latest(self, records=None):
+        """每组的最新版本
+
+        Args:
+            records: 可选，只在这些记录中按组取最新版本，如已按资产筛选的记录
+
+        Returns:
+            list: 最新版本的记录，按文件名排序
+        """
+        if records is None:
+            return sorted((self._groups[key][-1] for key in self._groups), key=lambda record: record["filename"])
+        latest = {}
+        for record in records:
+            key = self.group_key(record)
+            order = (self.version(record), record["mtime"])
+            if key not in latest or order > latest[key][0]:
+                latest[key] = (order, record)
+        return sorted((record for _, record in latest.values()), key=lambda record: record["filename"])
+
+    def version_info(self, record):
+        """文件的版本信息
+
+        Returns:
+            dict: {"version", "is_latest", "version_count"}
+        """
+        key = self.group_key(record)
+        return {
+            "version": self.version(record),
+            "is_latest": self._latest[key] == record["filename"],
+            "version_count": len(self._groups[key]),
+        }
+
+
+class CacheIndex:
+    """按目录保存的缓存文件索引，内存中查询，定期写入JSON文件"""
+
+    def __init__(self, index_path=None, stat_interval=STAT_INTERVAL):
+        """初始化并读取已保存的索引
+
+        Args:
+            index_path: 索引文件路径，为None时不保存到磁盘
+            stat_interval: 同一目录两次读取修改时间的最小间隔（秒）
+        """
+        self.index_path = index_path
+        self.stat_interval = stat_interval
+        # 目录键到 {"dir_mtime", "files"} 的映射
+        self._entries = {}
+        # 目录键到上次读取修改时间的时刻，只在本次会话中有效
+        self._checked = {}
+        # 目录键到 (建立时的索引条目, CacheCatalog)，条目被新的扫描结果替换后重建
+        self._catalogs = {}
+        self._lock = threading.Lock()
+        # 多个搜索线程可能同时保存，临时文件名按进程区分，同一进程内的写入和替换需要依次进行
+        self._save_lock = threading.Lock()
+        self.scan_count = 0
+        self._load()
+
+    def _load(self):
+        if not self.index_path or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"读取缓存索引失败，将重新扫描: {str(e)}")
+            return
+        if data.get("version") == INDEX_VERSION:
+            self._entries = data.get("directories", {})
+
+    def save(self):
+        """把索引写入JSON文件，先写临时文件再替换，避免多个Maya同时写入时损坏"""
+        if not self.index_path:
+            return
+        with self._lock:
+            data = {"version": INDEX_VERSION, "directories": dict(self._entries)}
+        temp_path = f"{self.index_path}.{os.getpid()}.part"
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(temp_path, self.index_path)
+            except OSError as e:
+                print(f"保存缓存索引失败: {str(e)}")
+
+    def get_files(self, directory, refresh=False, cancel_event=None, on_record=None):
+        """获取目录中的缓存文件，目录修改时间未变化时使用索引
+
+        Args:
+            directory: 目录路径
+            refresh: 是否强制重新扫描
+            cancel_event: 可选，取消标记
+            on_record: 可选，逐个文件调用的回调，参数为文件记录
+
+        Returns:
+            list | None: [{"filename", "path", "size", "mtime"}]，目录不存在时返回None
+
+        Raises:
+            ScanCancelled: 查询被取消
+        """
+        _check_cancelled(cancel_event)
+        key = normalize_dir(directory)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if not refresh and entry is not None and now - self._checked.get(key, float("-inf")) < self.stat_interval:
+                return self._records(directory, entry, cancel_event, on_record)
+
+        try:
+            dir_mtime = os.stat(directory).st_mtime
+        except OSError:
+            with self._lock:
+                self._checked.pop(key, None)
+                removed = self._entries.pop(key, None) is not None
+            if removed:
+                self.save()
+            return None
+
+        changed = refresh or entry is None or entry["dir_mtime"] != dir_mtime
+        if changed:
+            try:
+                entry = {"dir_mtime": dir_mtime, "files": scan_directory(directory, cancel_event, on_record)}
+            except OSError as e:
+                print(f"扫描缓存目录失败: {directory}: {str(e)}")
+                return None
+        with self._lock:
+            if changed:
+                self.scan_count += 1
+                self._entries[key] = entry
+            self._checked[key] = now
+        if changed:
+            self.save()
+            # 扫描时已经逐个回调过
+            return self._records(directory, entry)
+        return self._records(directory, entry, cancel_event, on_record)
+
+    @staticmethod
+    def _records(directory, entry, cancel_event=None, on_record=None):
+        records = []
+        for record in entry["files"]:
+            _check_cancelled(cancel_event)
+            record = dict(record, path=os.path.join(directory, record["filename"]))
+            records.append(record)
+            if on_record is not None:
+                on_record(record)
+        return records
+
+    def get_catalog(self, directory, refresh=False, cancel_event=None, on_record=None):
+        """获取目录的版本目录，同一次扫描结果只建立一次
+
+        Args:
+            directory: 目录路径
+            refresh: 是否强制重新扫描
+            cancel_event: 可选，取消标记
+            on_record: 可选，逐个文件调用的回调，参数为文件记录
+
+        Returns:
+            CacheCatalog | None: 目录不存在时返回None
+
+        Raises:
+            ScanCancelled: 查询被取消
+        """
+        records = self.get_files(directory, refresh, cancel_event, on_record)
+        if records is None:
+            return None
+        key = normalize_dir(directory)
+        with self._lock:
+            entry = self._entries.get(key)
+            cached = self._catalogs.get(key)
+            if entry is None:
+                return CacheCatalog(records)
+            if cached is None or cached[0] is not entry:
+                cached = (entry, CacheCatalog(self._records(directory, entry)))
+                self._catalogs[key] = cached
+            return cached[1]
+
+    def find(self, directory, pattern, refresh=False):
+        """按文件名通配符查找缓存文件，忽略大小写（与Windows上的glob一致）
+
+        Args:
+            directory: 目录路径
+            pattern: 文件名通配符，如 "*cloth*c001*.abc"
+            refresh: 是否强制重新扫描
+
+        Returns:
+            list | None: 匹配的文件记录，目录不存在时返回None
+        """
+        files = self.get_files(directory, refresh)
+        if files is None:
+            return None
+        pattern = pattern.lower()
+        return [record for record in files if fnmatch.fnmatchcase(record["filename"].lower(), pattern)]
+
+    def invalidate(self, directory=None):
+        """使目录的索引失效，下次查询时重新扫描
+
+        Args:
+            directory: 目录路径，为None时清空整个索引
+        """
+        with self._lock:
+            if directory is None:
+                self._entries.clear()
+                self._checked.clear()
+                self._catalogs.clear()
+            else:
+                key = normalize_dir(directory)
+                self._entries.pop(key, None)
+                self._checked.pop(key, None)
+                self._catalogs.pop(key, None)
+        self.save()
+
+
+def get_cache_index():
+    """获取会话中共用的缓存索引
+
+    Returns:
+        CacheIndex: 缓存索引
+    """
+    global _cache_index
+    if _cache_index is None:
+        _cache_index = CacheIndex(os.environ.get(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+    return _cache_index
@@ -0,0 +1,39 @@
+"""
+相机名称工具
+
+相机文件和相机节点按 "cam_<场次>_<镜头>_<起始帧>_<结束帧>" 命名，渲染设置工具导入相机时
+和Alembic导出工具解析镜头帧范围时共用这里的解析规则。
+
+不依赖Maya，可以在Maya外测试。
+"""
+
+import os
+
+DEFAULT_CAMERA_PREFIX = "cam_"
+
+
+def parse_camera_frame_range(camera_name, prefix=DEFAULT_CAMERA_PREFIX):
+    """从相机文件名或节点名解析帧范围
+
+    名称以前缀开头时，取下划线分隔的最后两段数字作为起始帧和结束帧，只有一段数字时从第1帧开始。
+
+    Args:
+        camera_name: 相机文件名或节点名，如 cam_Sq04_Sc0110_1001_1104.fbx，可以带路径或命名空间
+        prefix: 相机名称前缀
+
+    Returns:
+        tuple | None: (起始帧, 结束帧)，无法解析时返回None
+    """
+    name = os.path.basename(camera_name.replace('\\', '/')).rsplit(':', 1)[-1].rsplit('|', 1)[-1]
+    if not name.lower().startswith(prefix.lower()):
+        return None
+    frame_numbers = [int(part.split('.')[0]) for part in name.split('_') if part.split('.')[0].isdigit()]
+    if len(frame_numbers) >= 2:
+        start_frame, end_frame = frame_numbers[-2], frame_numbers[-1]
+    elif frame_numbers:
+        start_frame, end_frame = 1, frame_numbers[0]
+    else:
+        return None
+    if start_frame > end_frame:
+        return None
+    return start_frame, end_frame
@@ -140,4 +140,26 @@ class ConfigManager:
         else:
             # 使用当前数据
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(current_data, f, indent=2, ensure_ascii=False) 
\ No newline at end of file
+                json.dump(current_data, f, indent=2, ensure_ascii=False) 
+
+# 共享的配置管理器实例及创建时项目配置和镜头数据文件的修改时间
+_shared_config_manager = None
+_shared_config_mtimes = None
+# 共享实例监视的配置文件，SceneContext 同时读取项目配置和镜头数据
+_WATCHED_CONFIG_FILES = ("project_config.json", "shot_data.json")
+
+
+def get_config_manager():
+    """获取共享的配置管理器，项目配置和镜头数据文件都未修改时不重复读取配置文件
+
+    Returns:
+        ConfigManager: 配置管理器
+    """
+    global _shared_config_manager, _shared_config_mtimes
+    config_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    mtimes = tuple(os.path.getmtime(path) if os.path.exists(path) else None
+                   for path in (os.path.join(config_dir, name) for name in _WATCHED_CONFIG_FILES))
+    if _shared_config_manager is None or mtimes != _shared_config_mtimes:
+        _shared_config_manager = ConfigManager()
+        _shared_config_mtimes = mtimes
+    return _shared_config_manager
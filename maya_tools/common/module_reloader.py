@@ -0,0 +1,250 @@
+"""
+模块热重载
+
+在Maya会话中修改工具代码后，只重载源文件有变化的模块以及依赖它们的模块，其余模块保持不变。
+
+依赖关系用 ast 解析模块源码中的 import 语句得到，只记录包内部的依赖，解析结果按源文件修改时间缓存；
+每次重载只对比已加载模块的源文件修改时间，不遍历包目录也不导入新模块。
+第一次重载时还没有记录修改时间，会重载包中所有已加载的模块。
+
+不依赖Maya，可以在Maya外测试。
+
+用法::
+
+    from maya_tools.common.module_reloader import reload_package
+    reload_package("maya_tools.alembic_exporter")
+"""
+
+import os
+import ast
+import sys
+import time
+import importlib
+
+# 包名到重载器的映射
+_reloaders = {}
+
+
+def _source_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def parse_imports(source, module_name, is_package=False):
+    """解析源码中导入的模块名称
+
+    相对导入会按模块所在的包解析为绝对名称；"from 包 import 名称" 同时记录包和 "包.名称"，
+    由调用方按已加载的模块过滤。
+
+    Args:
+        source: 模块源码
+        module_name: 模块的完整名称
+        is_package: 模块是否为包（__init__.py）
+
+    Returns:
+        set: 导入的模块名称
+    """
+    package = module_name if is_package else module_name.rpartition('.')[0]
+    imports = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split('.')
+                if node.level > 1:
+                    parts = parts[:-(node.level - 1)]
+                base = '.'.join(parts + ([node.module] if node.module else []))
+            else:
+                base = node.module
+            if not base:
+                continue
+            imports.add(base)
+            imports.update(f"{base}.{alias.name}" for alias in node.names if alias.name != '*')
+    return imports
+
+
+class ModuleReloader:
+    """按源文件修改时间增量重载一个包中已加载的模块"""
+
+    def __init__(self, package):
+        """初始化
+
+        Args:
+            package: 包名，如 "maya_tools.alembic_exporter"
+        """
+        self.package = package
+        # 模块名到上次重载时的源文件修改时间
+        self.mtimes = {}
+        # 模块名到 (源文件修改时间, 包内依赖集合) 的解析缓存
+        self._imports = {}
+
+    def loaded_modules(self):
+        """包中已加载且有源文件的模块
+
+        Returns:
+            dict: 模块名到源文件路径的映射
+        """
+        prefix = self.package + '.'
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            if module is None or (name != self.package and not name.startswith(prefix)):
+                continue
+            path = getattr(module, '__file__', None)
+            if path and path.endswith('.py'):
+                modules[name] = path
+        return modules
+
+    def _module_imports(self, name, path, known):
+        """模块在包内的依赖，源文件未修改时使用缓存"""
+        mtime = _source_mtime(path)
+        cached = self._imports.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
+            is_package = os.path.basename(path) == '__init__.py'
+            imports = {dependency for dependency in parse_imports(source, name, is_package)
+                       if dependency in known and dependency != name}
+        except (OSError, SyntaxError, UnicodeDecodeError) as e:
+            print(f"无法分析模块 {name} 的依赖: {str(e)}")
+            imports = set()
+        self._imports[name] = (mtime, imports)
+        return imports
+
+    def dependency_graph(self, modules=None):
+        """包内模块的依赖图
+
+        Args:
+            modules: 可选，loaded_modules() 的结果
+
+        Returns:
+            dict: 模块名到其依赖的模块名集合
+        """
+        modules = modules if modules is not None else self.loaded_modules()
+        return {name: self._module_imports(name, path, modules) for name, path in modules.items()}
+
+    def changed_modules(self, modules=None):
+        """源文件修改时间与上次重载时不同的模块，没有记录的模块视为已修改"""
+        modules = modules if modules is not None else self.loaded_modules()
+        return {name for name, path in modules.items() if self.mtimes.get(name) != _source_mtime(path)}
+
+    @staticmethod
+    def reload_order(graph, targets):
+        """需要重载的模块及其所有依赖者，按依赖在前的顺序排列
+
+        Args:
+            graph: 依赖图
+            targets: 源文件有变化的模块
+
+        Returns:
+            list: 重载顺序
+        """
+        dependents = {name: set() for name in graph}
+        for name, imports in graph.items():
+            for dependency in imports:
+                dependents.setdefault(dependency, set()).add(name)
+
+        affected = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in affected:
+                continue
+            affected.add(name)
+            stack.extend(dependents.get(name, ()))
+
+        order = []
+        visited = set()
+
+        def visit(name):
+            # 循环依赖时先到先重载
+            if name in visited:
+                return
+            visited.add(name)
+            for dependency in sorted(graph.get(name, ())):
+                if dependency in affected:
+                    visit(dependency)
+            order.append(name)
+
+        for name in sorted(affected):
+            visit(name)
+        return order
+
+    def snapshot(self):
+        """记录已加载模块当前的源文件修改时间，作为下次对比的基准"""
+        for name, path in self.loaded_modules().items():
+            self.mtimes[name] = _source_mtime(path)
+
+    def reload(self, force=False):
+        """重载有变化的模块及其依赖者
+
+        Args:
+            force: 是否重载包中所有已加载的模块
+
+        Returns:
+            list: 成功重载的模块名称，按重载顺序排列
+        """
+        start_time = time.perf_counter()
+        modules = self.loaded_modules()
+        graph = self.dependency_graph(modules)
+        targets = set(modules) if force else self.changed_modules(modules)
+        order = self.reload_order(graph, targets)
+
+        reloaded = []
+        failed = set()
+        for name in order:
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            try:
+                importlib.reload(module)
+                reloaded.append(name)
+            except Exception as e:
+                print(f"重载模块 {name} 时出错: {str(e)}")
+                failed.add(name)
+                continue
+            self.mtimes[name] = _source_mtime(modules[name])
+        # 未重载的模块记录当前修改时间，作为下次对比的基准；重载失败的模块下次重试
+        for name, path in modules.items():
+            if name not in failed:
+                self.mtimes.setdefault(name, _source_mtime(path))
+
+        elapsed = time.perf_counter() - start_time
+        if order:
+            print(f"重载了 {len(reloaded)}/{len(order)} 个模块（有变化 {len(targets)} 个），耗时 {elapsed:.3f} 秒")
+            for name in reloaded:
+                print(f"  {name}")
+        else:
+            print(f"{self.package} 没有修改过的模块，耗时 {elapsed:.3f} 秒")
+        return reloaded
+
+
+def get_module_reloader(package):
+    """获取包的重载器，同一个包在会话中共用，保留修改时间和依赖缓存"""
+    if package not in _reloaders:
+        _reloaders[package] = ModuleReloader(package)
+    return _reloaders[package]
+
+
+def reload_package(package, force=False):
+    """重载包中有变化的模块及其依赖者
+
+    包还没有导入时导入并记录修改时间，不需要重载。
+
+    Args:
+        package: 包名
+        force: 是否重载包中所有已加载的模块
+
+    Returns:
+        list: 重载的模块名称
+    """
+    reloader = get_module_reloader(package)
+    if package not in sys.modules:
+        importlib.import_module(package)
+        reloader.snapshot()
+        return []
+    return reloader.reload(force)
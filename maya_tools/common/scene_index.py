@@ -0,0 +1,208 @@
+"""
+场景资产索引
+
+用一次 ls 查询列出场景中所有 "*:Geometry" 组，从其长路径中直接取出父节点名称，一次遍历建立
+资产ID到几何体组的映射，取代对每个transform执行正则并逐个 ls 的做法。角色、道具和毛发生长面查询共用同一个索引。
+
+索引通过代数计数失效：场景打开/新建/导入、引用变化、DAG层级变化以及节点重命名时计数加一，下次查询时重建索引。
+"""
+
+import re
+
+try:
+    import maya.cmds as mc
+    import maya.api.OpenMaya as om
+except ImportError:
+    # 允许在Maya外用合成数据运行基准测试
+    mc = None
+    om = None
+
+# 毛发生长面组名称（不含命名空间），忽略大小写，兼容 Fur_Grp、FUR_GRP、fur_xxx_grp 等写法
+FUR_GROUP_PATTERN = re.compile(r'fur.*grp', re.IGNORECASE)
+# 从毛发生长面组名称（含命名空间）中提取角色ID
+FUR_ASSET_ID_PATTERN = re.compile(r'c(\d{3})', re.IGNORECASE)
+
+# 场景代数，每次场景变化时加一
+_generation = 0
+_callback_ids = []
+_scene_index = None
+
+
+def invalidate_scene_index(*args):
+    """使场景索引失效，可直接作为Maya消息回调使用"""
+    global _generation
+    _generation += 1
+
+
+def get_scene_generation():
+    """获取当前场景代数
+
+    Returns:
+        int: 场景代数
+    """
+    return _generation
+
+
+def _register_callbacks():
+    """注册场景变化回调，只注册一次"""
+    if _callback_ids or om is None:
+        return
+
+    try:
+        scene_messages = [
+            om.MSceneMessage.kAfterOpen,
+            om.MSceneMessage.kAfterNew,
+            om.MSceneMessage.kAfterImport,
+            om.MSceneMessage.kAfterCreateReference,
+            om.MSceneMessage.kAfterLoadReference,
+            om.MSceneMessage.kAfterUnloadReference,
+            om.MSceneMessage.kAfterRemoveReference,
+        ]
+        for message in scene_messages:
+            _callback_ids.append(om.MSceneMessage.addCallback(message, invalidate_scene_index))
+        # 层级变化（重新父子化、创建或删除DAG节点）也会影响索引
+        _callback_ids.append(om.MDagMessage.addAllDagChangesCallback(invalidate_scene_index))
+        # 重命名几何体组或其父节点后，索引中的长路径不再存在；空对象表示监听所有节点
+        _callback_ids.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, invalidate_scene_index))
+    except Exception as e:
+        print(f"注册场景索引回调失败，每次查询都将重建索引: {str(e)}")
+        remove_callbacks()
+
+
+def remove_callbacks():
+    """移除已注册的场景变化回调"""
+    while _callback_ids:
+        callback_id = _callback_ids.pop()
+        try:
+            om.MMessage.removeCallback(callback_id)
+        except Exception:
+            pass
+
+
+def resolve_fur_groups(transform_paths):
+    """从transform长路径列表中找出毛发生长面组，并按角色ID分组
+
+    Args:
+        transform_paths: transform节点长路径列表
+
+    Returns:
+        dict: 角色ID（如 "c001"）到毛发生长面组列表的映射，无法识别ID的放在 "unknown" 中
+    """
+    fur_groups = {}
+    for node in transform_paths:
+        short_name = node.rsplit('|', 1)[-1]
+        if not FUR_GROUP_PATTERN.search(short_name.rsplit(':', 1)[-1]):
+            continue
+        # 名称包含命名空间，角色ID可能在命名空间或节点名中
+        match = FUR_ASSET_ID_PATTERN.search(short_name)
+        asset_id = f"c{match.group(1)}" if match else "unknown"
+        groups = fur_groups.setdefault(asset_id, [])
+        if node not in groups:
+            groups.append(node)
+    return fur_groups
+
+
+class SceneIndex:
+    """场景中所有Geometry组及其父节点的索引"""
+
+    def __init__(self, geometry_paths, generation=None, transform_lister=None):
+        """根据Geometry组的长路径建立索引
+
+        Args:
+            geometry_paths: Geometry组的长路径列表，如 ["|c001_rig|c001:Geometry"]
+            generation: 建立索引时的场景代数
+            transform_lister: 返回所有transform长路径的函数，毛发生长面查询首次使用时调用一次
+        """
+        self.generation = generation
+        self._transform_lister = transform_lister
+        self._fur_groups = None
+        self.geometry_paths = list(geometry_paths)
+        # (父节点短名称小写, Geometry组长路径)，顶层的Geometry组没有父节点，不参与匹配
+        self._parents = []
+        for geo_path in self.geometry_paths:
+            parts = geo_path.split('|')
+            if len(parts) < 3:
+                continue
+            self._parents.append((parts[-2].lower(), geo_path))
+        self._prefix_cache = {}
+
+    def geometry_by_prefix(self, pattern_prefix):
+        """按资产前缀查找几何体组，父节点短名称中包含 前缀+数字 即视为该资产
+
+        Args:
+            pattern_prefix: 资产前缀，如 "c" 表示角色，"p" 表示道具
+
+        Returns:
+            dict: 资产ID（如 "C001"）到几何体组列表的映射
+        """
+        key = pattern_prefix.lower()
+        if key not in self._prefix_cache:
+            pattern = re.compile(rf"{re.escape(key)}(\d+)")
+            self._prefix_cache[key] = self.group_geometry(
+                lambda parent_name: self._match_prefix(pattern, parent_name, pattern_prefix.upper())
+            )
+        return {asset_id: list(groups) for asset_id, groups in self._prefix_cache[key].items()}
+
+    @staticmethod
+    def _match_prefix(pattern, parent_name, id_prefix):
+        match = pattern.search(parent_name)
+        return f"{id_prefix}{match.group(1)}" if match else None
+
+    def fur_groups(self):
+        """查找毛发生长面组，结果在索引有效期内缓存
+
+        Returns:
+            dict: 角色ID到毛发生长面组列表的映射
+        """
+        if self._fur_groups is None:
+            transforms = self._transform_lister() if self._transform_lister else []
+            self._fur_groups = resolve_fur_groups(transforms)
+        return {asset_id: list(groups) for asset_id, groups in self._fur_groups.items()}
+
+    def group_geometry(self, asset_id_from_parent):
+        """用自定义规则把几何体组按资产ID分组
+
+        Args:
+            asset_id_from_parent: 接收父节点短名称（小写），返回资产ID或None的函数
+
+        Returns:
+            dict: 资产ID到几何体组列表的映射
+        """
+        asset_meshes = {}
+        for parent_name, geo_path in self._parents:
+            asset_id = asset_id_from_parent(parent_name)
+            if not asset_id:
+                continue
+            groups = asset_meshes.setdefault(asset_id, [])
+            if geo_path not in groups:
+                groups.append(geo_path)
+        return asset_meshes
+
+
+def _list_geometry_groups():
+    """一次查询列出场景中所有带命名空间的Geometry组"""
+    return mc.ls("*:Geometry", long=True) or []
+
+
+def _list_transforms():
+    """一次查询列出场景中所有命名空间下的transform"""
+    return mc.ls(type="transform", long=True) or []
+
+
+def get_scene_index(refresh=False):
+    """获取当前场景的资产索引，场景未变化时复用已有索引
+
+    Args:
+        refresh: 是否强制重建索引
+
+    Returns:
+        SceneIndex: 场景索引
+    """
+    global _scene_index
+    _register_callbacks()
+
+    # 回调注册失败时无法感知场景变化，每次都重建
+    is_stale = not _callback_ids or _scene_index is None or _scene_index.generation != _generation
+    if refresh or is_stale:
+        _scene_index = SceneIndex(_list_geometry_groups(), _generation, _list_transforms)
+    return _scene_index
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+镜头资产状态检查基准测试
+
+在临时目录中生成合成的项目结构（镜头 abc_cache、Asset/Chars、Asset/Props 及每个资产的 LookDev/work），
+对比两种检查方式：
+- 旧方式：每个资产调用一次 check_asset，重新列出 abc_cache 和整个 Asset/<类型> 目录，再列出 LookDev/work，
+  UI 还要为每个资产再列两次目录统计ABC文件数量
+- 批量：AssetStatusChecker 对 abc_cache 和 Asset/<类型> 各列出一次，每个资产的目录在线程池中并行列出
+
+每次文件系统访问（列目录、exists、isdir、getmtime）都加上固定延迟，模拟网络盘的往返开销。不需要Maya，直接运行：
+    python maya_tools/common/test/bench_asset_status.py --assets 20 --library 300 --latency-ms 5
+"""
+import sys
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from asset_status import AssetStatusChecker, list_entries
+
+EPISODE, SEQUENCE, SHOT = "PV", "Sq04", "Sc0110"
+
+
+class NetworkFS:
+    """给文件系统访问加上固定延迟并计数"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def _round_trip(self):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def listdir(self, path):
+        self._round_trip()
+        return os.listdir(path)
+
+    def exists(self, path):
+        self._round_trip()
+        return os.path.exists(path)
+
+    def isdir(self, path):
+        self._round_trip()
+        return os.path.isdir(path)
+
+    def getmtime(self, path):
+        self._round_trip()
+        return os.path.getmtime(path)
+
+    def list_entries(self, path):
+        self._round_trip()
+        return list_entries(path)
+
+
+def build_project(root, asset_count, library_size, versions):
+    """生成合成项目
+
+    Args:
+        root: 临时目录
+        asset_count: 镜头中的资产数量，角色和道具各一半
+        library_size: 每种资产类型目录中的资产文件夹数量
+        versions: 每个资产的LookDev文件数量
+
+    Returns:
+        tuple: (anm_path, project_root, {"Chars": [...], "Props": [...]})
+    """
+    anm_path = os.path.join(root, "Shot", "Animation")
+    abc_cache = os.path.join(anm_path, EPISODE, SEQUENCE, SHOT, "work", "abc_cache")
+    os.makedirs(abc_cache)
+    shot_assets = {"Chars": [], "Props": []}
+    for asset_type, prefix in (("Chars", "C"), ("Props", "P")):
+        for index in range(1, library_size + 1):
+            asset_id = f"{prefix}{index:03d}"
+            folder = f"{asset_id}_Asset{index}"
+            lookdev_dir = os.path.join(root, "Asset", asset_type, folder, "LookDev", "work")
+            os.makedirs(lookdev_dir)
+            # 库中的资产只有部分在镜头中
+            if len(shot_assets[asset_type]) < asset_count // 2 and index % 3 == 0:
+                shot_assets[asset_type].append(asset_id)
+                for version in range(1, versions + 1):
+                    with open(os.path.join(lookdev_dir, f"{folder}_v{version:03d}_lookdev.ma"), 'w') as f:
+                        f.write("//Maya ASCII")
+                os.makedirs(os.path.join(abc_cache, asset_id.lower()))
+                for part in range(3):
+                    open(os.path.join(abc_cache, asset_id.lower(), f"{asset_id}_part{part}.abc"), 'w').close()
+    return anm_path, root + os.sep, shot_assets
+
+
+def check_assets_legacy(fs, anm_path, project_root, assets):
+    """旧的 check_all_assets + _get_asset_abc_count 实现"""
+    status = {}
+    for asset_type, asset_ids in assets.items():
+        for asset_id in asset_ids:
+            shot_path = os.path.join(anm_path, EPISODE, SEQUENCE, SHOT, "work")
+            if not fs.exists(shot_path):
+                raise ValueError(f"路径不存在: {shot_path}")
+            abc_cache_path = os.path.join(shot_path, "abc_cache")
+            if not fs.exists(abc_cache_path) or not fs.isdir(abc_cache_path):
+                raise ValueError(f"未找到abc_cache文件夹: {abc_cache_path}")
+            cache_folders = [f.lower() for f in fs.listdir(abc_cache_path)
+                             if fs.isdir(os.path.join(abc_cache_path, f))]
+
+            # PathChecker._check_lookdev_file
+            lookdev_path = None
+            asset_base_path = os.path.join(project_root, "Asset", asset_type)
+            asset_name = None
+            if fs.exists(asset_base_path):
+                for folder in fs.listdir(asset_base_path):
+                    if folder.lower().startswith(asset_id.lower() + "_"):
+                        asset_name = folder
+                        break
+            if asset_name:
+                lookdev_dir = os.path.join(asset_base_path, asset_name, "LookDev", "work")
+                if fs.exists(lookdev_dir):
+                    files = [f for f in fs.listdir(lookdev_dir) if f.endswith("_lookdev.ma") and f.startswith(asset_name)]
+                    if len(files) > 1:
+                        files.sort(key=lambda x: fs.getmtime(os.path.join(lookdev_dir, x)), reverse=True)
+                    if files:
+                        lookdev_path = os.path.join(lookdev_dir, files[0])
+
+            # ShotAssetManager._get_asset_abc_count
+            abc_count = 0
+            if fs.exists(abc_cache_path):
+                for folder in fs.listdir(abc_cache_path):
+                    if folder.lower() == asset_id.lower():
+                        abc_count = len([f for f in fs.listdir(os.path.join(abc_cache_path, folder))
+                                         if f.lower().endswith(".abc")])
+                        break
+
+            status[asset_id] = {
+                "cache_exists": asset_id.lower() in cache_folders,
+                "abc_count": abc_count,
+                "lookdev_exists": lookdev_path is not None,
+                "lookdev_path": lookdev_path,
+                "type": asset_type
+            }
+    return status
+
+
+def run_benchmark(asset_count, library_size, versions, latency, workers):
+    root = tempfile.mkdtemp()
+    try:
+        anm_path, project_root, assets = build_project(root, asset_count, library_size, versions)
+
+        fs = NetworkFS(latency)
+        start = time.perf_counter()
+        legacy = check_assets_legacy(fs, anm_path, project_root, assets)
+        legacy_time = time.perf_counter() - start
+        legacy_calls = fs.calls
+
+        fs = NetworkFS(latency)
+        checker = AssetStatusChecker(anm_path, project_root, lister=fs.list_entries, max_workers=workers)
+        start = time.perf_counter()
+        batched = checker.check_shot(EPISODE, SEQUENCE, SHOT, assets)
+        batched_time = time.perf_counter() - start
+        batched_calls = fs.calls
+
+    finally:
+        shutil.rmtree(root)
+
+    if legacy != batched:
+        raise AssertionError("批量检查结果与旧方式不一致")
+
+    print(f"镜头资产: {sum(len(ids) for ids in assets.values())}，每类资产库: {library_size}，"
+          f"模拟访问延迟: {latency * 1000:.1f} 毫秒")
+    print(f"旧方式: {legacy_time * 1000:.1f} 毫秒，文件系统访问 {legacy_calls} 次")
+    print(f"批量:   {batched_time * 1000:.1f} 毫秒，文件系统访问 {batched_calls} 次（{workers} 线程）")
+    print(f"加速比: {legacy_time / batched_time:.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="镜头资产状态检查基准测试")
+    parser.add_argument("--assets", type=int, default=20, help="镜头中的资产数量")
+    parser.add_argument("--library", type=int, default=300, help="每种资产类型目录中的资产文件夹数量")
+    parser.add_argument("--versions", type=int, default=5, help="每个资产的LookDev文件数量")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="每次模拟文件系统访问的延迟（毫秒）")
+    parser.add_argument("--workers", type=int, default=8, help="批量检查的线程数")
+    args = parser.parse_args()
+    run_benchmark(args.assets, args.library, args.versions, args.latency_ms / 1000.0, args.workers)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+场景资产索引基准测试
+
+用合成的10万节点场景列表对比两种查找方式：
+- 旧方式：列出所有transform，对每个节点执行正则，匹配的节点再单独执行一次 ls("node|*:Geometry")
+- 新方式：一次 ls("*:Geometry")，从长路径中取父节点建立索引
+
+Maya命令用带固定延迟的模拟函数代替，延迟可以通过参数调整。不需要Maya，直接运行：
+    python maya_tools/common/test/bench_scene_index.py --nodes 100000 --latency-us 50
+"""
+import sys
+import os
+import re
+import time
+import argparse
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scene_index import SceneIndex
+
+
+class FakeScene:
+    """合成场景：若干角色和道具的绑定层级，加上大量无关的布景transform"""
+
+    def __init__(self, node_count, char_count=12, prop_count=30, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.transforms = []
+        self.geometry_children = {}
+
+        for index in range(1, char_count + 1):
+            self._add_asset(f"c{index:03d}_rig", f"c{index:03d}")
+        for index in range(1, prop_count + 1):
+            self._add_asset(f"p{index:03d}_rig", f"p{index:03d}")
+
+        # 其余为布景节点，名称中不含资产前缀+数字
+        filler = 0
+        while len(self.transforms) < node_count:
+            self.transforms.append(f"|set_grp|layout_{filler // 100}|tree_{filler}")
+            filler += 1
+
+    def _add_asset(self, rig_name, namespace):
+        rig_path = f"|{rig_name}"
+        geo_path = f"{rig_path}|{namespace}:Geometry"
+        self.transforms.append(rig_path)
+        self.transforms.append(geo_path)
+        for part in range(20):
+            self.transforms.append(f"{geo_path}|{namespace}:part_{part}_geo")
+        self.geometry_children[rig_path] = [geo_path]
+
+    def ls(self, pattern=None, type=None, long=True):
+        """模拟 maya.cmds.ls，每次调用都有固定的往返开销"""
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if pattern is None and type == "transform":
+            return list(self.transforms)
+        if pattern == "*:Geometry":
+            return [path for children in self.geometry_children.values() for path in children]
+        if pattern.endswith("|*:Geometry"):
+            return list(self.geometry_children.get(pattern[:-len("|*:Geometry")], []))
+        return []
+
+
+def find_geometry_legacy(scene, pattern_prefix):
+    """旧的 find_geometry_by_pattern 实现"""
+    asset_meshes = {}
+    all_transforms = scene.ls(type="transform", long=True)
+    pattern = rf"{pattern_prefix.lower()}(\d+)"
+    for node in all_transforms:
+        short_name = node.split('|')[-1].lower()
+        match = re.search(pattern, short_name)
+        if match:
+            asset_id = f"{pattern_prefix.upper()}{match.group(1)}"
+            geometry_groups = scene.ls(f"{node}|*:Geometry", long=True)
+            if geometry_groups:
+                if asset_id not in asset_meshes:
+                    asset_meshes[asset_id] = []
+                for geo_group in geometry_groups:
+                    if geo_group not in asset_meshes[asset_id]:
+                        asset_meshes[asset_id].append(geo_group)
+    return asset_meshes
+
+
+def find_geometry_indexed(scene, prefixes):
+    """新方式：一次查询建立索引，所有前缀共用"""
+    index = SceneIndex(scene.ls("*:Geometry", long=True))
+    return {prefix: index.geometry_by_prefix(prefix) for prefix in prefixes}
+
+
+def run_benchmark(node_count, latency):
+    """运行基准测试并打印结果"""
+    prefixes = ("c", "p")
+
+    scene = FakeScene(node_count, latency=latency)
+    start = time.perf_counter()
+    legacy = {prefix: find_geometry_legacy(scene, prefix) for prefix in prefixes}
+    legacy_time = time.perf_counter() - start
+    legacy_calls = scene.calls
+
+    scene.calls = 0
+    start = time.perf_counter()
+    indexed = find_geometry_indexed(scene, prefixes)
+    indexed_time = time.perf_counter() - start
+    indexed_calls = scene.calls
+
+    if legacy != indexed:
+        raise AssertionError("索引结果与旧实现不一致")
+
+    print(f"节点数: {len(scene.transforms)}，模拟命令延迟: {latency * 1e6:.0f} 微秒")
+    print(f"旧方式: {legacy_time * 1000:.1f} 毫秒，ls 调用 {legacy_calls} 次")
+    print(f"索引:   {indexed_time * 1000:.1f} 毫秒，ls 调用 {indexed_calls} 次")
+    print(f"加速比: {legacy_time / indexed_time:.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="场景资产索引基准测试")
+    parser.add_argument("--nodes", type=int, default=100000, help="合成场景的transform数量")
+    parser.add_argument("--latency-us", type=float, default=50.0, help="每次模拟ls调用的延迟（微秒）")
+    args = parser.parse_args()
+    run_benchmark(args.nodes, args.latency_us / 1e6)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+镜头资产状态批量检查单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from asset_status import AssetStatusChecker, build_prefix_map, list_entries
+
+
+class TestAssetStatusChecker(unittest.TestCase):
+    """测试每个目录只列出一次以及检查结果"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.anm_path = os.path.join(self.root, "Shot", "Animation")
+        self.abc_cache = os.path.join(self.anm_path, "PV", "Sq04", "Sc0110", "work", "abc_cache")
+        os.makedirs(os.path.join(self.abc_cache, "c001"))
+        open(os.path.join(self.abc_cache, "c001", "C001_body.abc"), 'w').close()
+        lookdev_dir = os.path.join(self.root, "Asset", "Chars", "C001_Hero", "LookDev", "work")
+        os.makedirs(lookdev_dir)
+        open(os.path.join(lookdev_dir, "C001_Hero_lookdev.ma"), 'w').close()
+        os.makedirs(os.path.join(self.root, "Asset", "Chars", "C002_Villain"))
+        os.makedirs(os.path.join(self.root, "Asset", "Props"))
+        self.listed = []
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _lister(self, path):
+        self.listed.append(os.path.relpath(path, self.root))
+        return list_entries(path)
+
+    def test_check_shot(self):
+        checker = AssetStatusChecker(self.anm_path, self.root, lister=self._lister, max_workers=4)
+        status = checker.check_shot("PV", "Sq04", "Sc0110", {"Chars": ["C001", "C002"], "Props": ["P001"]})
+
+        self.assertEqual(status["C001"]["abc_count"], 1)
+        self.assertTrue(status["C001"]["cache_exists"])
+        self.assertEqual(os.path.basename(status["C001"]["lookdev_path"]), "C001_Hero_lookdev.ma")
+        self.assertFalse(status["C002"]["lookdev_exists"])
+        self.assertFalse(status["C002"]["cache_exists"])
+        self.assertEqual(status["P001"], {"cache_exists": False, "abc_count": 0, "lookdev_exists": False,
+                                          "lookdev_path": None, "type": "Props"})
+        # 共享的目录各只列出一次
+        self.assertEqual(len(self.listed), len(set(self.listed)))
+        self.assertEqual(self.listed.count(os.path.join("Asset", "Chars")), 1)
+
+    def test_missing_abc_cache(self):
+        shutil.rmtree(self.abc_cache)
+        checker = AssetStatusChecker(self.anm_path, self.root, max_workers=1)
+        with self.assertRaises(ValueError):
+            checker.check_shot("PV", "Sq04", "Sc0110", {"Chars": ["C001"]})
+        with self.assertRaises(ValueError):
+            checker.check_shot("PV", "Sq04", "Sc0120", {"Chars": ["C001"]})
+
+    def test_prefix_map_keeps_first_folder(self):
+        self.assertEqual(build_prefix_map(["C001_Hero", "c001_Old", "readme"]), {"c001": "C001_Hero"})
+
+
+if __name__ == '__main__':
+    unittest.main()
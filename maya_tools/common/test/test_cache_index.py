@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+CFX缓存目录索引单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from io import StringIO
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cache_index import CacheCatalog, CacheIndex, ScanCancelled, parse_cache_name
+
+
+class TestCacheIndex(unittest.TestCase):
+    """测试目录扫描、增量刷新和索引持久化"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.publish_dir = os.path.join(self.temp_dir, "Sq04", "Sc0110", "publish")
+        os.makedirs(self.publish_dir)
+        for filename in ("Sq04_Sc0110_cloth_C001_v001.abc", "Sq04_Sc0110_c001_DES_hair_v002.abc", "notes.txt"):
+            self._write(filename)
+        self.index_path = os.path.join(self.temp_dir, "index", "cfx_cache_index.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, filename):
+        path = os.path.join(self.publish_dir, filename)
+        with open(path, 'w') as f:
+            f.write("abc")
+        return path
+
+    def _touch_dir(self, offset):
+        stat = os.stat(self.publish_dir)
+        os.utime(self.publish_dir, (stat.st_atime, stat.st_mtime + offset))
+
+    def test_find_ignores_case_and_other_files(self):
+        index = CacheIndex()
+        cloth = index.find(self.publish_dir, "*cloth*c001*.abc")
+        self.assertEqual([record["filename"] for record in cloth], ["Sq04_Sc0110_cloth_C001_v001.abc"])
+        self.assertEqual(cloth[0]["size"], 3)
+        self.assertEqual(cloth[0]["path"], os.path.join(self.publish_dir, "Sq04_Sc0110_cloth_C001_v001.abc"))
+        self.assertEqual(len(index.find(self.publish_dir, "*c001*.abc")), 2)
+        self.assertIsNone(index.find(os.path.join(self.temp_dir, "missing"), "*.abc"))
+        self.assertEqual(index.scan_count, 1)
+
+    def test_rescans_only_when_directory_changes(self):
+        index = CacheIndex(stat_interval=0)
+        index.get_files(self.publish_dir)
+        index.get_files(self.publish_dir)
+        self.assertEqual(index.scan_count, 1)
+
+        self._write("Sq04_Sc0110_cloth_C001_v002.abc")
+        self._touch_dir(10)
+        self.assertEqual(len(index.find(self.publish_dir, "*cloth*")), 2)
+        self.assertEqual(index.scan_count, 2)
+
+        index.get_files(self.publish_dir, refresh=True)
+        self.assertEqual(index.scan_count, 3)
+
+    def test_stat_interval_skips_directory_check(self):
+        index = CacheIndex(stat_interval=60)
+        index.get_files(self.publish_dir)
+        self._write("Sq04_Sc0110_cloth_C001_v002.abc")
+        self._touch_dir(10)
+        self.assertEqual(len(index.get_files(self.publish_dir)), 2)
+        index.invalidate(self.publish_dir)
+        self.assertEqual(len(index.get_files(self.publish_dir)), 3)
+
+    def test_records_stream_and_scan_can_be_cancelled(self):
+        index = CacheIndex(stat_interval=0)
+        cancel_event = threading.Event()
+        found = []
+
+        def on_record(record):
+            found.append(record["filename"])
+            cancel_event.set()
+
+        with self.assertRaises(ScanCancelled):
+            index.get_files(self.publish_dir, cancel_event=cancel_event, on_record=on_record)
+        self.assertEqual(len(found), 1)
+        # 取消的扫描不保存到索引
+        self.assertEqual(index.scan_count, 0)
+
+        streamed = []
+        records = index.get_files(self.publish_dir, on_record=lambda record: streamed.append(record["path"]))
+        self.assertEqual(sorted(streamed), sorted(record["path"] for record in records))
+        # 索引命中时同样逐个回调
+        streamed = []
+        index.get_files(self.publish_dir, on_record=lambda record: streamed.append(record["path"]))
+        self.assertEqual(len(streamed), 2)
+        self.assertEqual(index.scan_count, 1)
+
+    def test_catalog_groups_versions(self):
+        self.assertEqual(parse_cache_name("Sq04_Sc0110_cloth_C001_v012.abc"), ("Sq04_Sc0110_cloth_C001", 12))
+        self.assertEqual(parse_cache_name("Sq04_Sc0110_C001_DES_hair_3.abc"), ("Sq04_Sc0110_C001_DES_hair", 3))
+        self.assertEqual(parse_cache_name("C001_cloth.abc"), ("C001_cloth", None))
+
+        records = [{"filename": name, "mtime": mtime} for name, mtime in (
+            ("Sq04_Sc0110_cloth_C001_v002.abc", 20),
+            ("Sq04_Sc0110_cloth_C001_v010.abc", 5),
+            ("Sq04_Sc0110_cloth_c001_v001.abc", 30),
+            ("Sq04_Sc0110_C001_DES_hair_v001.abc", 1),
+        )]
+        catalog = CacheCatalog(records)
+        latest = [record["filename"] for record in catalog.latest()]
+        self.assertEqual(latest, ["Sq04_Sc0110_C001_DES_hair_v001.abc", "Sq04_Sc0110_cloth_C001_v010.abc"])
+        self.assertEqual([catalog.version(record) for record in catalog.versions(records[0])], [1, 2, 10])
+        self.assertEqual(catalog.version_info(records[0]), {"version": 2, "is_latest": False, "version_count": 3})
+        # 只在给定的记录中取最新版本
+        self.assertEqual(catalog.latest(records[:1] + records[2:3]), records[:1])
+
+    def test_catalog_is_built_once_per_scan(self):
+        index = CacheIndex(stat_interval=0)
+        catalog = index.get_catalog(self.publish_dir)
+        self.assertIs(index.get_catalog(self.publish_dir), catalog)
+        self.assertEqual(len(catalog.records), 2)
+
+        self._write("Sq04_Sc0110_cloth_C001_v002.abc")
+        self._touch_dir(10)
+        catalog = index.get_catalog(self.publish_dir)
+        self.assertEqual([record["filename"] for record in catalog.latest()],
+                         ["Sq04_Sc0110_c001_DES_hair_v002.abc", "Sq04_Sc0110_cloth_C001_v002.abc"])
+
+    def test_index_is_persisted(self):
+        index = CacheIndex(self.index_path)
+        index.get_files(self.publish_dir)
+        self.assertTrue(os.path.exists(self.index_path))
+
+        reopened = CacheIndex(self.index_path)
+        self.assertEqual(len(reopened.get_files(self.publish_dir)), 2)
+        self.assertEqual(reopened.scan_count, 0)
+
+    def test_concurrent_saves(self):
+        index = CacheIndex(self.index_path)
+        index.get_files(self.publish_dir)
+        output = StringIO()
+        with redirect_stdout(output):
+            threads = [threading.Thread(target=lambda: [index.save() for _ in range(20)]) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertNotIn("保存缓存索引失败", output.getvalue())
+        self.assertEqual(os.listdir(os.path.dirname(self.index_path)), ["cfx_cache_index.json"])
+        self.assertEqual(len(CacheIndex(self.index_path).get_files(self.publish_dir)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+模块热重载单元测试
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# 添加父目录到路径，以便导入模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from module_reloader import ModuleReloader, parse_imports
+
+PACKAGE_FILES = {
+    "__init__.py": "from .b import value\n",
+    "a.py": "A = 1\n",
+    "b.py": "from . import a\nvalue = a.A\n",
+    "c.py": "import reload_pkg.a as alias\nC = 3\n",
+    "d.py": "D = 4\n",
+}
+
+
+class TestModuleReloader(unittest.TestCase):
+    """测试只重载修改过的模块及其依赖者"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.package_dir = os.path.join(self.temp_dir, "reload_pkg")
+        os.makedirs(self.package_dir)
+        for file_name, source in PACKAGE_FILES.items():
+            self._write(file_name, source)
+        sys.path.insert(0, self.temp_dir)
+        import reload_pkg.c
+        import reload_pkg.d
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir)
+        for name in [name for name in sys.modules if name.split('.')[0] == "reload_pkg"]:
+            del sys.modules[name]
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, file_name, source, mtime_offset=0):
+        path = os.path.join(self.package_dir, file_name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        if mtime_offset:
+            mtime = os.path.getmtime(path) + mtime_offset
+            os.utime(path, (mtime, mtime))
+
+    def test_parse_relative_imports(self):
+        self.assertEqual(parse_imports("from .b import value\nfrom .. import x\n", "pkg.sub", is_package=True),
+                         {"pkg.sub.b", "pkg.sub.b.value", "pkg", "pkg.x"})
+
+    def test_reloads_changed_module_and_dependents(self):
+        reloader = ModuleReloader("reload_pkg")
+        reloader.snapshot()
+        self.assertEqual(reloader.reload(), [])
+
+        self._write("a.py", "A = 2\n", mtime_offset=10)
+        reloaded = reloader.reload()
+        self.assertEqual(set(reloaded), {"reload_pkg", "reload_pkg.a", "reload_pkg.b", "reload_pkg.c"})
+        self.assertLess(reloaded.index("reload_pkg.a"), reloaded.index("reload_pkg.b"))
+        self.assertLess(reloaded.index("reload_pkg.b"), reloaded.index("reload_pkg"))
+        self.assertEqual(sys.modules["reload_pkg"].value, 2)
+        self.assertEqual(reloader.reload(), [])
+
+    def test_first_reload_reloads_everything(self):
+        reloader = ModuleReloader("reload_pkg")
+        self.assertEqual(len(reloader.reload()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()